@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import itertools
 import json
+import re
+import time
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Iterable
 
 import voluptuous as vol
 from homeassistant.components.calendar import CalendarEntityFeature, CalendarEvent
@@ -14,16 +19,43 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .calendar_sync import (
+    SERIES_TAG,
+    CalendarSyncLedger,
+    CalendarWriteScheduler,
+    DesiredEvent,
+    LedgerEntry,
+    SyncDelta,
+    SyncJob,
+    SyncMetrics,
+    SyncPlan,
+    WriteOperation,
+    WriteReport,
+    async_release_calendar_entity_resolver,
+    calendar_entity_resolver,
+    calendar_sync_hub,
+    calendar_sync_metrics,
+    content_digest,
+    ledger_key,
+    plan_delta,
+    split_pattern_series,
+    write_budget,
+)
 from .const import (
+    CALENDAR_READ_CHUNK,
+    CALENDAR_SYNC_DEBOUNCE,
+    CALENDAR_SYNC_PLAN_MAX_OPERATIONS,
     CONF_CALENDAR_SYNC,
     CONF_CALENDAR_SYNC_DAYS,
     CONF_CALENDAR_SYNC_INTERVAL_HOURS,
+    CONF_CALENDAR_SYNC_RRULE,
     CONF_CALENDAR_TARGET,
     CONF_CHILD_NAME,
     CONF_CHILD_NAME_DISPLAY,
@@ -43,6 +75,7 @@ from .const import (
     SERVICE_EXPORT_EXCEPTIONS,
     SERVICE_IMPORT_EXCEPTIONS,
     SERVICE_OVERRIDE_PRESENCE,
+    SERVICE_PLAN_CALENDAR_SYNC,
     SERVICE_PURGE_CALENDAR,
     SERVICE_REFRESH_SCHEDULE,
     SERVICE_SET_MANUAL_DATES,
@@ -50,9 +83,14 @@ from .const import (
     UPDATE_INTERVAL,
 )
 from .intent import async_setup_intents
-from .schedule import CustodyComputation, CustodyScheduleManager
+from .schedule import CustodyComputation, CustodyScheduleManager, CustodyWindow
 from .school_holidays import SchoolHolidayClient
 
+try:
+    from homeassistant.core import SupportsResponse
+except ImportError:  # Home Assistant < 2023.7: plans are only logged and kept in hass.data
+    SupportsResponse = None
+
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
@@ -89,6 +127,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = CustodyScheduleCoordinator(hass, manager, entry)
 
     await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(coordinator.async_cancel_transition)
+    entry.async_on_unload(coordinator.async_cancel_calendar_sync)
+    entry.async_on_unload(holidays.async_add_listener(coordinator.async_handle_holiday_refresh))
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -106,6 +147,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        _async_release_unused_resolver(hass)
     return unload_ok
 
 
@@ -114,9 +156,9 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     config = {**entry.data, **(entry.options or {})}
     child_label = config.get(CONF_CHILD_NAME_DISPLAY, config.get(CONF_CHILD_NAME, ""))
     match_text = child_label or ""
-    # Purge in the background to return quickly to the UI
-    hass.async_create_task(
-        _async_purge_calendar_events(
+
+    async def _async_purge_removed_entry() -> None:
+        await _async_purge_calendar_events(
             hass,
             entry.entry_id,
             config,
@@ -128,7 +170,20 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             raise_on_error=False,
             log_context="entry removal",
         )
-    )
+        # The purge runs after the unload and may have created the resolver again
+        _async_release_unused_resolver(hass)
+
+    # Purge in the background to return quickly to the UI
+    hass.async_create_task(_async_purge_removed_entry())
+    await CalendarSyncLedger(hass, entry.entry_id).async_remove()
+
+
+@callback
+def _async_release_unused_resolver(hass: HomeAssistant) -> None:
+    """Release the shared calendar entity resolver once no entry of the integration is loaded."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if not any(config_entry.entry_id in domain_data for config_entry in hass.config_entries.async_entries(DOMAIN)):
+        async_release_calendar_entity_resolver(hass)
 
 
 def _apply_manual_exceptions(manager: CustodyScheduleManager, config: dict[str, Any]) -> None:
@@ -138,7 +193,16 @@ def _apply_manual_exceptions(manager: CustodyScheduleManager, config: dict[str,
 
 
 class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
-    """Coordinator that keeps the schedule state up to date."""
+    """Coordinator that keeps the schedule state up to date.
+
+    A point-in-time timer fires at the next transition (window boundary, override
+    expiry, holiday bound or midnight) so arrival/departure events are not delayed
+    by the polling interval, which now only refreshes countdown attributes.
+
+    Calendar sync is change-driven: each refresh fingerprints the windows that would be
+    synced and a debounced sync runs only when the fingerprint changed (or the sync
+    interval elapsed, which also lets the ledger reconcile with the target calendar).
+    """
 
     def __init__(self, hass: HomeAssistant, manager: CustodyScheduleManager, entry: ConfigEntry) -> None:
         super().__init__(
@@ -152,6 +216,17 @@ class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
         self._last_state: CustodyComputation | None = None
         self._calendar_sync_lock = asyncio.Lock()
         self._last_calendar_sync: datetime | None = None
+        self.calendar_ledger = CalendarSyncLedger(hass, entry.entry_id)
+        self.calendar_metrics = SyncMetrics()
+        self._calendar_sync_fingerprint: str | None = None
+        self._calendar_sync_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=CALENDAR_SYNC_DEBOUNCE,
+            immediate=False,
+            function=self._maybe_sync_calendar,
+        )
+        self._unsub_transition: Callable[[], None] | None = None
 
     async def _async_update_data(self) -> CustodyComputation:
         """Fetch data from the schedule manager."""
@@ -161,11 +236,40 @@ class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
             raise UpdateFailed(f"Unable to compute custody schedule: {err}") from err
 
         self._fire_events(state)
-        # Sync in background to allow setups/updates to return quickly
-        self.hass.async_create_task(self._maybe_sync_calendar(state))
+        self._schedule_transition()
+        self._request_calendar_sync(state)
         self._last_state = state
         return state
 
+    def _schedule_transition(self) -> None:
+        """Arm a single timer at the next instant the schedule state can change."""
+        self.async_cancel_transition()
+        when = self.manager.next_transition(dt_util.now())
+        LOGGER.debug("Next custody transition for %s at %s", self.entry.entry_id, when)
+        self._unsub_transition = async_track_point_in_time(self.hass, self._async_handle_transition, when)
+
+    async def _async_handle_transition(self, _now: datetime) -> None:
+        """Recompute immediately at a transition (no debounce, events fire on time)."""
+        self._unsub_transition = None
+        await self.async_refresh()
+
+    @callback
+    def async_cancel_transition(self) -> None:
+        """Cancel the pending transition timer."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+    @callback
+    def async_handle_holiday_refresh(self, country: str, zone: str) -> None:
+        """Recompute when fresh holidays replace the data the schedule was built from.
+
+        The manager notices the new holiday data version and rebuilds its windows.
+        """
+        if self.manager.holiday_source != (country, zone):
+            return
+        self.hass.async_create_task(self.async_request_refresh())
+
     def _fire_events(self, new_state: CustodyComputation) -> None:
         """Emit Home Assistant events when key transitions happen."""
         if self._last_state is None:
@@ -202,17 +306,23 @@ class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
                 },
             )
 
-    async def _maybe_sync_calendar(self, state: CustodyComputation) -> None:
-        """Sync custody windows to an external calendar if enabled."""
-        config = {**self.entry.data, **(self.entry.options or {})}
+    def _calendar_sync_target(self, config: dict[str, Any]) -> str | None:
+        """Return the sync target, or None when calendar sync is disabled or unconfigured."""
         if not config.get(CONF_CALENDAR_SYNC):
             LOGGER.debug("Calendar sync disabled for entry %s", self.entry.entry_id)
-            return
+            return None
         target = _normalize_calendar_target(config.get(CONF_CALENDAR_TARGET))
         if not target:
             LOGGER.warning("Calendar sync enabled but no target calendar selected.")
+        return target
+
+    @callback
+    def _request_calendar_sync(self, state: CustodyComputation) -> None:
+        """Schedule a debounced sync when the synced windows changed or the interval elapsed."""
+        config = {**self.entry.data, **(self.entry.options or {})}
+        target = self._calendar_sync_target(config)
+        if not target:
             return
-        LOGGER.debug("Calendar sync target resolved: %s (entry %s)", target, self.entry.entry_id)
 
         now = dt_util.now()
         interval_hours = config.get(CONF_CALENDAR_SYNC_INTERVAL_HOURS, 1)
@@ -222,23 +332,39 @@ class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
             interval_hours = 1
         interval_hours = max(1, min(24, interval_hours))
 
-        if self._last_calendar_sync and now - self._last_calendar_sync < timedelta(hours=interval_hours):
+        fingerprint = _calendar_sync_fingerprint(state, config, target, self.entry.entry_id, now)
+        interval_due = not self._last_calendar_sync or now - self._last_calendar_sync >= timedelta(hours=interval_hours)
+        if fingerprint == self._calendar_sync_fingerprint and not interval_due:
+            self.calendar_metrics.skipped_by_interval += 1
+            calendar_sync_metrics(self.hass, target).skipped_by_interval += 1
             LOGGER.debug(
-                "Calendar sync skipped (interval). Last sync: %s, interval: %sh",
+                "Calendar sync skipped (no change). Last sync: %s, interval: %sh",
                 self._last_calendar_sync,
                 interval_hours,
             )
             return
+        # Sync in background (debounced) to allow setups/updates to return quickly
+        self.hass.async_create_task(self._calendar_sync_debouncer.async_call())
+
+    @callback
+    def async_cancel_calendar_sync(self) -> None:
+        """Cancel a pending debounced calendar sync."""
+        self._calendar_sync_debouncer.async_cancel()
+
+    async def _maybe_sync_calendar(self) -> None:
+        """Sync the latest custody windows to an external calendar if enabled."""
+        state = self.data
+        if state is None:
+            return
+        config = {**self.entry.data, **(self.entry.options or {})}
+        target = self._calendar_sync_target(config)
+        if not target:
+            return
+        LOGGER.debug("Calendar sync target resolved: %s (entry %s)", target, self.entry.entry_id)
 
         async with self._calendar_sync_lock:
             now = dt_util.now()
-            if self._last_calendar_sync and now - self._last_calendar_sync < timedelta(hours=interval_hours):
-                LOGGER.debug(
-                    "Calendar sync skipped inside lock (interval). Last sync: %s, interval: %sh",
-                    self._last_calendar_sync,
-                    interval_hours,
-                )
-                return
+            fingerprint = _calendar_sync_fingerprint(state, config, target, self.entry.entry_id, now)
             try:
                 if not self.hass.services.has_service("calendar", "get_events"):
                     LOGGER.debug(
@@ -246,11 +372,20 @@ class CustodyScheduleCoordinator(DataUpdateCoordinator[CustodyComputation]):
                     )
                     return
                 LOGGER.debug("Calendar sync starting for %s", target)
-                await _sync_calendar_events(self.hass, target, state, config, self.entry.entry_id)
+                job = await _async_prepare_calendar_sync(
+                    self.hass, target, state, config, self.entry.entry_id, self.calendar_ledger, self.calendar_metrics
+                )
+                # Entries sharing this target are batched: one read and one write queue per cycle
+                report = await calendar_sync_hub(self.hass, target, _async_run_calendar_sync_cycle).async_sync(job)
                 LOGGER.debug("Calendar sync completed for %s", target)
                 self._last_calendar_sync = now
+                # Keep the fingerprint stale after failed writes so the next refresh retries them
+                if report is not None and not report.failed:
+                    self._calendar_sync_fingerprint = fingerprint
             except Exception as err:
                 LOGGER.warning("Calendar sync failed for %s: %s", target, err)
+            # Let the diagnostic sensors pick up the new sync metrics
+            self.async_update_listeners()
 
 
 def _event_key(summary: str, start: Any, end: Any) -> tuple[str, datetime, datetime]:
@@ -493,56 +628,8 @@ async def _delete_calendar_event_direct(
             LOGGER.debug("Entity %s not found in states", entity_id)
             return False
 
-        entity = None
-
-        # Method 1: Try entity_platform
-        platform_data = hass.data.get("entity_platform", {})
-        if isinstance(platform_data, dict):
-            calendar_platform = platform_data.get("calendar")
-            if calendar_platform and hasattr(calendar_platform, "entities"):
-                entity = calendar_platform.entities.get(entity_id)
-
-        # Method 2: Try entity registry to find the entity (most reliable for Google Calendar)
-        if not entity:
-            registry = er.async_get(hass)
-            entity_entry = registry.async_get(entity_id)
-            if entity_entry:
-                # Try to get entity from platform using registry info
-                platform_data = hass.data.get("entity_platform", {})
-                if isinstance(platform_data, dict):
-                    calendar_platform = platform_data.get("calendar")
-                    if calendar_platform and hasattr(calendar_platform, "entities"):
-                        # First try by unique_id (most reliable for Google Calendar)
-                        for eid, ent in calendar_platform.entities.items():
-                            if hasattr(ent, "unique_id") and ent.unique_id == entity_entry.unique_id:
-                                entity = ent
-                                LOGGER.debug("Found entity by unique_id: %s", entity_entry.unique_id)
-                                break
-                        # Fallback: try by entity_id
-                        if not entity:
-                            for eid, ent in calendar_platform.entities.items():
-                                if eid == entity_id:
-                                    entity = ent
-                                    LOGGER.debug("Found entity by entity_id: %s", entity_id)
-                                    break
-
-        if not entity:
-            platform_data = hass.data.get("entity_platform", {})
-            if isinstance(platform_data, dict):
-                calendar_platform = platform_data.get("calendar")
-                if calendar_platform and hasattr(calendar_platform, "entities"):
-                    # Last resort: search all calendar entities
-                    for eid, ent in calendar_platform.entities.items():
-                        if eid == entity_id:
-                            entity = ent
-                            break
-
-        # Method 4: Try component (robust method)
-        if not entity:
-            component = hass.data.get("calendar")
-            if component and hasattr(component, "get_entity"):
-                entity = component.get_entity(entity_id)
-
+        resolver = calendar_entity_resolver(hass)
+        entity = resolver.async_resolve(entity_id)
         if not entity:
             LOGGER.warning("Calendar entity %s not found in platform", entity_id)
             return False
@@ -615,6 +702,7 @@ async def _delete_calendar_event_direct(
         return False
     except Exception as err:
         LOGGER.warning("Direct entity delete failed for %s (uid=%s): %s", entity_id, uid, err, exc_info=True)
+        calendar_entity_resolver(hass).invalidate(entity_id)
         return False
 
 
@@ -622,47 +710,11 @@ async def _get_calendar_events_direct(
     hass: HomeAssistant, entity_id: str, start_date: datetime, end_date: datetime
 ) -> list[Any] | None:
     """Get calendar events directly from the entity to ensure we get UIDs."""
+    resolver = calendar_entity_resolver(hass)
     try:
-        # Resolve entity
-        entity = None
-        registry = er.async_get(hass)
-        entity_entry = registry.async_get(entity_id)
-
-        platform_data = hass.data.get("entity_platform", {})
-        if isinstance(platform_data, dict):
-            calendar_platform = platform_data.get("calendar")
-            if calendar_platform and hasattr(calendar_platform, "entities"):
-                # Try by unique_id first
-                if entity_entry:
-                    for ent in calendar_platform.entities.values():
-                        if hasattr(ent, "unique_id") and ent.unique_id == entity_entry.unique_id:
-                            entity = ent
-                            break
-                # Try by entity_id
-                if not entity:
-                    entity = calendar_platform.entities.get(entity_id)
-
+        entity = resolver.async_resolve(entity_id)
         if not entity:
             LOGGER.debug("Direct read: Could not find entity object for %s", entity_id)
-            # DEBUG: help locate where entities are stored
-            if isinstance(platform_data, dict):
-                LOGGER.debug("Direct read: hass.data['entity_platform'] keys: %s", list(platform_data.keys()))
-                cal_plat = platform_data.get("calendar")
-                if cal_plat:
-                    LOGGER.debug("Direct read: platform 'calendar' type: %s", type(cal_plat))
-                    if hasattr(cal_plat, "entities"):
-                        LOGGER.debug(
-                            "Direct read: platform 'calendar' entities keys: %s", list(cal_plat.entities.keys())
-                        )
-
-            # Last ditch attempt: check component
-            component = hass.data.get("calendar")
-            if component and hasattr(component, "get_entity"):
-                entity = component.get_entity(entity_id)
-                if entity:
-                    LOGGER.debug("Direct read: Found entity via component.get_entity")
-
-        if not entity:
             return None
 
         if not hasattr(entity, "async_get_events"):
@@ -679,208 +731,625 @@ async def _get_calendar_events_direct(
         return events
     except Exception as err:
         LOGGER.warning("Direct read failed for %s: %s", entity_id, err)
+        resolver.invalidate(entity_id)
         return None
 
 
-async def _sync_calendar_events(
+async def _async_fetch_calendar_events(
+    hass: HomeAssistant, target: str, start_range: datetime, end_range: datetime
+) -> list[Any]:
+    """Read the raw events of the target calendar in [start_range, end_range]."""
+    # Method 1: Try direct entity access first (to get UIDs)
+    events = await _get_calendar_events_direct(hass, target, start_range, end_range)
+    if events is not None:
+        return events
+
+    # Method 2: Fallback to service call if direct access failed
+    LOGGER.debug("Direct event read failed/unavailable, falling back to service call")
+    response = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {
+            "entity_id": target,
+            "start_date_time": start_range.isoformat(),
+            "end_date_time": end_range.isoformat(),
+        },
+        blocking=True,
+        return_response=True,
+    )
+    LOGGER.debug("Calendar get_events response type: %s", type(response).__name__)
+
+    events = []
+    if isinstance(response, list):
+        events = response
+    elif isinstance(response, dict):
+        if "events" in response:
+            events = response.get("events") or []
+        elif target in response:
+            target_payload = response.get(target)
+            if isinstance(target_payload, dict) and "events" in target_payload:
+                events = target_payload.get("events") or []
+            elif isinstance(target_payload, list):
+                events = target_payload
+    return events
+
+
+async def _async_iter_calendar_events(
     hass: HomeAssistant,
     target: str,
-    state: CustodyComputation,
-    config: dict[str, Any],
-    entry_id: str,
-) -> None:
-    """Create, update, and delete custody events in the target calendar."""
-    if not hass.services.has_service("calendar", "get_events") or not hass.services.has_service(
-        "calendar", "create_event"
-    ):
-        LOGGER.debug("Calendar services not available, skipping sync.")
-        return
-
-    now = dt_util.now()
-    days = config.get(CONF_CALENDAR_SYNC_DAYS, 120)
-    try:
-        days = int(days)
-    except (TypeError, ValueError):
-        days = 120
-    days = max(7, min(365, days))
-    start_range = _ensure_local_tz(now - timedelta(days=1))
-    end_range = _ensure_local_tz(now + timedelta(days=days))
+    start_range: datetime,
+    end_range: datetime,
+    chunk: timedelta = CALENDAR_READ_CHUNK,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the target calendar's events as dicts, reading the range one chunk at a time.
+
+    Only one chunk is held in memory. Events spanning a chunk boundary are returned by
+    both reads and yielded once.
+    """
+    spanning: set[tuple[Any, ...]] = set()
+    chunk_start = start_range
+    while chunk_start < end_range:
+        chunk_end = min(end_range, chunk_start + chunk)
+        carried: set[tuple[Any, ...]] = set()
+        for raw_event in await _async_fetch_calendar_events(hass, target, chunk_start, chunk_end):
+            event = _normalize_event_to_dict(raw_event)
+            if not event:
+                continue
+            end_dt = _normalize_event_datetime(event.get("end"))
+            identity = (
+                *_extract_event_uid_and_recurrence(event),
+                event.get("summary"),
+                _normalize_event_datetime(event.get("start")),
+                end_dt,
+            )
+            if identity in spanning:
+                continue
+            if end_dt is None or end_dt >= chunk_end:
+                carried.add(identity)
+            yield event
+        spanning = carried
+        chunk_start = chunk_end
 
-    # Method 1: Try direct entity access first (to get UIDs)
-    events = await _get_calendar_events_direct(hass, target, start_range, end_range)
 
-    # Method 2: Fallback to service call if direct access failed or returned empty (and we expect something?)
-    if events is None:
-        LOGGER.debug("Direct event read failed/unavailable, falling back to service call")
-        response = await hass.services.async_call(
-            "calendar",
-            "get_events",
-            {
-                "entity_id": target,
-                "start_date_time": start_range.isoformat(),
-                "end_date_time": end_range.isoformat(),
-            },
-            blocking=True,
-            return_response=True,
-        )
-        LOGGER.debug("Calendar get_events response type: %s", type(response).__name__)
-
-        events = []
-        if isinstance(response, list):
-            events = response
-        elif isinstance(response, dict):
-            if "events" in response:
-                events = response.get("events") or []
-            elif target in response:
-                target_payload = response.get(target)
-                if isinstance(target_payload, dict) and "events" in target_payload:
-                    events = target_payload.get("events") or []
-                elif isinstance(target_payload, list):
-                    events = target_payload
+async def _async_read_synced_partitions(
+    hass: HomeAssistant, target: str, ranges: dict[str, tuple[datetime, datetime]]
+) -> dict[str, list[dict[str, Any]]]:
+    """Read the target calendar once and split its events by entry marker.
 
-    marker = _calendar_marker(entry_id)
+    ``ranges`` maps each marker to the span it needs: the read covers their union and
+    each marker gets its own copy of the events it owns (within its span when several
+    markers share the read), tagged with their ledger key.
+    """
+    events = await _async_fetch_calendar_events(
+        hass, target, min(start for start, _end in ranges.values()), max(end for _start, end in ranges.values())
+    )
 
-    existing_keys: set[tuple[str, datetime, datetime]] = set()
-    existing_events: list[dict[str, Any]] = []
+    partitions: dict[str, list[dict[str, Any]]] = {marker: [] for marker in ranges}
+    shared = len(ranges) > 1
     for event in events:
         event_dict = _normalize_event_to_dict(event)
         if not event_dict:
             continue
-        if marker and not _matches_marker(event_dict, marker):
-            continue
-        event = event_dict
-        summary = event.get("summary") or event.get("message") or ""
-        start_dt = _normalize_event_datetime(event.get("start"))
-        end_dt = _normalize_event_datetime(event.get("end"))
+        summary = event_dict.get("summary") or event_dict.get("message") or ""
+        start_dt = _normalize_event_datetime(event_dict.get("start"))
+        end_dt = _normalize_event_datetime(event_dict.get("end"))
         if not summary or not start_dt or not end_dt:
             continue
-        key = _event_key(summary, start_dt, end_dt)
-        existing_keys.add(key)
-        event["__key"] = key
-        existing_events.append(event)
-    LOGGER.debug("Calendar sync: %d existing events after filtering", len(existing_events))
+        key = ledger_key(_event_key(summary, start_dt, end_dt))
+        series_tag = SERIES_TAG.search(event_dict.get("description") or "")
+        for marker, (start_range, end_range) in ranges.items():
+            if marker and not _matches_marker(event_dict, marker):
+                continue
+            # The union read may reach past this marker's span when siblings need more
+            if shared and (end_dt < start_range or start_dt > end_range):
+                continue
+            tagged = {**event_dict, "__key": key, "__start": start_dt, "__end": end_dt}
+            if series_tag:
+                tagged["__series"] = series_tag.group(1)
+            partitions[marker].append(tagged)
+    return partitions
 
-    child_label = config.get(CONF_CHILD_NAME_DISPLAY, config.get(CONF_CHILD_NAME, ""))
-    location = config.get(CONF_LOCATION) or ""
 
-    desired_keys: set[tuple[str, datetime, datetime]] = set()
-    created = 0
-    updated = 0
+# Ledger key of a recurring event: "<summary>|<start>|<end>|<RRULE>#<series id>"
+_SERIES_KEY = re.compile(r"\|FREQ=[^#|]*#([0-9a-f]{12})$")
 
-    # Process additions and updates in parallel (limited concurrency)
-    semaphore = asyncio.Semaphore(4)
-    tasks = []
 
-    async def _async_create_event(w, sm, m, target, loc):
-        async with semaphore:
-            await hass.services.async_call(
-                "calendar",
-                "create_event",
-                {
-                    "entity_id": target,
-                    "summary": sm,
-                    "start_date_time": _ensure_local_tz(w.start).isoformat(),
-                    "end_date_time": _ensure_local_tz(w.end).isoformat(),
-                    "description": f"{m} Planning de garde ({w.source})",
-                    "location": loc,
-                },
-                blocking=True,
-            )
+def _collapse_series_occurrences(
+    events: list[dict[str, Any]], desired: dict[str, DesiredEvent], known_keys: Iterable[str] = ()
+) -> list[dict[str, Any]]:
+    """Fold the expanded occurrences of synced recurring events into one event per series.
 
-    async def _async_update_event(ev_id, sm, w, m, target, loc, src):
-        async with semaphore:
-            await hass.services.async_call(
-                "calendar",
-                "update_event",
-                {
-                    "entity_id": target,
-                    "event_id": ev_id,
-                    "summary": sm,
-                    "start_date_time": _ensure_local_tz(w.start).isoformat(),
-                    "end_date_time": _ensure_local_tz(w.end).isoformat(),
-                    "description": f"{m} Planning de garde ({src})",
-                    "location": loc,
-                },
-                blocking=True,
-            )
+    Series still wanted take their ledger key and full span from the desired event,
+    series recorded in ``known_keys`` take their ledger key, and unknown ones get a
+    placeholder key so the whole series is deleted.
+    """
+    series_keys: dict[str, DesiredEvent | str] = {}
+    for key in known_keys:
+        if series_tag := _SERIES_KEY.search(key):
+            series_keys[series_tag.group(1)] = key
+    for item in desired.values():
+        if item.rrule:
+            series_keys[SERIES_TAG.search(item.description).group(1)] = item
+    collapsed: list[dict[str, Any]] = []
+    seen: dict[str, dict[str, Any]] = {}
+    for event in events:
+        series_id = event.get("__series")
+        if series_id is None:
+            collapsed.append(event)
+            continue
+        first = seen.get(series_id)
+        if first is not None:
+            first["__start"] = min(first["__start"], event["__start"])
+            first["__end"] = max(first["__end"], event["__end"])
+            continue
+        item = series_keys.get(series_id)
+        if isinstance(item, DesiredEvent):
+            event["__key"] = item.key
+            event["__start"] = item.window.start
+            event["__end"] = item.end
+        elif item is not None:
+            event["__key"] = item
+        else:
+            event["__key"] = f"series:{series_id}"
+        seen[series_id] = event
+        collapsed.append(event)
+    return collapsed
+
+
+def _calendar_sync_range(config: dict[str, Any], now: datetime) -> tuple[int, datetime, datetime]:
+    """Return the configured sync horizon in days and the synced [start, end] range."""
+    days = config.get(CONF_CALENDAR_SYNC_DAYS, 120)
+    try:
+        days = int(days)
+    except (TypeError, ValueError):
+        days = 120
+    days = max(7, min(365, days))
+    return days, _ensure_local_tz(now - timedelta(days=1)), _ensure_local_tz(now + timedelta(days=days))
 
-    for window in state.windows:
+
+def _desired_calendar_events(
+    state: CustodyComputation,
+    config: dict[str, Any],
+    marker: str,
+    start_range: datetime,
+    end_range: datetime,
+    recurring: bool = False,
+) -> dict[str, DesiredEvent]:
+    """Return the windows to sync, keyed like the ledger.
+
+    With ``recurring``, regular runs of pattern windows become one recurring event each
+    (whole run, even the occurrences past the sync range, so the series stays stable as
+    the range slides); irregular occurrences are synced as one-off events.
+    """
+    child_label = config.get(CONF_CHILD_NAME_DISPLAY, config.get(CONF_CHILD_NAME, ""))
+    location = config.get(CONF_LOCATION) or ""
+    desired: dict[str, DesiredEvent] = {}
+    windows: list[CustodyWindow] = list(state.windows)
+    if recurring:
+        series, singles = split_pattern_series([window for window in windows if window.source == "pattern"])
+        for run in series:
+            if run.last.end < start_range or run.first.start > end_range:
+                continue
+            summary = f"{child_label} - {run.first.label}".strip()
+            base_key = f"{ledger_key(_event_key(summary, run.first.start, run.first.end))}|{run.rrule}"
+            # The id covers everything the event shows, so any change yields a new series instead of an update
+            series_id = hashlib.sha1(f"{base_key}|{marker}|{location}".encode(), usedforsecurity=False).hexdigest()
+            description = f"{marker} Planning de garde ({run.first.source}) #series-{series_id[:12]}"
+            key = f"{base_key}#{series_id[:12]}"
+            desired[key] = DesiredEvent(
+                key=key,
+                window=run.first,
+                summary=summary,
+                description=description,
+                location=location,
+                digest=content_digest(description, location),
+                rrule=run.rrule,
+                until=run.last.end,
+            )
+        windows = singles + [window for window in windows if window.source != "pattern"]
+    for window in windows:
         if window.source == "vacation_filter":
             continue
         if window.end < start_range or window.start > end_range:
             continue
         summary = f"{child_label} - {window.label}".strip()
-        key = _event_key(summary, window.start, window.end)
-        desired_keys.add(key)
-        if key not in existing_keys:
-            tasks.append(_async_create_event(window, summary, marker, target, location))
-            created += 1
-        elif hass.services.has_service("calendar", "update_event"):
-            existing = next((ev for ev in existing_events if ev.get("__key") == key), None)
-            if existing:
-                event_id = _extract_event_id(existing)
-                if event_id:
-                    new_desc = f"{marker} Planning de garde ({window.source})"
-                    if existing.get("description") != new_desc or existing.get("location") != location:
-                        tasks.append(
-                            _async_update_event(event_id, summary, window, marker, target, location, window.source)
+        description = f"{marker} Planning de garde ({window.source})"
+        key = ledger_key(_event_key(summary, window.start, window.end))
+        desired[key] = DesiredEvent(
+            key=key,
+            window=window,
+            summary=summary,
+            description=description,
+            location=location,
+            digest=content_digest(description, location),
+        )
+    return desired
+
+
+def _calendar_sync_fingerprint(
+    state: CustodyComputation, config: dict[str, Any], target: str, entry_id: str, now: datetime
+) -> str:
+    """Hash the synced window set (keys and contents, vacation filters and out-of-range windows excluded)."""
+    _days, start_range, end_range = _calendar_sync_range(config, now)
+    desired = _desired_calendar_events(
+        state, config, _calendar_marker(entry_id), start_range, end_range, bool(config.get(CONF_CALENDAR_SYNC_RRULE))
+    )
+    digest = hashlib.sha1(target.encode(), usedforsecurity=False)
+    for key, item in desired.items():
+        digest.update(f"\x1e{key}\x1f{item.digest}".encode())
+    return digest.hexdigest()
+
+
+async def _async_prepare_calendar_sync(
+    hass: HomeAssistant,
+    target: str,
+    state: CustodyComputation,
+    config: dict[str, Any],
+    entry_id: str,
+    ledger: CalendarSyncLedger,
+    metrics: SyncMetrics | None = None,
+) -> SyncJob:
+    """Compute an entry's desired events and whether its ledger needs a full read."""
+    now = dt_util.now()
+    days, start_range, end_range = _calendar_sync_range(config, now)
+    marker = _calendar_marker(entry_id)
+    recurring_entity = None
+    if config.get(CONF_CALENDAR_SYNC_RRULE):
+        # calendar.create_event has no rrule field: recurring events go through the entity
+        recurring_entity = calendar_entity_resolver(hass).async_resolve(target)
+        supported = getattr(recurring_entity, "supported_features", 0) or 0
+        if recurring_entity is None or not supported & CalendarEntityFeature.CREATE_EVENT:
+            LOGGER.debug("Calendar %s cannot create recurring events, syncing individual events", target)
+            recurring_entity = None
+    desired = _desired_calendar_events(state, config, marker, start_range, end_range, recurring_entity is not None)
+
+    await ledger.async_load()
+    return SyncJob(
+        entry_id=entry_id,
+        marker=marker,
+        ledger=ledger,
+        desired=desired,
+        days=days,
+        start=start_range,
+        end=end_range,
+        now=now,
+        reconcile=ledger.needs_reconciliation(target, days, now),
+        recurring_entity=recurring_entity,
+        metrics=metrics,
+    )
+
+
+async def _async_plan_calendar_sync(
+    hass: HomeAssistant, target: str, jobs: list[SyncJob], can_update: bool
+) -> list[SyncPlan]:
+    """Diff a batch of entries sharing a target without writing anything.
+
+    The ledger records what was last pushed, so most syncs only send the delta and never
+    read the target calendar. A full read (reconciliation) runs when a ledger is stale or
+    was built for another target/range, and catches edits made outside the integration;
+    the batch then reads the target once and every entry reconciles from its own slice,
+    which keeps sibling entries aligned on the same cycles. Ledgers are left untouched.
+    """
+    if any(job.reconcile for job in jobs):
+        for job in jobs:
+            job.reconcile = True
+
+    ledgers: dict[str, dict[str, LedgerEntry]] = {}
+    deltas: dict[str, SyncDelta] = {}
+    ranges: dict[str, tuple[datetime, datetime]] = {}
+    for job in jobs:
+        if job.reconcile:
+            ranges[job.marker] = (job.start, job.end)
+            continue
+        entries = ledgers[job.entry_id] = dict(job.ledger.entries)
+        delta = deltas[job.entry_id] = plan_delta(entries, job.desired, job.start, job.end)
+        for key in delta.expired:
+            del entries[key]
+        unresolved = delta.unresolved(entries)
+        if unresolved:
+            # Events created by a previous delta have no known UID yet: read only their span
+            ranges[job.marker] = (
+                max(job.start, min(entries[key].start for key in unresolved)),
+                min(job.end, max(entries[key].end for key in unresolved)),
+            )
+    # One read for the whole batch, split by entry marker
+    remote: dict[str, list[dict[str, Any]]] = {}
+    read_latency = None
+    if ranges:
+        read_started = time.monotonic()
+        remote = await _async_read_synced_partitions(hass, target, ranges)
+        read_latency = time.monotonic() - read_started
+
+    plans: list[SyncPlan] = []
+    for job in jobs:
+        if job.reconcile:
+            existing_events = _collapse_series_occurrences(remote[job.marker], job.desired)
+            LOGGER.debug("Calendar sync: %d existing events after filtering", len(existing_events))
+            existing_by_key: dict[str, dict[str, Any]] = {}
+            plan = SyncPlan(job, {}, len(existing_events), scanned=len(remote[job.marker]), read_latency=read_latency)
+            for event in existing_events:
+                existing_by_key[event["__key"]] = event
+                plan.entries[event["__key"]] = LedgerEntry(
+                    start=event["__start"],
+                    end=event["__end"],
+                    digest=content_digest(event.get("description") or "", event.get("location") or ""),
+                    uid=_extract_event_id(event),
+                )
+
+            for key, item in job.desired.items():
+                existing = existing_by_key.get(key)
+                if existing is None:
+                    plan.create.append(item)
+                elif can_update:
+                    event_id = plan.entries[key].uid
+                    if event_id:
+                        if existing.get("description") != item.description or existing.get("location") != item.location:
+                            plan.update.append((event_id, item))
+            for event in existing_events:
+                if event["__key"] not in job.desired:
+                    uid, rid = _extract_event_uid_and_recurrence(event)
+                    if uid:
+                        # Deleting a series by UID alone removes all of its occurrences
+                        plan.delete.append((event["__key"], uid, None if "__series" in event else rid))
+        else:
+            entries = ledgers[job.entry_id]
+            delta = deltas[job.entry_id]
+            if job.marker in remote:
+                resolved = _collapse_series_occurrences(remote[job.marker], job.desired, delta.unresolved(entries))
+                for event in resolved:
+                    entry = entries.get(event["__key"])
+                    if entry is not None and entry.uid is None:
+                        # Copy: the ledger only takes the UID if the sync goes through
+                        entries[event["__key"]] = LedgerEntry(
+                            start=entry.start, end=entry.end, digest=entry.digest, uid=_extract_event_id(event)
                         )
-                        updated += 1
+            plan = SyncPlan(job, entries, 0, scanned=len(remote.get(job.marker, ())), read_latency=read_latency)
+            for item in delta.create:
+                plan.create.append(item)
+            for item in delta.update:
+                uid = entries[item.key].uid
+                if uid is None:
+                    # Removed from the calendar outside the integration: push it again
+                    del entries[item.key]
+                    plan.create.append(item)
+                elif can_update:
+                    plan.update.append((uid, item))
+            for key in delta.delete:
+                uid = entries[key].uid
+                if uid is None:
+                    del entries[key]
+                else:
+                    plan.delete.append((key, uid, None))
+            plan.existing = len(entries)
+        plans.append(plan)
+    return plans
+
+
+async def _async_run_calendar_sync_cycle(
+    hass: HomeAssistant, target: str, jobs: list[SyncJob]
+) -> dict[str, WriteReport]:
+    """Create, update, and delete the custody events of a batch of entries sharing a target.
 
-    if tasks:
-        await asyncio.gather(*tasks, return_exceptions=True)
+    All writes go through one scheduler. Failed writes are left out of the ledgers and
+    returned in the reports, so the next sync retries exactly those.
+    """
+    if not hass.services.has_service("calendar", "get_events") or not hass.services.has_service(
+        "calendar", "create_event"
+    ):
+        LOGGER.debug("Calendar services not available, skipping sync.")
+        return {}
 
-    # Delete events that no longer exist in the planning (parallel)
+    started = time.monotonic()
+    # Service capabilities do not change during a sync: resolve them once
+    can_update = hass.services.has_service("calendar", "update_event")
     delete_service = _get_calendar_delete_service(hass)
-    deleted_count = [0]  # Mutable for closure
-    del_tasks = []
 
-    async def _async_delete_event(ev, ds, target):
-        uid, rid = _extract_event_uid_and_recurrence(ev)
-        if not uid:
+    async def _async_create_event(recurring_entity: Any, item: DesiredEvent) -> None:
+        if item.rrule:
+            await recurring_entity.async_create_event(
+                summary=item.summary,
+                dtstart=dt_util.as_local(item.window.start),
+                dtend=dt_util.as_local(item.window.end),
+                description=item.description,
+                location=item.location,
+                rrule=item.rrule,
+            )
             return
-        async with semaphore:
-            try:
-                if ds:
-                    sd = {"entity_id": target, "uid": str(uid).strip()}
-                    if rid:
-                        sd["recurrence_id"] = str(rid).strip()
-                    await hass.services.async_call("calendar", ds, sd, blocking=True)
-                else:
-                    await _delete_calendar_event_direct(hass, target, uid, rid)
-                deleted_count[0] += 1
-            except Exception as e:
-                LOGGER.warning("Parallel delete failed: %s", e)
-
-    for event in existing_events:
-        if event.get("__key") not in desired_keys:
-            del_tasks.append(_async_delete_event(event, delete_service, target))
-
-    if del_tasks:
-        await asyncio.gather(*del_tasks, return_exceptions=True)
-    deleted = deleted_count[0]
-    if deleted > 0:
-        LOGGER.debug(
-            "Calendar sync summary for %s: created=%d updated=%d deleted=%d",
-            target,
-            created,
-            updated,
-            deleted,
+        await hass.services.async_call(
+            "calendar",
+            "create_event",
+            {
+                "entity_id": target,
+                "summary": item.summary,
+                "start_date_time": _ensure_local_tz(item.window.start).isoformat(),
+                "end_date_time": _ensure_local_tz(item.window.end).isoformat(),
+                "description": item.description,
+                "location": item.location,
+            },
+            blocking=True,
         )
-        LOGGER.info(
-            "Calendar sync result for %s: existing=%d desired=%d created=%d updated=%d deleted=%d",
-            target,
-            len(existing_events),
-            len(desired_keys),
-            created,
-            updated,
-            deleted,
+
+    async def _async_update_event(ev_id: str, item: DesiredEvent) -> None:
+        await hass.services.async_call(
+            "calendar",
+            "update_event",
+            {
+                "entity_id": target,
+                "event_id": ev_id,
+                "summary": item.summary,
+                "start_date_time": _ensure_local_tz(item.window.start).isoformat(),
+                "end_date_time": _ensure_local_tz(item.window.end).isoformat(),
+                "description": item.description,
+                "location": item.location,
+            },
+            blocking=True,
         )
-    if created == 0 and updated == 0 and deleted == 0:
-        LOGGER.info(
-            "Calendar sync for %s did not require changes (entries already aligned).",
-            target,
+
+    async def _async_delete_event(uid: str, rid: str | None) -> bool:
+        if delete_service:
+            sd = {"entity_id": target, "uid": str(uid).strip()}
+            if rid:
+                sd["recurrence_id"] = str(rid).strip()
+            await hass.services.async_call("calendar", delete_service, sd, blocking=True)
+            return True
+        return await _delete_calendar_event_direct(hass, target, uid, rid)
+
+    plans = await _async_plan_calendar_sync(hass, target, jobs, can_update)
+    operations: list[WriteOperation] = []
+    for plan in plans:
+        job = plan.job
+        operations.extend(
+            WriteOperation(
+                (job.entry_id, "create", index),
+                "create",
+                functools.partial(_async_create_event, job.recurring_entity, item),
+            )
+            for index, item in enumerate(plan.create)
         )
+        operations.extend(
+            WriteOperation(
+                (job.entry_id, "update", index), "update", functools.partial(_async_update_event, event_id, item)
+            )
+            for index, (event_id, item) in enumerate(plan.update)
+        )
+        operations.extend(
+            WriteOperation((job.entry_id, "delete", index), "delete", functools.partial(_async_delete_event, uid, rid))
+            for index, (_key, uid, rid) in enumerate(plan.delete)
+        )
+
+    # All writes go through one scheduler (adaptive concurrency, retries, shared per-target budget)
+    report = await CalendarWriteScheduler(write_budget(hass, target)).async_run(operations)
+    reports = {job.entry_id: WriteReport() for job in jobs}
+    for op_key in report.succeeded:
+        reports[op_key[0]].succeeded.append(op_key)
+    for op_key, error in report.failed.items():
+        reports[op_key[0]].failed[op_key] = error
+    for op_key, attempts in report.retried.items():
+        reports[op_key[0]].retries += attempts
+        reports[op_key[0]].retried[op_key] = attempts
+    duration = time.monotonic() - started
+
+    for plan in plans:
+        job = plan.job
+        entries = plan.entries
+        entry_report = reports[job.entry_id]
+        created = updated = deleted = 0
+        for _entry_id, kind, index in entry_report.succeeded:
+            if kind == "create":
+                created += 1
+                item = plan.create[index]
+                entries[item.key] = LedgerEntry(start=item.window.start, end=item.end, digest=item.digest)
+            elif kind == "update":
+                updated += 1
+                item = plan.update[index][1]
+                entries[item.key].digest = item.digest
+            else:
+                deleted += 1
+                entries.pop(plan.delete[index][0], None)
+
+        if job.reconcile:
+            job.ledger.reconciled(target, job.days, job.now, entries)
+        else:
+            job.ledger.entries = entries
+            job.ledger.async_save()
+
+        if created or updated or deleted or entry_report.failed:
+            LOGGER.info(
+                "Calendar sync result for %s (%s, entry %s): existing=%d desired=%d created=%d updated=%d deleted=%d "
+                "failed=%d",
+                target,
+                "full" if job.reconcile else "delta",
+                job.entry_id,
+                plan.existing,
+                len(job.desired),
+                created,
+                updated,
+                deleted,
+                len(entry_report.failed),
+            )
+        else:
+            LOGGER.info(
+                "Calendar sync for %s (entry %s) did not require changes (entries already aligned).",
+                target,
+                job.entry_id,
+            )
+        if job.metrics is not None:
+            job.metrics.record_sync(
+                job.now,
+                "full" if job.reconcile else "delta",
+                duration,
+                plan.read_latency,
+                plan.scanned,
+                {"create": created, "update": updated, "delete": deleted},
+                len(entry_report.failed),
+                entry_report.retries,
+            )
+
+    calendar_sync_metrics(hass, target).record_sync(
+        dt_util.now(),
+        "full" if any(job.reconcile for job in jobs) else "delta",
+        duration,
+        next((plan.read_latency for plan in plans), None),
+        sum(plan.scanned for plan in plans),
+        {kind: sum(1 for op_key in report.succeeded if op_key[1] == kind) for kind in ("create", "update", "delete")},
+        len(report.failed),
+        report.retries,
+    )
+    return reports
+
+
+async def _sync_calendar_events(
+    hass: HomeAssistant,
+    target: str,
+    state: CustodyComputation,
+    config: dict[str, Any],
+    entry_id: str,
+    ledger: CalendarSyncLedger,
+) -> WriteReport | None:
+    """Sync one entry to the target calendar right away, outside of its target's hub."""
+    job = await _async_prepare_calendar_sync(hass, target, state, config, entry_id, ledger)
+    return (await _async_run_calendar_sync_cycle(hass, target, [job])).get(entry_id)
+
+
+def _calendar_sync_plan_payload(target: str, plan: SyncPlan, max_operations: int) -> dict[str, Any]:
+    """Describe a sync plan as a service response: counts plus the first operations."""
+    job = plan.job
+    operations = itertools.chain(
+        (
+            {
+                "action": "create",
+                "summary": item.summary,
+                "start": item.window.start.isoformat(),
+                "end": item.end.isoformat(),
+                "rrule": item.rrule,
+            }
+            for item in plan.create
+        ),
+        (
+            {
+                "action": "update",
+                "event_id": event_id,
+                "summary": item.summary,
+                "start": item.window.start.isoformat(),
+                "end": item.end.isoformat(),
+            }
+            for event_id, item in plan.update
+        ),
+        ({"action": "delete", "uid": uid, "key": key} for key, uid, _rid in plan.delete),
+    )
+    total = len(plan.create) + len(plan.update) + len(plan.delete)
+    return {
+        "entry_id": job.entry_id,
+        "target": target,
+        "mode": "full" if job.reconcile else "delta",
+        "start": job.start.isoformat(),
+        "end": job.end.isoformat(),
+        "existing": plan.existing,
+        "desired": len(job.desired),
+        "counts": {"create": len(plan.create), "update": len(plan.update), "delete": len(plan.delete)},
+        "operations": list(itertools.islice(operations, max_operations)),
+        "truncated": total > max_operations,
+    }
 
 
 async def _async_purge_calendar_events(
@@ -922,43 +1391,11 @@ async def _async_purge_calendar_events(
     start_range = _ensure_local_tz(now - timedelta(days=1))
     end_range = _ensure_local_tz(now + timedelta(days=days))
 
-    # Method 1: Try direct entity access first (to get UIDs)
-    events = await _get_calendar_events_direct(hass, target, start_range, end_range)
-
-    # Method 2: Fallback to service call
-    if events is None:
-        LOGGER.debug("Direct event read failed/unavailable, falling back to service call")
-        response = await hass.services.async_call(
-            "calendar",
-            "get_events",
-            {
-                "entity_id": target,
-                "start_date_time": start_range.isoformat(),
-                "end_date_time": end_range.isoformat(),
-            },
-            blocking=True,
-            return_response=True,
-        )
-
-        events = []
-        if isinstance(response, list):
-            events = response
-        elif isinstance(response, dict):
-            if "events" in response:
-                events = response.get("events") or []
-            elif target in response:
-                target_payload = response.get(target)
-                if isinstance(target_payload, dict) and "events" in target_payload:
-                    events = target_payload.get("events") or []
-                elif isinstance(target_payload, list):
-                    events = target_payload
-
     marker = _calendar_marker(entry_id)
     child_label = config.get(CONF_CHILD_NAME_DISPLAY, config.get(CONF_CHILD_NAME, ""))
     summary_prefix = f"{child_label} - " if child_label else ""
     match_text = str(match_text or "").strip()
     match_text_lower = match_text.lower() if match_text else ""
-    child_label_lower = child_label.lower() if child_label else ""
     deleted = 0
     matched = 0
     missing_id = 0
@@ -986,134 +1423,101 @@ async def _async_purge_calendar_events(
     debug_matches: list[str] = []
     debug_misses: list[str] = []
 
-    if debug and events:
-        sample_raw = events[0]
-        sample_event = _normalize_event_to_dict(sample_raw) or {}
+    def _log_sample(event: dict[str, Any]) -> None:
         LOGGER.info(
-            "Purge debug%s: sample event type=%s keys=%s",
+            "Purge debug%s: sample event keys=%s",
             context,
-            type(sample_raw).__name__,
-            ", ".join(sorted(sample_event.keys())) if isinstance(sample_event, dict) else "not a dict",
+            ", ".join(sorted(event.keys())),
+        )
+        try:
+            sample_str = json.dumps(event, default=str, indent=2)
+            if len(sample_str) > 500:
+                sample_str = sample_str[:500] + "..."
+        except Exception:
+            sample_str = str(event)
+        LOGGER.info("Purge debug%s: sample event structure:\n%s", context, sample_str)
+        # Also check UID extraction
+        sample_uid, sample_recurrence = _extract_event_uid_and_recurrence(event)
+        LOGGER.info(
+            "Purge debug%s: extracted uid=%s recurrence_id=%s from sample",
+            context,
+            sample_uid,
+            sample_recurrence,
         )
-        if isinstance(sample_event, dict):
-            import json
-
-            try:
-                sample_str = json.dumps(sample_event, default=str, indent=2)
-                if len(sample_str) > 500:
-                    sample_str = sample_str[:500] + "..."
-            except Exception:
-                sample_str = str(sample_event)
-            LOGGER.info("Purge debug%s: sample event structure:\n%s", context, sample_str)
-            # Also check UID extraction
-            sample_uid, sample_recurrence = _extract_event_uid_and_recurrence(sample_event)
-            LOGGER.info(
-                "Purge debug%s: extracted uid=%s recurrence_id=%s from sample",
-                context,
-                sample_uid,
-                sample_recurrence,
-            )
 
-    for event in events:
-        event_dict = _normalize_event_to_dict(event)
-        if not event_dict:
-            continue
-        event = event_dict
-        summary = event.get("summary") or event.get("message") or ""
-        description = event.get("description") or ""
-
-        uid, recurrence_id = _extract_event_uid_and_recurrence(event)
-
-        if summary:
-            stats["with_summary"] += 1
-        if description:
-            stats["with_description"] += 1
-        if uid:
-            stats["with_event_id"] += 1
-
-        marker_match = bool(marker and marker in description)
-        legacy_match = "Planning de garde" in description
-        prefix_match = bool(include_unmarked and summary_prefix and summary.startswith(summary_prefix))
-        label_match = bool(include_unmarked and child_label_lower and child_label_lower in summary.lower())
-        text_match = bool(match_text_lower and match_text_lower in summary.lower())
-
-        if marker_match:
-            stats["marker"] += 1
-        if legacy_match:
-            stats["legacy"] += 1
-        if prefix_match:
-            stats["prefix"] += 1
-        if label_match:
-            stats["label"] += 1
-        if text_match:
-            stats["text"] += 1
-
-    # Perform deletions in parallel (limited concurrency)
-    semaphore = asyncio.Semaphore(4)
-    del_tasks = []
-    deleted_count = [0]
-
-    async def _async_delete_task(ev, ds, target):
-        ev_uid, ev_rid = _extract_event_uid_and_recurrence(ev)
-        if not ev_uid:
-            return
-        async with semaphore:
-            try:
-                if ds:
-                    sd = {"entity_id": target, "uid": str(ev_uid).strip()}
-                    if ev_rid:
-                        sd["recurrence_id"] = str(ev_rid).strip()
-                    await hass.services.async_call("calendar", ds, sd, blocking=True)
-                else:
-                    await _delete_calendar_event_direct(hass, target, ev_uid, ev_rid)
-                deleted_count[0] += 1
-            except Exception as e:
-                LOGGER.warning("Parallel purge failed for uid=%s: %s", ev_uid, e)
-
-    for event_raw in events:
-        event = _normalize_event_to_dict(event_raw)
-        if not event:
-            continue
-        summary = event.get("summary") or event.get("message") or ""
-        description = event.get("description") or ""
-        uid, recurrence_id = _extract_event_uid_and_recurrence(event)
-
-        marker_match = marker and _matches_marker({"description": description}, marker)
-        legacy_match = not marker and "Planning de garde" in description
-        prefix_match = summary_prefix and summary.startswith(summary_prefix)
-        label_match = child_label and child_label in summary
-        text_match = match_text and match_text_lower in summary.lower()
-
-        if marker_match:
-            stats["marker"] += 1
-        if legacy_match:
-            stats["legacy"] += 1
-        if prefix_match:
-            stats["prefix"] += 1
-        if label_match:
-            stats["label"] += 1
-        if text_match:
-            stats["text"] += 1
-
-        matches = purge_all or (marker_match or legacy_match or prefix_match or label_match or text_match)
-
-        if matches:
-            matched += 1
-            if not uid:
-                missing_id += 1
-                continue
-            del_tasks.append(_async_delete_task(event, delete_service, target))
-        else:
-            if debug and len(debug_misses) < 10:
+    # Deletions go through the write scheduler (adaptive concurrency, retries, per-target budget)
+    async def _async_delete_task(ev_uid: str, ev_rid: str | None) -> bool:
+        if delete_service:
+            sd = {"entity_id": target, "uid": str(ev_uid).strip()}
+            if ev_rid:
+                sd["recurrence_id"] = str(ev_rid).strip()
+            await hass.services.async_call("calendar", delete_service, sd, blocking=True)
+            return True
+        return await _delete_calendar_event_direct(hass, target, ev_uid, ev_rid)
+
+    total = 0
+
+    async def _async_delete_operations() -> AsyncIterator[WriteOperation]:
+        """Single streaming pass: classify each event once and hand matches to the scheduler."""
+        nonlocal total, matched, missing_id
+        async for event in _async_iter_calendar_events(hass, target, start_range, end_range):
+            if debug and not total:
+                _log_sample(event)
+            total += 1
+            summary = event.get("summary") or event.get("message") or ""
+            description = event.get("description") or ""
+            uid, recurrence_id = _extract_event_uid_and_recurrence(event)
+
+            if summary:
+                stats["with_summary"] += 1
+            if description:
+                stats["with_description"] += 1
+            if uid:
+                stats["with_event_id"] += 1
+
+            marker_match = marker and _matches_marker({"description": description}, marker)
+            legacy_match = not marker and "Planning de garde" in description
+            prefix_match = summary_prefix and summary.startswith(summary_prefix)
+            label_match = child_label and child_label in summary
+            text_match = match_text and match_text_lower in summary.lower()
+
+            if marker_match:
+                stats["marker"] += 1
+            if legacy_match:
+                stats["legacy"] += 1
+            if prefix_match:
+                stats["prefix"] += 1
+            if label_match:
+                stats["label"] += 1
+            if text_match:
+                stats["text"] += 1
+
+            matches = purge_all or (marker_match or legacy_match or prefix_match or label_match or text_match)
+
+            if matches:
+                matched += 1
+                if not uid:
+                    missing_id += 1
+                    continue
+                yield WriteOperation((total, uid), "delete", functools.partial(_async_delete_task, uid, recurrence_id))
+            elif debug and len(debug_misses) < 10:
                 debug_misses.append(
                     f"summary='{_truncate(summary)}' uid='{uid}' recurrence_id={recurrence_id} "
                     f"marker={marker_match} legacy={legacy_match} prefix={prefix_match} "
                     f"label={label_match} text={text_match}"
                 )
 
-    if del_tasks:
-        await asyncio.gather(*del_tasks, return_exceptions=True)
-    deleted = deleted_count[0]
+    started = time.monotonic()
+    report = await CalendarWriteScheduler(write_budget(hass, target)).async_run(_async_delete_operations())
+    deleted = len(report.succeeded)
+    duration = time.monotonic() - started
+    purge_metrics = [calendar_sync_metrics(hass, target)]
+    if coordinator := hass.data.get(DOMAIN, {}).get(entry_id, {}).get("coordinator"):
+        purge_metrics.append(coordinator.calendar_metrics)
+    for metrics in purge_metrics:
+        metrics.record_purge(now, duration, total, deleted, len(report.failed), report.retries)
+    if report.failed:
+        LOGGER.warning("Purge could not delete %d matched events%s.", len(report.failed), context)
 
     LOGGER.info(
         "Purged %d custody events from %s (purge_all=%s, include_unmarked=%s, days=%s, match_text=%s)%s",
@@ -1129,7 +1533,7 @@ async def _async_purge_calendar_events(
         LOGGER.info(
             "Purge completed with no deletions (matched=%d, events=%d).%s",
             matched,
-            len(events),
+            total,
             context,
         )
     if missing_id:
@@ -1145,7 +1549,7 @@ async def _async_purge_calendar_events(
         LOGGER.info(
             "Purge debug%s: total=%d summary=%d desc=%d ids=%d marker=%d legacy=%d " "prefix=%d label=%d text=%d",
             context,
-            len(events),
+            total,
             stats["with_summary"],
             stats["with_description"],
             stats["with_event_id"],
@@ -1166,7 +1570,7 @@ async def _async_purge_calendar_events(
         for line in debug_misses:
             LOGGER.info("Purge debug miss%s: %s", context, line)
 
-    return deleted, matched, len(events)
+    return deleted, matched, total
 
 
 def _migrate_reference_years(hass: HomeAssistant, entry: ConfigEntry, config: dict[str, Any]) -> dict[str, Any]:
@@ -1224,7 +1628,8 @@ def _register_services(hass: HomeAssistant) -> None:
         entry_id = call.data.get("entry_id")
         if not entry_id or not isinstance(entry_id, str) or not entry_id.strip():
             raise HomeAssistantError("entry_id is required and must be a non-empty string")
-        coordinator, _ = _get_manager(entry_id)
+        coordinator, manager = _get_manager(entry_id)
+        manager.invalidate()
         await coordinator.async_request_refresh()
 
     async def _async_handle_export_exceptions(call: ServiceCall) -> None:
@@ -1392,6 +1797,9 @@ def _register_services(hass: HomeAssistant) -> None:
             raise_on_error=True,
             log_context="service",
         )
+        # The purge removed synced events behind the ledger's back: re-read the calendar next sync
+        if coordinator := hass.data[DOMAIN].get(entry_id, {}).get("coordinator"):
+            coordinator.calendar_ledger.invalidate()
 
     hass.services.async_register(
         DOMAIN,
@@ -1409,6 +1817,56 @@ def _register_services(hass: HomeAssistant) -> None:
         ),
     )
 
+    async def _async_handle_plan_calendar_sync(call: ServiceCall) -> dict[str, Any]:
+        """Diff the entry against its target calendar without writing anything."""
+        entry_id = call.data["entry_id"]
+        entry = _get_entry(entry_id)
+        coordinator, _manager = _get_manager(entry_id)
+        if coordinator.data is None:
+            raise HomeAssistantError(f"Custody schedule not computed yet for entry_id {entry_id}")
+        config = {**entry.data, **(entry.options or {})}
+        target = _normalize_calendar_target(config.get(CONF_CALENDAR_TARGET))
+        if not target:
+            raise HomeAssistantError("No target calendar configured for this entry")
+        if not hass.services.has_service("calendar", "get_events"):
+            raise HomeAssistantError("Calendar services are not available yet")
+
+        job = await _async_prepare_calendar_sync(
+            hass, target, coordinator.data, config, entry_id, coordinator.calendar_ledger
+        )
+        job.reconcile = job.reconcile or call.data["reconcile"]
+        (plan,) = await _async_plan_calendar_sync(
+            hass, target, [job], hass.services.has_service("calendar", "update_event")
+        )
+        result = _calendar_sync_plan_payload(target, plan, call.data["max_operations"])
+        LOGGER.info(
+            "Calendar sync plan for %s (%s, entry %s): create=%d update=%d delete=%d",
+            target,
+            result["mode"],
+            entry_id,
+            len(plan.create),
+            len(plan.update),
+            len(plan.delete),
+        )
+        hass.data[DOMAIN]["last_calendar_sync_plan"] = result
+        return result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PLAN_CALENDAR_SYNC,
+        _async_handle_plan_calendar_sync,
+        schema=vol.Schema(
+            {
+                vol.Required("entry_id"): vol.All(cv.string, vol.Length(min=1)),
+                vol.Optional("reconcile", default=False): cv.boolean,
+                vol.Optional("max_operations", default=CALENDAR_SYNC_PLAN_MAX_OPERATIONS): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=1000)
+                ),
+            }
+        ),
+        **({"supports_response": SupportsResponse.OPTIONAL} if SupportsResponse else {}),
+    )
+
     async def _async_handle_test_api(call: ServiceCall) -> None:
         """Test the holiday API connection."""
         entry_id = call.data.get("entry_id")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Callable
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
@@ -15,7 +16,7 @@ from homeassistant.util import slugify
 
 from . import CustodyScheduleCoordinator
 from .const import CONF_CHILD_NAME, CONF_CHILD_NAME_DISPLAY, CONF_LOCATION, CONF_PHOTO, DOMAIN
-from .schedule import CustodyComputation, CustodyWindow
+from .schedule import CustodyComputation, CustodyWindow, WindowStore
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
@@ -32,6 +33,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([CustodyCalendarEntity(coordinator, entry, child_name_display, child_name_normalized)])
 
 
+class CalendarEventIndex:
+    """CalendarEvent objects for one window store, built on first access and found with bisect."""
+
+    __slots__ = ("windows", "location", "_to_event", "_events")
+
+    def __init__(
+        self, windows: WindowStore, location: str | None, to_event: Callable[[CustodyWindow], CalendarEvent]
+    ) -> None:
+        self.windows = windows
+        self.location = location
+        self._to_event = to_event
+        self._events: list[CalendarEvent | None] = [None] * len(windows)
+
+    def _event(self, position: int) -> CalendarEvent:
+        event = self._events[position]
+        if event is None:
+            event = self._events[position] = self._to_event(self.windows[position])
+        return event
+
+    def next_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the earliest-starting event that has not ended yet."""
+        position = self.windows.position_ending_after(now)
+        return self._event(position) if position is not None else None
+
+    def events_between(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return the events overlapping [start, end] in start order."""
+        return [self._event(position) for position in self.windows.positions_overlapping(start, end)]
+
+
 class CustodyCalendarEntity(CoordinatorEntity[CustodyComputation], CalendarEntity):
     """Calendar showing regular custody and vacations."""
 
@@ -57,6 +87,7 @@ class CustodyCalendarEntity(CoordinatorEntity[CustodyComputation], CalendarEntit
             sw_version="1.8.31",
         )
         self.entity_id = f"calendar.{slugify(child_name_normalized)}_calendar"
+        self._event_index: CalendarEventIndex | None = None
         photo = entry.data.get(CONF_PHOTO)
         if photo:
             self._attr_entity_picture = photo
@@ -68,26 +99,56 @@ class CustodyCalendarEntity(CoordinatorEntity[CustodyComputation], CalendarEntit
         if not data:
             return None
 
-        now = dt_util.now()
-        upcoming = sorted((window for window in data.windows if window.end > now), key=lambda window: window.start)
-        window = upcoming[0] if upcoming else None
-        return self._window_to_event(window) if window else None
+        return self._get_event_index(data).next_event(dt_util.now())
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
-        """Return all events within the requested range."""
+        """Return all events within the requested range.
+
+        Events starting inside the range covered by the computed windows come from the
+        cached event index; those starting before it (history, e.g. the first days of a
+        month view) or after it (far future) are generated on demand.
+        """
         data = self.coordinator.data
         if not data:
             return []
 
-        events: list[CalendarEvent] = []
-        for window in data.windows:
-            if window.end < start_date or window.start > end_date:
-                continue
-            events.append(self._window_to_event(window))
+        manager = self.coordinator.manager
+        coverage = manager.materialized_coverage()
+        if coverage is None or end_date < coverage[0] or start_date > coverage[1]:
+            return [self._window_to_event(window) for window in manager.iter_windows(start_date, end_date)]
+
+        covered_start, covered_end = coverage
+        # Each event is taken from exactly one part, chosen by its start
+        events = [
+            self._window_to_event(window)
+            for window in manager.iter_windows(start_date, min(end_date, covered_start))
+            if window.start < covered_start
+        ]
+        events.extend(
+            event
+            for event in self._get_event_index(data).events_between(
+                max(start_date, covered_start), min(end_date, covered_end)
+            )
+            if event.start >= covered_start
+        )
+        if end_date > covered_end:
+            events.extend(
+                self._window_to_event(window)
+                for window in manager.iter_windows(covered_end, end_date)
+                if window.start > covered_end
+            )
         return events
 
+    def _get_event_index(self, data: CustodyComputation) -> CalendarEventIndex:
+        """Return the event index for the current windows, rebuilding it when they change."""
+        location = data.attributes.get(CONF_LOCATION)
+        index = self._event_index
+        if index is None or index.windows is not data.windows or index.location != location:
+            index = self._event_index = CalendarEventIndex(data.windows, location, self._window_to_event)
+        return index
+
     def _window_to_event(self, window: CustodyWindow) -> CalendarEvent:
         """Convert an internal window to a CalendarEvent."""
         # Distinguish between weekend custody and vacation custody in description
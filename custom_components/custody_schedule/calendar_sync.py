@@ -0,0 +1,731 @@
+"""Incremental calendar sync state for the Custody Schedule integration."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable
+
+import aiohttp
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CALENDAR_SYNC_HUB_WINDOW,
+    CALENDAR_SYNC_RECONCILE_INTERVAL,
+    CALENDAR_SYNC_RRULE_MIN_OCCURRENCES,
+    CALENDAR_SYNC_SAVE_DELAY,
+    CALENDAR_SYNC_STORAGE_KEY,
+    CALENDAR_SYNC_STORAGE_VERSION,
+    CALENDAR_WRITE_BACKOFF,
+    CALENDAR_WRITE_BACKOFF_MAX,
+    CALENDAR_WRITE_BURST,
+    CALENDAR_WRITE_CONCURRENCY,
+    CALENDAR_WRITE_MAX_ATTEMPTS,
+    CALENDAR_WRITE_MAX_CONCURRENCY,
+    CALENDAR_WRITE_RATE,
+    DOMAIN,
+    LOGGER,
+)
+from .schedule import CustodyWindow
+
+# Tag appended to the description of recurring events so their expanded occurrences can be folded back
+SERIES_TAG = re.compile(r"#series-([0-9a-f]{12})")
+
+
+def ledger_key(key: tuple[str, datetime, datetime]) -> str:
+    """Serialize an event key (summary, UTC start, UTC end) to a stable string."""
+    summary, start, end = key
+    return f"{summary}|{start.isoformat()}|{end.isoformat()}"
+
+
+def content_digest(description: str, location: str) -> str:
+    """Hash the event fields that are updated in place (summary and times are part of the key)."""
+    return hashlib.sha1(f"{description}\x1f{location}".encode(), usedforsecurity=False).hexdigest()
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """Last pushed state of one synced window."""
+
+    start: datetime
+    end: datetime
+    digest: str
+    uid: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the Store."""
+        return {"start": self.start.isoformat(), "end": self.end.isoformat(), "digest": self.digest, "uid": self.uid}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LedgerEntry | None:
+        """Restore an entry serialized with as_dict (None if malformed)."""
+        start = dt_util.parse_datetime(str(data.get("start") or ""))
+        end = dt_util.parse_datetime(str(data.get("end") or ""))
+        digest = data.get("digest")
+        if not start or not end or not isinstance(digest, str):
+            return None
+        uid = data.get("uid")
+        return cls(start=start, end=end, digest=digest, uid=uid if isinstance(uid, str) and uid else None)
+
+
+@dataclass(slots=True)
+class WindowSeries:
+    """A run of identical pattern windows repeating every ``interval_days`` days."""
+
+    first: CustodyWindow
+    last: CustodyWindow
+    interval_days: int
+    count: int
+
+    @property
+    def rrule(self) -> str:
+        """Return the RFC 5545 recurrence rule of the run."""
+        if self.interval_days % 7 == 0:
+            return f"FREQ=WEEKLY;INTERVAL={self.interval_days // 7};COUNT={self.count}"
+        return f"FREQ=DAILY;INTERVAL={self.interval_days};COUNT={self.count}"
+
+
+def split_pattern_series(
+    windows: Sequence[CustodyWindow], min_count: int = CALENDAR_SYNC_RRULE_MIN_OCCURRENCES
+) -> tuple[list[WindowSeries], list[CustodyWindow]]:
+    """Split sorted pattern windows into recurring runs and the remaining one-off windows.
+
+    Occurrences are compared in local wall-clock time (label, start time, end time and
+    length in days) so runs survive DST changes. A truncated or holiday-extended
+    occurrence differs from its neighbours and simply ends the run: Home Assistant
+    calendars accept an RRULE but no EXDATE, so it is synced as a one-off event and
+    the regular occurrences after it start a new series.
+    """
+    series: list[WindowSeries] = []
+    singles: list[CustodyWindow] = []
+    run: list[CustodyWindow] = []
+    interval = 0
+    previous_signature: tuple[Any, ...] | None = None
+
+    def close_run() -> None:
+        if len(run) >= min_count:
+            series.append(WindowSeries(run[0], run[-1], interval, len(run)))
+        else:
+            singles.extend(run)
+
+    for window in windows:
+        start = dt_util.as_local(window.start)
+        end = dt_util.as_local(window.end)
+        signature = (window.label, window.source, start.time(), end.time(), (end.date() - start.date()).days)
+        if run and signature == previous_signature:
+            step = (start.date() - dt_util.as_local(run[-1].start).date()).days
+            if step > 0 and (len(run) == 1 or step == interval):
+                interval = step
+                run.append(window)
+                continue
+        if run:
+            close_run()
+        run = [window]
+        interval = 0
+        previous_signature = signature
+    if run:
+        close_run()
+    return series, singles
+
+
+@dataclass(slots=True)
+class DesiredEvent:
+    """A custody window (or a recurring series of them) as it should appear in the target calendar."""
+
+    key: str
+    window: CustodyWindow
+    summary: str
+    description: str
+    location: str
+    digest: str
+    rrule: str | None = None
+    until: datetime | None = None
+
+    @property
+    def end(self) -> datetime:
+        """Return the end of the last occurrence."""
+        return self.until or self.window.end
+
+
+@dataclass(slots=True)
+class SyncDelta:
+    """Operations needed to move the target calendar from the ledger state to the desired one."""
+
+    create: list[DesiredEvent] = field(default_factory=list)
+    update: list[DesiredEvent] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+    expired: list[str] = field(default_factory=list)
+
+    def unresolved(self, entries: dict[str, LedgerEntry]) -> list[str]:
+        """Return the ledger keys to update or delete whose remote UID is not known yet."""
+        keys = [item.key for item in self.update] + self.delete
+        return [key for key in keys if entries[key].uid is None]
+
+
+def plan_delta(
+    entries: dict[str, LedgerEntry],
+    desired: dict[str, DesiredEvent],
+    start_range: datetime,
+    end_range: datetime,
+) -> SyncDelta:
+    """Diff the desired events against the ledger.
+
+    Entries that ended before the sync range are only forgotten (past events are never
+    deleted), and entries starting after it are kept untouched so shrinking the range
+    does not delete events that will come back into it.
+    """
+    delta = SyncDelta()
+    for key, item in desired.items():
+        entry = entries.get(key)
+        if entry is None:
+            delta.create.append(item)
+        elif entry.digest != item.digest:
+            delta.update.append(item)
+    for key, entry in entries.items():
+        if key in desired:
+            continue
+        if entry.end < start_range:
+            delta.expired.append(key)
+        elif entry.start <= end_range:
+            delta.delete.append(key)
+    return delta
+
+
+class CalendarSyncLedger:
+    """Persisted map of synced window keys to remote UIDs and content hashes.
+
+    Between reconciliations a sync only pushes the difference between the ledger and
+    the current windows; the target calendar is read in full only when the ledger is
+    missing, stale, or was built for another target or range.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, CALENDAR_SYNC_STORAGE_VERSION, f"{CALENDAR_SYNC_STORAGE_KEY}.{entry_id}")
+        self._loaded = False
+        self.target: str | None = None
+        self.days: int | None = None
+        self.reconciled_at: datetime | None = None
+        self.entries: dict[str, LedgerEntry] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted ledger once."""
+        if self._loaded:
+            return
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            LOGGER.warning("Unable to load calendar sync ledger: %s", err)
+            stored = None
+        if isinstance(stored, dict):
+            self.target = stored.get("target")
+            self.days = stored.get("days")
+            self.reconciled_at = dt_util.parse_datetime(str(stored.get("reconciled_at") or ""))
+            for key, raw_entry in (stored.get("entries") or {}).items():
+                entry = LedgerEntry.from_dict(raw_entry) if isinstance(raw_entry, dict) else None
+                if entry is not None:
+                    self.entries[key] = entry
+        self._loaded = True
+
+    def needs_reconciliation(self, target: str, days: int, now: datetime) -> bool:
+        """Return True when the next sync must read the whole target calendar."""
+        return (
+            self.reconciled_at is None
+            or self.target != target
+            or self.days != days
+            or now - self.reconciled_at >= CALENDAR_SYNC_RECONCILE_INTERVAL
+        )
+
+    def reconciled(self, target: str, days: int, now: datetime, entries: dict[str, LedgerEntry]) -> None:
+        """Replace the ledger with the state observed by a full read."""
+        self.target = target
+        self.days = days
+        self.reconciled_at = now
+        self.entries = entries
+        self.async_save()
+
+    def invalidate(self) -> None:
+        """Force a full read on the next sync (e.g. after the calendar was purged)."""
+        self.reconciled_at = None
+        self.async_save()
+
+    def async_save(self) -> None:
+        """Persist the ledger after a short delay."""
+        self._store.async_delay_save(self._data_to_save, CALENDAR_SYNC_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the persisted ledger."""
+        self.entries = {}
+        self.reconciled_at = None
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload persisted by the Store."""
+        return {
+            "target": self.target,
+            "days": self.days,
+            "reconciled_at": self.reconciled_at.isoformat() if self.reconciled_at else None,
+            "entries": {key: entry.as_dict() for key, entry in self.entries.items()},
+        }
+
+
+@dataclass(slots=True)
+class SyncJob:
+    """One entry's share of a sync cycle on a target calendar."""
+
+    entry_id: str
+    marker: str
+    ledger: CalendarSyncLedger
+    desired: dict[str, DesiredEvent]
+    days: int
+    start: datetime
+    end: datetime
+    now: datetime
+    reconcile: bool
+    recurring_entity: Any = None
+    metrics: SyncMetrics | None = None
+
+
+@dataclass(slots=True)
+class SyncPlan:
+    """Writes a sync job needs, diffed against its ledger or a read of the target."""
+
+    job: SyncJob
+    entries: dict[str, LedgerEntry]
+    existing: int
+    create: list[DesiredEvent] = field(default_factory=list)
+    update: list[tuple[str, DesiredEvent]] = field(default_factory=list)
+    delete: list[tuple[str, str, str | None]] = field(default_factory=list)
+    scanned: int = 0
+    read_latency: float | None = None
+
+
+@dataclass(slots=True)
+class SyncMetrics:
+    """Counters and latest timings of the calendar syncs and purges of one entry or one target."""
+
+    syncs: int = 0
+    last_sync: datetime | None = None
+    last_sync_mode: str | None = None
+    last_sync_duration: float | None = None
+    reads: int = 0
+    last_read_latency: float | None = None
+    events_scanned: int = 0
+    operations: dict[str, int] = field(default_factory=lambda: {"create": 0, "update": 0, "delete": 0})
+    failures: int = 0
+    retries: int = 0
+    skipped_by_interval: int = 0
+    purges: int = 0
+    last_purge: datetime | None = None
+    last_purge_duration: float | None = None
+
+    def record_sync(
+        self,
+        now: datetime,
+        mode: str,
+        duration: float,
+        read_latency: float | None,
+        scanned: int,
+        operations: dict[str, int],
+        failures: int,
+        retries: int,
+    ) -> None:
+        """Account for one sync cycle (read latency is None when the cycle did not read)."""
+        self.syncs += 1
+        self.last_sync = now
+        self.last_sync_mode = mode
+        self.last_sync_duration = duration
+        if read_latency is not None:
+            self.reads += 1
+            self.last_read_latency = read_latency
+        self.events_scanned += scanned
+        for kind, count in operations.items():
+            self.operations[kind] += count
+        self.failures += failures
+        self.retries += retries
+
+    def record_purge(
+        self, now: datetime, duration: float, scanned: int, deleted: int, failures: int, retries: int
+    ) -> None:
+        """Account for one purge (a streamed read of the target plus deletions)."""
+        self.purges += 1
+        self.last_purge = now
+        self.last_purge_duration = duration
+        self.reads += 1
+        self.events_scanned += scanned
+        self.operations["delete"] += deleted
+        self.failures += failures
+        self.retries += retries
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as JSON-serializable values (durations in seconds)."""
+        return {
+            "syncs": self.syncs,
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "last_sync_mode": self.last_sync_mode,
+            "last_sync_duration": _round(self.last_sync_duration),
+            "reads": self.reads,
+            "last_read_latency": _round(self.last_read_latency),
+            "events_scanned": self.events_scanned,
+            "operations": dict(self.operations),
+            "failures": self.failures,
+            "retries": self.retries,
+            "skipped_by_interval": self.skipped_by_interval,
+            "purges": self.purges,
+            "last_purge": self.last_purge.isoformat() if self.last_purge else None,
+            "last_purge_duration": _round(self.last_purge_duration),
+        }
+
+
+def _round(seconds: float | None) -> float | None:
+    return round(seconds, 3) if seconds is not None else None
+
+
+def calendar_sync_metrics(hass: HomeAssistant, target: str) -> SyncMetrics:
+    """Return the metrics of a target calendar (shared by all entries syncing to it)."""
+    metrics: dict[str, SyncMetrics] = hass.data.setdefault(DOMAIN, {}).setdefault("sync_metrics", {})
+    target_metrics = metrics.get(target)
+    if target_metrics is None:
+        target_metrics = metrics[target] = SyncMetrics()
+    return target_metrics
+
+
+class CalendarEntityResolver:
+    """Cache of calendar entity objects by entity_id, shared by direct reads, deletes and purges.
+
+    Resolving an entity may scan every calendar entity (unique_id match for renamed
+    entities), so hits are cached until the entity registry reports a change for that
+    entity, or until a caller invalidates it after a failed call (e.g. the integration
+    owning the calendar was reloaded and its entity objects replaced).
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._entities: dict[str, Any] = {}
+        self._unsub = hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated)
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Drop entries for entities that were removed, renamed or re-registered."""
+        for key in ("entity_id", "old_entity_id"):
+            entity_id = event.data.get(key)
+            if entity_id:
+                self._entities.pop(entity_id, None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening to the entity registry and forget cached entities."""
+        self._unsub()
+        self._entities.clear()
+
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Forget one cached entity (all of them when entity_id is None)."""
+        if entity_id is None:
+            self._entities.clear()
+        else:
+            self._entities.pop(entity_id, None)
+
+    @callback
+    def async_resolve(self, entity_id: str) -> Any | None:
+        """Return the calendar entity object for entity_id (None when not loaded)."""
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            entity = self._async_lookup(entity_id)
+            if entity is not None:
+                self._entities[entity_id] = entity
+        return entity
+
+    def _async_lookup(self, entity_id: str) -> Any | None:
+        hass = self._hass
+        calendar_platform = None
+        platform_data = hass.data.get("entity_platform", {})
+        if isinstance(platform_data, dict):
+            calendar_platform = platform_data.get("calendar")
+            if calendar_platform is not None and not hasattr(calendar_platform, "entities"):
+                calendar_platform = None
+        if calendar_platform is not None:
+            entity = calendar_platform.entities.get(entity_id)
+            if entity is not None:
+                return entity
+        component = hass.data.get("calendar")
+        if component and hasattr(component, "get_entity"):
+            entity = component.get_entity(entity_id)
+            if entity is not None:
+                return entity
+        # Slow path: match by unique_id (entity loaded under another id)
+        entity_entry = er.async_get(hass).async_get(entity_id)
+        if entity_entry is not None and calendar_platform is not None:
+            for entity in calendar_platform.entities.values():
+                if getattr(entity, "unique_id", None) == entity_entry.unique_id:
+                    return entity
+        return None
+
+
+def calendar_entity_resolver(hass: HomeAssistant) -> CalendarEntityResolver:
+    """Return the shared calendar entity resolver."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    resolver = domain_data.get("entity_resolver")
+    if resolver is None:
+        resolver = domain_data["entity_resolver"] = CalendarEntityResolver(hass)
+    return resolver
+
+
+@callback
+def async_release_calendar_entity_resolver(hass: HomeAssistant) -> None:
+    """Drop the shared resolver and its registry listener (created again on next use)."""
+    resolver = hass.data.get(DOMAIN, {}).pop("entity_resolver", None)
+    if resolver is not None:
+        resolver.async_shutdown()
+
+
+# HTTP statuses of throttled or temporarily failing calendar backends (request timeout, rate limit, 5xx)
+_TRANSIENT_STATUSES = frozenset({408, 429})
+
+
+def _is_transient_status(status: Any) -> bool:
+    return isinstance(status, int) and (status in _TRANSIENT_STATUSES or 500 <= status < 600)
+
+
+def is_transient_error(err: BaseException) -> bool:
+    """Return True for errors worth retrying (timeouts, connection drops, throttling).
+
+    Errors are classified by type and HTTP status, following the cause chain since
+    calendar services usually re-raise backend errors as HomeAssistantError.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = err
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (asyncio.TimeoutError, TimeoutError, ConnectionError, aiohttp.ClientConnectionError)):
+            return True
+        if isinstance(current, aiohttp.ClientResponseError):
+            return _is_transient_status(current.status)
+        # Other HTTP clients (e.g. Google API errors) expose the status as an attribute
+        for attribute in ("status", "status_code"):
+            status = getattr(current, attribute, None)
+            if status is not None:
+                return _is_transient_status(status)
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class WriteBudget:
+    """Token bucket shared by every writer of one target calendar."""
+
+    def __init__(self, rate: float = CALENDAR_WRITE_RATE, burst: int = CALENDAR_WRITE_BURST) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """Wait until one write is allowed."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Empty the bucket after the backend throttled us, so all writers slow down."""
+        self._tokens = min(self._tokens, 0.0)
+
+
+def write_budget(hass: HomeAssistant, target: str) -> WriteBudget:
+    """Return the write budget of a target calendar (shared by all entries syncing to it)."""
+    budgets: dict[str, WriteBudget] = hass.data.setdefault(DOMAIN, {}).setdefault("write_budgets", {})
+    budget = budgets.get(target)
+    if budget is None:
+        budget = budgets[target] = WriteBudget()
+    return budget
+
+
+@dataclass(slots=True)
+class WriteOperation:
+    """One calendar write; ``call`` returns False (or raises) when it did not apply."""
+
+    key: Hashable
+    kind: str
+    call: Callable[[], Awaitable[bool | None]]
+
+
+@dataclass(slots=True)
+class WriteReport:
+    """Outcome of a batch of calendar writes."""
+
+    succeeded: list[Hashable] = field(default_factory=list)
+    failed: dict[Hashable, str] = field(default_factory=dict)
+    retries: int = 0
+    retried: dict[Hashable, int] = field(default_factory=dict)
+
+
+async def _aiter(items: Iterable[WriteOperation]) -> AsyncIterator[WriteOperation]:
+    for item in items:
+        yield item
+
+
+class CalendarWriteScheduler:
+    """Run calendar writes with AIMD concurrency, jittered retries and a per-target rate budget.
+
+    The concurrency limit grows by one per window of successes and is halved (and the
+    shared budget drained) whenever the backend reports a transient error, so large
+    batches speed up on local calendars and back off before cloud quotas trip.
+    """
+
+    def __init__(
+        self,
+        budget: WriteBudget,
+        *,
+        concurrency: int = CALENDAR_WRITE_CONCURRENCY,
+        max_concurrency: int = CALENDAR_WRITE_MAX_CONCURRENCY,
+        max_attempts: int = CALENDAR_WRITE_MAX_ATTEMPTS,
+        backoff: float = CALENDAR_WRITE_BACKOFF,
+    ) -> None:
+        self._budget = budget
+        self.limit = float(concurrency)
+        self._max_concurrency = max_concurrency
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+
+    async def async_run(self, operations: Iterable[WriteOperation] | AsyncIterable[WriteOperation]) -> WriteReport:
+        """Execute the operations and report which ones ultimately failed.
+
+        Operations are pulled from ``operations`` only when a slot is free, so a streamed
+        source (e.g. a paged purge) is consumed at the pace of the writes.
+        """
+        report = WriteReport()
+        source = operations.__aiter__() if isinstance(operations, AsyncIterable) else _aiter(operations)
+        running: set[asyncio.Future] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < int(self.limit):
+                try:
+                    operation = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    running.add(asyncio.ensure_future(self._async_execute(operation, report)))
+            if not running:
+                return report
+            _done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+    async def _async_execute(self, operation: WriteOperation, report: WriteReport) -> None:
+        for attempt in range(1, self._max_attempts + 1):
+            await self._budget.async_acquire()
+            try:
+                result = await operation.call()
+            except Exception as err:
+                if not is_transient_error(err) or attempt == self._max_attempts:
+                    LOGGER.warning("Calendar %s failed for %s: %s", operation.kind, operation.key, err)
+                    report.failed[operation.key] = str(err)
+                    return
+                self.limit = max(1.0, self.limit / 2)
+                self._budget.drain()
+                report.retries += 1
+                report.retried[operation.key] = attempt
+                # Full jitter spreads the retries of concurrent writers (not a security use of random)
+                ceiling = min(CALENDAR_WRITE_BACKOFF_MAX, self._backoff * 2 ** (attempt - 1))
+                delay = random.uniform(0, ceiling)  # nosec B311
+                LOGGER.debug(
+                    "Calendar %s throttled for %s (attempt %d), retrying in %.1fs: %s",
+                    operation.kind,
+                    operation.key,
+                    attempt,
+                    delay,
+                    err,
+                )
+                await asyncio.sleep(delay)
+                continue
+            if result is False:
+                report.failed[operation.key] = "rejected"
+                return
+            self.limit = min(float(self._max_concurrency), self.limit + 1 / self.limit)
+            report.succeeded.append(operation.key)
+            return
+
+
+class CalendarSyncHub:
+    """Batch the syncs of every entry sharing a target calendar into one cycle.
+
+    Jobs submitted within ``CALENDAR_SYNC_HUB_WINDOW`` of each other run together: the
+    cycle reads the target once for all of them and sends their writes through one
+    scheduler. Cycles never overlap, so the target only ever sees one write queue.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        target: str,
+        run_cycle: Callable[[HomeAssistant, str, list[SyncJob]], Awaitable[dict[str, WriteReport]]],
+    ) -> None:
+        self.hass = hass
+        self.target = target
+        self._run_cycle = run_cycle
+        self._lock = asyncio.Lock()
+        self._pending: dict[str, SyncJob] = {}
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._scheduled = False
+
+    async def async_sync(self, job: SyncJob) -> WriteReport | None:
+        """Queue the job for the next cycle and wait for its report.
+
+        A newer job from the same entry replaces the queued one; both callers get its report.
+        """
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._pending[job.entry_id] = job
+        self._waiters.setdefault(job.entry_id, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            self.hass.async_create_task(self._async_cycle())
+        return await future
+
+    async def _async_cycle(self) -> None:
+        async with self._lock:
+            # Let sibling entries refreshed by the same change join this cycle
+            await asyncio.sleep(CALENDAR_SYNC_HUB_WINDOW)
+            self._scheduled = False
+            jobs, waiters = self._pending, self._waiters
+            self._pending, self._waiters = {}, {}
+            try:
+                reports = await self._run_cycle(self.hass, self.target, list(jobs.values()))
+            except asyncio.CancelledError:
+                for futures in waiters.values():
+                    for future in futures:
+                        future.cancel()
+                raise
+            except Exception as err:
+                for futures in waiters.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(err)
+                return
+            for entry_id, futures in waiters.items():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(reports.get(entry_id))
+
+
+def calendar_sync_hub(
+    hass: HomeAssistant,
+    target: str,
+    run_cycle: Callable[[HomeAssistant, str, list[SyncJob]], Awaitable[dict[str, WriteReport]]],
+) -> CalendarSyncHub:
+    """Return the sync hub of a target calendar (shared by all entries syncing to it)."""
+    hubs: dict[str, CalendarSyncHub] = hass.data.setdefault(DOMAIN, {}).setdefault("sync_hubs", {})
+    hub = hubs.get(target)
+    if hub is None:
+        hub = hubs[target] = CalendarSyncHub(hass, target, run_cycle)
+    return hub
@@ -23,6 +23,7 @@ from .const import (
     CONF_CALENDAR_SYNC,
     CONF_CALENDAR_SYNC_DAYS,
     CONF_CALENDAR_SYNC_INTERVAL_HOURS,
+    CONF_CALENDAR_SYNC_RRULE,
     CONF_CALENDAR_TARGET,
     CONF_CHILD_NAME,
     CONF_CHILD_NAME_DISPLAY,
@@ -652,6 +653,7 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ): selector.NumberSelector(
                     selector.NumberSelectorConfig(min=1, max=24, mode=selector.NumberSelectorMode.BOX, step=1)
                 ),
+                vol.Optional(CONF_CALENDAR_SYNC_RRULE, default=data.get(CONF_CALENDAR_SYNC_RRULE, False)): cv.boolean,
                 vol.Optional(
                     CONF_HOLIDAY_API_URL,
                     default=data.get(CONF_HOLIDAY_API_URL, ""),
@@ -1263,6 +1265,7 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
                 ): selector.NumberSelector(
                     selector.NumberSelectorConfig(min=1, max=24, mode=selector.NumberSelectorMode.BOX, step=1)
                 ),
+                vol.Optional(CONF_CALENDAR_SYNC_RRULE, default=data.get(CONF_CALENDAR_SYNC_RRULE, False)): cv.boolean,
                 vol.Optional(
                     CONF_HOLIDAY_API_URL,
                     default=data.get(CONF_HOLIDAY_API_URL, ""),
@@ -17,6 +17,42 @@ PLATFORMS: list[Platform] = [
     Platform.DEVICE_TRACKER,
 ]
 UPDATE_INTERVAL = timedelta(minutes=15)
+
+# Persistent school-holiday cache (Home Assistant Store)
+HOLIDAY_CACHE_STORAGE_KEY = f"{DOMAIN}.holiday_cache"
+HOLIDAY_CACHE_STORAGE_VERSION = 1
+HOLIDAY_CACHE_SAVE_DELAY = 10  # seconds
+# Fresh entries are served without any request; expired ones are served while a refresh runs
+HOLIDAY_CACHE_TTL = timedelta(days=7)
+# Failed/empty fetches are only cached briefly so the next refresh retries
+HOLIDAY_CACHE_NEGATIVE_TTL = timedelta(minutes=30)
+# Persistent calendar-sync ledger (window key -> remote UID + content hash, one Store per entry)
+CALENDAR_SYNC_STORAGE_KEY = f"{DOMAIN}.calendar_sync"
+CALENDAR_SYNC_STORAGE_VERSION = 1
+CALENDAR_SYNC_SAVE_DELAY = 10  # seconds
+# Syncs between reconciliations only push the delta; a full read of the target runs this often
+CALENDAR_SYNC_RECONCILE_INTERVAL = timedelta(hours=24)
+# Coalesce bursts of schedule changes (options edit, set_manual_dates...) into one sync
+CALENDAR_SYNC_DEBOUNCE = 10  # seconds
+# Entries syncing to the same calendar within this window share one read and one write queue
+CALENDAR_SYNC_HUB_WINDOW = 2  # seconds
+# Large reads (purge) page through the target calendar in slices of this size
+CALENDAR_READ_CHUNK = timedelta(days=90)
+# Calendar write scheduler: AIMD concurrency between 1 and MAX, jittered retries, per-target token bucket
+CALENDAR_WRITE_CONCURRENCY = 4
+CALENDAR_WRITE_MAX_CONCURRENCY = 16
+CALENDAR_WRITE_MAX_ATTEMPTS = 4
+CALENDAR_WRITE_BACKOFF = 1.0  # seconds, doubled per attempt (full jitter)
+CALENDAR_WRITE_BACKOFF_MAX = 30.0  # seconds
+CALENDAR_WRITE_RATE = 5.0  # writes per second and target calendar
+CALENDAR_WRITE_BURST = 10
+# Recurring-event mode: regular pattern runs shorter than this stay individual events
+CALENDAR_SYNC_RRULE_MIN_OCCURRENCES = 3
+# Operations listed in a plan_calendar_sync response (the counts always cover the whole plan)
+CALENDAR_SYNC_PLAN_MAX_OPERATIONS = 100
+# Bundled offline dataset (gzipped JSON, see scripts/build_holiday_dataset.py)
+HOLIDAY_DATASET_FILE = "holidays_dataset.json.gz"
+HOLIDAY_DATASET_VERSION = 1
 # API du calendrier scolaire français (data.education.gouv.fr)
 # Format année scolaire: "2024-2025" (septembre à juin)
 # Zones: A, B, C, Corse, Guadeloupe, Martinique, Guyane, La Réunion, Mayotte, etc.
@@ -27,6 +63,9 @@ HOLIDAY_API = (
     "&refine.zones={zone}"
     "&rows=100"
 )
+# Per-request timeout (seconds) and max parallel school-year requests
+HOLIDAY_API_TIMEOUT = 20
+HOLIDAY_API_MAX_PARALLEL = 4
 
 CONF_CHILD_NAME = "child_name"
 CONF_CHILD_NAME_DISPLAY = "child_name_display"
@@ -52,6 +91,7 @@ CONF_CALENDAR_SYNC = "calendar_sync"
 CONF_CALENDAR_TARGET = "calendar_target"
 CONF_CALENDAR_SYNC_DAYS = "calendar_sync_days"
 CONF_CALENDAR_SYNC_INTERVAL_HOURS = "calendar_sync_interval_hours"
+CONF_CALENDAR_SYNC_RRULE = "calendar_sync_rrule"
 CONF_EXCEPTIONS = "exceptions"
 CONF_EXCEPTIONS_LIST = "exceptions_list"
 CONF_EXCEPTIONS_RECURRING = "exceptions_recurring"
@@ -183,3 +223,4 @@ SERVICE_TEST_HOLIDAY_API = "test_holiday_api"
 SERVICE_EXPORT_EXCEPTIONS = "export_exceptions"
 SERVICE_IMPORT_EXCEPTIONS = "import_exceptions"
 SERVICE_PURGE_CALENDAR = "purge_calendar_events"
+SERVICE_PLAN_CALENDAR_SYNC = "plan_calendar_sync"
@@ -0,0 +1,64 @@
+"""Diagnostics support for Custody Schedule."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import _normalize_calendar_target
+from .const import (
+    CONF_CALENDAR_SYNC,
+    CONF_CALENDAR_SYNC_DAYS,
+    CONF_CALENDAR_SYNC_INTERVAL_HOURS,
+    CONF_CALENDAR_SYNC_RRULE,
+    CONF_CALENDAR_TARGET,
+    DOMAIN,
+)
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return calendar sync settings and metrics for an entry and its target calendar.
+
+    Only counters, timings and identifiers are reported: no child name, location or event content.
+    """
+    config = {**entry.data, **(entry.options or {})}
+    domain_data = hass.data.get(DOMAIN, {})
+    target = _normalize_calendar_target(config.get(CONF_CALENDAR_TARGET))
+    coordinator = domain_data.get(entry.entry_id, {}).get("coordinator")
+
+    entry_diagnostics: dict[str, Any] | None = None
+    if coordinator is not None:
+        ledger = coordinator.calendar_ledger
+        entry_diagnostics = {
+            "metrics": coordinator.calendar_metrics.as_dict(),
+            "ledger": {
+                "target": ledger.target,
+                "days": ledger.days,
+                "reconciled_at": ledger.reconciled_at.isoformat() if ledger.reconciled_at else None,
+                "entries": len(ledger.entries),
+                "unresolved": sum(1 for ledger_entry in ledger.entries.values() if ledger_entry.uid is None),
+            },
+        }
+
+    target_diagnostics: dict[str, Any] | None = None
+    if target:
+        target_metrics = domain_data.get("sync_metrics", {}).get(target)
+        budget = domain_data.get("write_budgets", {}).get(target)
+        target_diagnostics = {
+            "entity_id": target,
+            "metrics": target_metrics.as_dict() if target_metrics else None,
+            "write_budget": {"rate": budget.rate, "burst": budget.burst} if budget else None,
+        }
+
+    return {
+        "calendar_sync": {
+            "enabled": bool(config.get(CONF_CALENDAR_SYNC)),
+            "days": config.get(CONF_CALENDAR_SYNC_DAYS),
+            "interval_hours": config.get(CONF_CALENDAR_SYNC_INTERVAL_HOURS),
+            "recurring": bool(config.get(CONF_CALENDAR_SYNC_RRULE)),
+            "entry": entry_diagnostics,
+            "target": target_diagnostics,
+        }
+    }
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import date, datetime, time, timedelta
-from typing import Any, Iterable
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Container, Iterable, Iterator, overload
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 
+@lru_cache(maxsize=64)
 def _easter_date(year: int) -> date:
     """Calculate Easter Sunday date using the Anonymous Gregorian algorithm."""
     a = year % 19
@@ -63,6 +73,30 @@ def get_public_holidays(year: int, country: str = "FR", include_alsace_moselle:
     return holidays
 
 
+@dataclass(frozen=True, slots=True)
+class PublicHolidayCalendar:
+    """Immutable set of public holidays shared by a whole schedule computation."""
+
+    dates: frozenset[date]
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[date]) -> PublicHolidayCalendar:
+        """Build a calendar from any iterable of dates."""
+        return cls(dates=frozenset(dates))
+
+    def __contains__(self, day: object) -> bool:
+        return day in self.dates
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+@lru_cache(maxsize=64)
+def get_holiday_calendar(country: str, alsace_moselle: bool, year: int) -> PublicHolidayCalendar:
+    """Return the memoized public-holiday calendar for one (country, alsace_moselle, year)."""
+    return PublicHolidayCalendar.from_dates(get_public_holidays(year, country, alsace_moselle))
+
+
 def get_parent_days(year: int, country: str = "FR") -> dict[str, date]:
     """Calculate parent holidays (Mother/Father days).
 
@@ -79,22 +113,7 @@ def get_parent_days(year: int, country: str = "FR") -> dict[str, date]:
     mothers_day = last_may - timedelta(days=days_back_to_sunday)
 
     # Check for Pentecost (Easter + 49 days)
-    # Re-using logic to calculate Easter locally
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    L = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * L) // 451
-    month = (h + L - 7 * m + 114) // 31
-    day = ((h + L - 7 * m + 114) % 31) + 1
-    easter_sunday = date(year, month, day)
+    easter_sunday = _easter_date(year)
 
     pentecost_sunday = easter_sunday + timedelta(days=49)
     if mothers_day == pentecost_sunday:
@@ -132,7 +151,7 @@ from .const import (
     DEFAULT_COUNTRY,
     LOGGER,
 )
-from .school_holidays import SchoolHolidayClient
+from .school_holidays import SchoolHoliday, SchoolHolidayClient
 
 
 @dataclass(slots=True)
@@ -145,6 +164,171 @@ class CustodyWindow:
     source: str = "pattern"
 
 
+class WindowSource(str, Enum):
+    """Origin of a custody window (stored as a one-byte code by WindowStore)."""
+
+    PATTERN = "pattern"
+    VACATION = "vacation"
+    SUMMER = "summer"
+    SPECIAL = "special"
+    CUSTOM = "custom"
+    MANUAL = "manual"
+    EXCEPTION_RECURRING = "exception_recurring"
+    OVERRIDE = "override"
+    VACATION_FILTER = "vacation_filter"
+
+
+_SOURCES = tuple(WindowSource)
+_SOURCE_CODES = {source.value: code for code, source in enumerate(_SOURCES)}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Return an aware datetime as integer microseconds since the epoch (exact)."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class WindowStore(Sequence):
+    """Columnar, immutable storage for a sorted list of custody windows.
+
+    Starts and ends are kept as epoch microseconds in ``array('q')``, labels and
+    time zones are interned in small tables and sources are one-byte codes.
+    CustodyWindow objects are only created when an item is accessed, and lookups
+    bisect the integer columns directly. Windows must be given sorted by start.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_ends",
+        "_max_ends",
+        "_label_ids",
+        "_labels",
+        "_source_ids",
+        "_tz_ids",
+        "_end_tz_ids",
+        "_tzs",
+    )
+
+    def __init__(self, windows: Iterable[CustodyWindow] = ()) -> None:
+        self._starts = array("q")
+        self._ends = array("q")
+        self._max_ends = array("q")
+        self._label_ids = array("I")
+        self._source_ids = array("B")
+        self._tz_ids = array("B")
+        self._end_tz_ids = array("B")
+        self._labels: list[str] = []
+        self._tzs: list[tzinfo | None] = []
+        label_ids: dict[str, int] = {}
+        tz_ids: dict[tzinfo | None, int] = {}
+        for window in windows:
+            end = _to_epoch_us(window.end)
+            self._starts.append(_to_epoch_us(window.start))
+            self._ends.append(end)
+            self._max_ends.append(max(end, self._max_ends[-1]) if self._max_ends else end)
+            label_id = label_ids.get(window.label)
+            if label_id is None:
+                label_id = label_ids[window.label] = len(self._labels)
+                self._labels.append(window.label)
+            self._label_ids.append(label_id)
+            self._source_ids.append(_SOURCE_CODES[window.source])
+            # Start and end keep their own zone: fixed offsets differ across a DST change
+            for column, value in ((self._tz_ids, window.start.tzinfo), (self._end_tz_ids, window.end.tzinfo)):
+                tz_id = tz_ids.get(value)
+                if tz_id is None:
+                    tz_id = tz_ids[value] = len(self._tzs)
+                    self._tzs.append(value)
+                column.append(tz_id)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> CustodyWindow:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CustodyWindow]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> CustodyWindow | list[CustodyWindow]:
+        if isinstance(index, slice):
+            return [self._view(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("window index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[CustodyWindow]:
+        for position in range(len(self._starts)):
+            yield self._view(position)
+
+    def _datetime(self, value: int, tz_id: int) -> datetime:
+        return (_EPOCH + timedelta(microseconds=value)).astimezone(self._tzs[tz_id])
+
+    def _view(self, position: int) -> CustodyWindow:
+        return CustodyWindow(
+            start=self._datetime(self._starts[position], self._tz_ids[position]),
+            end=self._datetime(self._ends[position], self._end_tz_ids[position]),
+            label=self._labels[self._label_ids[position]],
+            source=_SOURCES[self._source_ids[position]].value,
+        )
+
+    def position_ending_after(self, moment: datetime) -> int | None:
+        """Return the position of the first window (in start order) ending strictly after ``moment``."""
+        pos = bisect_right(self._max_ends, _to_epoch_us(moment))
+        return pos if pos < len(self) else None
+
+    def positions_overlapping(self, start: datetime, end: datetime) -> Iterator[int]:
+        """Yield positions of windows with ``window.end >= start`` and ``window.start <= end``."""
+        low = _to_epoch_us(start)
+        high = bisect_right(self._starts, _to_epoch_us(end))
+        for position in range(bisect_left(self._max_ends, low), high):
+            if self._ends[position] >= low:
+                yield position
+
+    def first_ending_after(self, moment: datetime) -> CustodyWindow | None:
+        """Return the first window (in start order) whose end is strictly after ``moment``."""
+        pos = self.position_ending_after(moment)
+        return self._view(pos) if pos is not None else None
+
+    def first_starting_after(self, moment: datetime, ending_after: datetime | None = None) -> CustodyWindow | None:
+        """Return the first window starting strictly after ``moment`` (and ending after ``ending_after``)."""
+        pos = bisect_right(self._starts, _to_epoch_us(moment))
+        min_end = _to_epoch_us(ending_after) if ending_after is not None else None
+        while pos < len(self) and min_end is not None and self._ends[pos] <= min_end:
+            pos += 1
+        return self._view(pos) if pos < len(self) else None
+
+    def window_at(self, moment: datetime, ending_after: datetime | None = None) -> CustodyWindow | None:
+        """Return the earliest-starting window covering ``moment`` (and ending after ``ending_after``)."""
+        threshold = max(moment, ending_after) if ending_after is not None else moment
+        pos = bisect_right(self._max_ends, _to_epoch_us(threshold))
+        if pos < len(self) and self._starts[pos] <= _to_epoch_us(moment):
+            return self._view(pos)
+        return None
+
+    def next_boundary_after(self, moment: datetime, end_offset: timedelta = timedelta()) -> datetime | None:
+        """Return the first window start, or window end minus ``end_offset``, strictly after ``moment``."""
+        target = _to_epoch_us(moment)
+        offset = end_offset // _MICROSECOND
+        pos = bisect_right(self._starts, target)
+        best = self._starts[pos] if pos < len(self) else None
+        # Windows before ``pos`` all end by target + offset (running max); past it, a window
+        # starting after the best candidate cannot end before it, so the scan stops there
+        pos = bisect_right(self._max_ends, target + offset)
+        while pos < len(self) and (best is None or self._starts[pos] - offset < best):
+            end = self._ends[pos] - offset
+            if end > target and (best is None or end < best):
+                best = end
+            pos += 1
+        if best is None:
+            return None
+        return dt_util.as_local(_EPOCH + timedelta(microseconds=best))
+
+
 @dataclass(slots=True)
 class CustodyComputation:
     """Final state consumed by entities."""
@@ -160,10 +344,130 @@ class CustodyComputation:
     next_vacation_end: datetime | None = None
     days_until_vacation: int | None = None
     school_holidays_raw: list[dict[str, Any]] = field(default_factory=list)
-    windows: list[CustodyWindow] = field(default_factory=list)
+    windows: WindowStore = field(default_factory=WindowStore)
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class HolidayPeriod:
+    """School holiday with its precomputed effective bounds and custody segment."""
+
+    holiday: SchoolHoliday
+    start: datetime
+    end: datetime
+    midpoint: datetime
+    rule: str
+    segment_start: datetime
+    segment_end: datetime
+
+
+@dataclass(slots=True)
+class HolidaySnapshot:
+    """Holidays fetched once per computation and shared by every stage."""
+
+    periods: list[HolidayPeriod] = field(default_factory=list)
+    sorted_periods: list[HolidayPeriod] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Sorted by effective start date (more relevant than raw API start)
+        self.sorted_periods = sorted(self.periods, key=lambda period: period.start)
+
+    @property
+    def holidays(self) -> list[SchoolHoliday]:
+        """Return the raw holidays in provider order."""
+        return [period.holiday for period in self.periods]
+
+
+@dataclass(slots=True)
+class MaterializedSchedule:
+    """Windows built for one materialization key and reused by intra-day evaluations.
+
+    The key is (config fingerprint, manual exceptions, holiday data version, local date).
+    """
+
+    key: tuple[Any, ...]
+    built_at: datetime
+    holidays: list[SchoolHoliday]
+    windows: WindowStore
+
+
+def merge_periods(periods: Iterable[tuple[datetime, datetime]]) -> list[list[datetime]]:
+    """Sort periods and merge overlapping or touching ones (empty periods are dropped)."""
+    merged: list[list[datetime]] = []
+    for period_start, period_end in sorted(period for period in periods if period[1] > period[0]):
+        if merged and period_start <= merged[-1][1]:
+            if period_end > merged[-1][1]:
+                merged[-1][1] = period_end
+        else:
+            merged.append([period_start, period_end])
+    return merged
+
+
+def subtract_periods(windows: list[CustodyWindow], periods: Iterable[tuple[datetime, datetime]]) -> list[CustodyWindow]:
+    """Subtract priority periods from windows with a single sweep.
+
+    Periods are sorted and merged once, then both lists are walked together:
+    windows that do not overlap any period are kept as-is, overlapping ones are
+    replaced by the fragments left outside the periods (same label/source).
+    Empty periods are ignored since they cover no time.
+    """
+    return list(iter_subtract_periods(windows, periods))
+
+
+def iter_subtract_periods(
+    windows: Iterable[CustodyWindow], periods: Iterable[tuple[datetime, datetime]]
+) -> Iterator[CustodyWindow]:
+    """Streaming form of subtract_periods: windows are consumed and yielded one at a time."""
+    merged = merge_periods(periods)
+    if not merged:
+        yield from windows
+        return
+
+    merged_ends = [period[1] for period in merged]
+    pointer = 0
+    previous_start: datetime | None = None
+    for item in windows:
+        # Windows are generated chronologically; rewind with bisect if they are not
+        if previous_start is not None and item.start < previous_start:
+            pointer = bisect_right(merged_ends, item.start)
+        previous_start = item.start
+        while pointer < len(merged) and merged_ends[pointer] <= item.start:
+            pointer += 1
+
+        cursor = item.start
+        overlapped = False
+        pos = pointer
+        while pos < len(merged) and merged[pos][0] < item.end:
+            period_start, period_end = merged[pos]
+            pos += 1
+            if period_end <= cursor:
+                continue
+            overlapped = True
+            if cursor < period_start:
+                yield CustodyWindow(cursor, period_start, item.label, item.source)
+            cursor = period_end
+
+        if not overlapped:
+            yield item
+        elif cursor < item.end:
+            yield CustodyWindow(cursor, item.end, item.label, item.source)
+
+
+class PublicHolidayLookup:
+    """Membership test over the public holidays of any year (memoized calendar per year)."""
+
+    __slots__ = ("_country", "_alsace_moselle")
+
+    def __init__(self, country: str, alsace_moselle: bool) -> None:
+        self._country = country
+        self._alsace_moselle = alsace_moselle
+
+    def __contains__(self, day: object) -> bool:
+        if not isinstance(day, date):
+            return False
+        return day in get_holiday_calendar(self._country, self._alsace_moselle, day.year)
+
+
 WEEKDAY_LOOKUP = {
     "monday": 0,
     "tuesday": 1,
@@ -184,6 +488,7 @@ class CustodyScheduleManager:
         self._holidays = holidays
         self._manual_windows: list[CustodyWindow] = []
         self._presence_override: dict[str, Any] | None = None
+        self._materialized: MaterializedSchedule | None = None
         self._tz = dt_util.get_time_zone(str(hass.config.time_zone))
 
         self._arrival_time = self._parse_time(config.get(CONF_ARRIVAL_TIME, "08:00"))
@@ -197,14 +502,33 @@ class CustodyScheduleManager:
         self._departure_time = self._parse_time(self._config.get(CONF_DEPARTURE_TIME, "19:00"))
         self._end_day = self._config.get(CONF_END_DAY, "sunday").lower()
 
-    def _apply_holiday_extension(self, end_date: datetime, holidays: set[date]) -> datetime:
+    @property
+    def holiday_source(self) -> tuple[str, str | None]:
+        """Return the (country, zone) school holidays are fetched for (zone is None when not set)."""
+        return self._config.get(CONF_COUNTRY, DEFAULT_COUNTRY), self._config.get(CONF_ZONE) or None
+
+    def invalidate(self) -> None:
+        """Drop the materialized windows so the next calculation rebuilds them (forced refresh)."""
+        self._materialized = None
+
+    def _public_holidays(self) -> PublicHolidayLookup:
+        """Return the public holidays used to extend pattern windows.
+
+        Each window is checked against the holidays of its own year (shared, memoized
+        calendars), so the materialized list and iter_windows extend windows alike.
+        """
+        return PublicHolidayLookup(
+            self._config.get(CONF_COUNTRY, "FR"), bool(self._config.get(CONF_ALSACE_MOSELLE, False))
+        )
+
+    def _apply_holiday_extension(self, end_date: datetime, holidays: Container[date]) -> datetime:
         """Extend the end date if it falls on a holiday."""
         current_end = end_date
         while current_end.date() in holidays:
             current_end += timedelta(days=1)
         return current_end
 
-    def _calculate_end_date(self, start_date: datetime, holidays: set[date]) -> datetime:
+    def _calculate_end_date(self, start_date: datetime, holidays: Container[date]) -> datetime:
         """Calculate the end date based on start_date, configured end_day and holidays."""
         target_end_weekday = WEEKDAY_LOOKUP.get(self._end_day, 6)  # Default Sunday
 
@@ -256,36 +580,29 @@ class CustodyScheduleManager:
         """Build the schedule state used by entities."""
         # now is already in local time (from dt_util.now()), no need to convert
         now_local = now if now.tzinfo else dt_util.as_local(now)
-        windows = await self._build_windows(now_local)
-        windows.extend(self._manual_windows)
-        windows.extend(self._build_recurring_windows(now_local))
-        windows.sort(key=lambda window: window.start)
+        # Windows are rebuilt once per day; intra-day calls only re-evaluate the "now" fields
+        materialized = await self._async_materialize(now_local)
+        # Holidays are fetched once and shared by windows, period and next vacation
+        snapshot = self._holiday_snapshot(materialized.holidays, now_local)
 
-        # Conserver toutes les fenêtres pour l'affichage (historique)
-        all_windows = list(windows)
+        # Conserver toutes les fenêtres pour l'affichage (historique) : stockage colonnaire partagé, sans copie
+        all_windows = materialized.windows
 
-        # Filtrer STRICTEMENT les fenêtres qui se terminent dans le passé pour les CALCULS d'état
+        # Ignorer STRICTEMENT les fenêtres qui se terminent dans le passé pour les CALCULS d'état
         # Ne garder que les fenêtres qui se terminent APRÈS maintenant (pas égal, pas proche)
         # Ajouter une marge de 1 minute pour éviter les problèmes de timing
-        windows = [w for w in windows if w.end > now_local + timedelta(minutes=1)]
+        cutoff = now_local + timedelta(minutes=1)
 
         # current_window : fenêtre qui commence avant ou à maintenant et se termine après maintenant
         # Mais exclure les fenêtres qui se terminent dans moins d'1 minute (considérées comme terminées)
-        current_window = next(
-            (
-                window
-                for window in windows
-                if window.start <= now_local < window.end and window.end > now_local + timedelta(minutes=1)
-            ),
-            None,
-        )
+        current_window = all_windows.window_at(now_local, ending_after=cutoff)
         # next_window doit être une fenêtre qui commence dans le futur ET qui se termine dans le futur
-        next_window = next((window for window in windows if window.start > now_local and window.end > now_local), None)
+        next_window = all_windows.first_starting_after(now_local, ending_after=cutoff)
 
         override_state = self._evaluate_override(now_local)
         is_present = override_state if override_state is not None else current_window is not None
 
-        # Si current_window existe mais se termine très bientôt (déjà filtré à la ligne 184, mais sécurité supplémentaire)
+        # Si current_window existe mais se termine très bientôt (déjà filtré plus haut, mais sécurité supplémentaire)
         # forcer is_present à False pour éviter d'afficher une date de départ dans le passé ou très proche
         if current_window and current_window.end <= now_local + timedelta(minutes=1):
             # La fenêtre se termine dans moins d'1 minute, considérer que l'enfant n'est plus en garde
@@ -303,39 +620,35 @@ class CustodyScheduleManager:
                 # S'assurer que next_departure est dans le futur (avec une marge de 1 minute)
                 if next_departure and next_departure > now_local + timedelta(minutes=1):
                     # Chercher la fenêtre qui commence après next_departure
-                    next_arrival = next((w.start for w in windows if w.start > next_departure), None)
+                    following = all_windows.first_starting_after(next_departure, ending_after=cutoff)
+                    next_arrival = following.start if following else None
                 else:
                     # Si la fin est dans le passé ou très proche, utiliser la prochaine fenêtre
                     next_departure = next_window.end if next_window else None
                     next_arrival = next_window.start if next_window else None
                     # Si on n'a pas de next_window, chercher la prochaine fenêtre future
                     if not next_departure:
-                        next_departure = next(
-                            (w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None
-                        )
-                        if next_departure:
-                            matching_window = next((w for w in windows if w.end == next_departure), None)
-                            if matching_window:
-                                next_arrival = matching_window.start
+                        matching_window = all_windows.first_ending_after(cutoff)
+                        if matching_window:
+                            next_departure = matching_window.end
+                            next_arrival = matching_window.start
             elif override_state is True and self._presence_override and self._presence_override.get("until"):
                 # Override avec une date de fin spécifiée
                 next_departure = self._presence_override["until"]
                 if next_departure > now_local + timedelta(minutes=1):
                     # Chercher la fenêtre qui commence après l'override
-                    next_arrival = next((w.start for w in windows if w.start > next_departure), None)
+                    following = all_windows.first_starting_after(next_departure, ending_after=cutoff)
+                    next_arrival = following.start if following else None
                 else:
                     # Override dans le passé ou très proche, utiliser la prochaine fenêtre
                     next_departure = next_window.end if next_window else None
                     next_arrival = next_window.start if next_window else None
                     # Si on n'a pas de next_window, chercher la prochaine fenêtre future
                     if not next_departure:
-                        next_departure = next(
-                            (w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None
-                        )
-                        if next_departure:
-                            matching_window = next((w for w in windows if w.end == next_departure), None)
-                            if matching_window:
-                                next_arrival = matching_window.start
+                        matching_window = all_windows.first_ending_after(cutoff)
+                        if matching_window:
+                            next_departure = matching_window.end
+                            next_arrival = matching_window.start
             else:
                 # Override sans date de fin ou cas spécial, utiliser la prochaine fenêtre
                 next_departure = next_window.end if next_window else None
@@ -350,14 +663,14 @@ class CustodyScheduleManager:
             # Normalement next_window.end devrait toujours être dans le futur, mais sécurité supplémentaire
             if next_departure and next_departure <= now_local + timedelta(minutes=1):
                 # Si next_departure est dans le passé ou très proche, chercher la prochaine fenêtre après
-                next_departure = next((w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None)
-                if next_departure:
-                    # Trouver la fenêtre correspondante pour next_arrival
-                    matching_window = next((w for w in windows if w.end == next_departure), None)
-                    if matching_window:
-                        next_arrival = matching_window.start
+                matching_window = all_windows.first_ending_after(cutoff)
+                if matching_window:
+                    # Fenêtre correspondante pour next_arrival
+                    next_departure = matching_window.end
+                    next_arrival = matching_window.start
                 else:
                     # Si aucune fenêtre future, next_arrival devrait aussi être None
+                    next_departure = None
                     next_arrival = None
 
         days_remaining = None
@@ -366,7 +679,7 @@ class CustodyScheduleManager:
             delta = target_dt - now_local
             days_remaining = max(0, round(delta.total_seconds() / 86400, 2))
 
-        period, vacation_name = await self._determine_period(now_local)
+        period, vacation_name = self._determine_period(now_local, snapshot)
 
         # Get next vacation information and raw holidays data
         (
@@ -375,7 +688,7 @@ class CustodyScheduleManager:
             next_vacation_end,
             days_until_vacation,
             school_holidays_raw,
-        ) = await self._get_next_vacation(now_local)
+        ) = self._get_next_vacation(now_local, snapshot)
 
         attributes = {
             ATTR_LOCATION: self._config.get(CONF_LOCATION),
@@ -399,7 +712,52 @@ class CustodyScheduleManager:
             attributes=attributes,
         )
 
-    async def _build_windows(self, now: datetime) -> list[CustodyWindow]:
+    def _materialization_key(self, now: datetime) -> tuple[Any, ...]:
+        """Return the inputs the window list depends on (apart from the time of day)."""
+        config_fingerprint = hashlib.sha1(
+            json.dumps(self._config, sort_keys=True, default=str).encode(), usedforsecurity=False
+        ).hexdigest()
+        manual = tuple((window.start, window.end, window.label) for window in self._manual_windows)
+        return (config_fingerprint, manual, self._holidays.data_version, now.date())
+
+    async def _async_materialize(self, now: datetime) -> MaterializedSchedule:
+        """Return the materialized windows, rebuilding them only when their key changes."""
+        materialized = self._materialized
+        if materialized is not None and materialized.key == self._materialization_key(now):
+            return materialized
+
+        holidays = await self._async_fetch_holidays()
+        windows = await self._build_windows(now, self._holiday_snapshot(holidays, now))
+        windows.extend(self._manual_windows)
+        windows.extend(self._build_recurring_windows(now))
+        windows.sort(key=lambda window: window.start)
+
+        # Key computed after the fetch: a cold fetch bumps the holiday data version
+        self._materialized = MaterializedSchedule(
+            key=self._materialization_key(now), built_at=now, holidays=holidays, windows=WindowStore(windows)
+        )
+        return self._materialized
+
+    def next_transition(self, now: datetime) -> datetime:
+        """Return the next instant the computed state can change.
+
+        Candidates: window starts, window ends (minus the 1-minute margin used by
+        async_calculate), override expiry, holiday bounds and the next local midnight.
+        """
+        candidates = [dt_util.start_of_local_day(now.date() + timedelta(days=1))]
+        materialized = self._materialized
+        if materialized is not None:
+            boundary = materialized.windows.next_boundary_after(now, end_offset=timedelta(minutes=1))
+            if boundary is not None:
+                candidates.append(boundary)
+            for period in self._holiday_snapshot(materialized.holidays, now).periods:
+                candidates.append(period.start)
+                candidates.append(period.end)
+        if self._presence_override and self._presence_override.get("until"):
+            candidates.append(dt_util.as_local(self._presence_override["until"]))
+        return min(candidate for candidate in candidates if candidate > now)
+
+    async def _build_windows(self, now: datetime, snapshot: HolidaySnapshot | None = None) -> list[CustodyWindow]:
         """Generate presence windows from base pattern and vacation/custom rules.
 
         Two separate planning systems:
@@ -412,7 +770,9 @@ class CustodyScheduleManager:
         # 1. Generate vacation windows first (needed to check overlaps for public holidays)
         # This creates custody windows during school holidays (e.g., first half, second half)
         # Also creates filter windows that cover the entire vacation period
-        vacation_windows = await self._generate_vacation_windows(now)
+        if snapshot is None:
+            snapshot = await self._async_holiday_snapshot(now)
+        vacation_windows = self._generate_vacation_windows(now, snapshot)
 
         # Add parental day windows (Mother/Father days) to vacation windows for priority filtering
         parental_windows = self._build_parental_day_windows(now)
@@ -440,8 +800,77 @@ class CustodyScheduleManager:
         # Filtrer les fenêtres qui se terminent dans le passé (avec marge de 365 jours pour l'historique)
         return [window for window in merged if window.end > now - timedelta(days=365)]
 
-    def _build_parental_day_windows(self, now: datetime) -> list[CustodyWindow]:
-        """Automatically create windows for Mother's day and Father's day."""
+    def materialized_coverage(self) -> tuple[datetime, datetime] | None:
+        """Return the range in which computed windows match iter_windows (None before the first calculation).
+
+        It starts when the windows were built and ends with the shortest generation
+        horizon (recurring exceptions, 365 days ahead).
+        """
+        materialized = self._materialized
+        if materialized is None:
+            return None
+        return materialized.built_at, materialized.built_at + timedelta(days=365)
+
+    def iter_windows(self, start: datetime, end: datetime) -> Iterator[CustodyWindow]:
+        """Lazily generate the windows overlapping [start, end], sorted by start.
+
+        Unlike the materialized list (365 days back, 400 days ahead), any range can be
+        queried: pattern generation jumps straight to the cycle containing start and is
+        streamed, so the cost is proportional to the range. The other sources are small
+        and sorted up front, then merged with the pattern stream. Vacation windows use
+        the school holidays of the last calculation.
+        """
+        start, end = dt_util.as_local(start), dt_util.as_local(end)
+        if end < start:
+            return
+        materialized = self._materialized
+        # Anchor cycles like the last calculation so both views agree
+        now = materialized.built_at if materialized is not None else dt_util.now()
+        holidays = materialized.holidays if materialized is not None else []
+
+        # Same priority rules as _build_windows: vacations > custom rules > pattern
+        vacation_windows = self._generate_vacation_windows(start, self._holiday_snapshot(holidays, now))
+        vacation_windows.extend(self._build_parental_day_windows(now, range(start.year, end.year + 1)))
+        pattern_windows = iter_subtract_periods(
+            self._iter_pattern_windows_between(start, end, now), self._vacation_periods(vacation_windows)
+        )
+        by_start = attrgetter("start")
+        sources = (
+            sorted((window for window in vacation_windows if window.source != "vacation_filter"), key=by_start),
+            sorted(self._load_custom_rules(), key=by_start),
+            pattern_windows,
+            sorted(self._manual_windows, key=by_start),
+            sorted(self._build_recurring_windows(now, start.date(), end.date()), key=by_start),
+        )
+
+        for window in heapq.merge(*sources, key=by_start):
+            if window.start > end:
+                return
+            if window.end >= start:
+                yield window
+
+    def _iter_pattern_windows_between(self, start: datetime, end: datetime, now: datetime) -> Iterator[CustodyWindow]:
+        """Yield pattern windows that may overlap [start, end] without generating earlier cycles."""
+        if not self._config.get(CONF_ENABLE_CUSTODY, True):
+            return iter(())
+
+        custody_type = self._config.get(CONF_CUSTODY_TYPE, "alternate_week")
+        holidays = self._public_holidays()
+
+        if custody_type in ("alternate_weekend", "alternate_week_parity"):
+            # Monday of the previous week: its window (holiday extension included) may reach start
+            first_day = start.date() - timedelta(days=start.weekday() + 7)
+            pointer = datetime.combine(first_day, time(0, 0), tzinfo=self._tz)
+        else:
+            # Jump to the cycle before the one containing start (same anchor as the materialized list)
+            anchor = self._reference_start(now, custody_type)
+            cycle_days = self._cycle_pattern(custody_type)[0]
+            cycles = (start.date() - anchor.date()).days // cycle_days - 1
+            pointer = anchor + timedelta(days=cycles * cycle_days)
+        return self._iter_pattern_windows(custody_type, pointer, end, holidays)
+
+    def _build_parental_day_windows(self, now: datetime, years: Iterable[int] | None = None) -> list[CustodyWindow]:
+        """Automatically create windows for Mother's day and Father's day (current and next year by default)."""
         if not self._config.get(CONF_AUTO_PARENT_DAYS, False):
             return []
 
@@ -452,7 +881,7 @@ class CustodyScheduleManager:
         windows = []
         # Calculate for current and next year to ensure upcoming ones are visible
         country = self._config.get(CONF_COUNTRY, "FR")
-        for year in (now.year, now.year + 1):
+        for year in years or (now.year, now.year + 1):
             dates = get_parent_days(year, country)
 
             # Mother's Day
@@ -479,15 +908,17 @@ class CustodyScheduleManager:
 
         return windows
 
-    def _build_recurring_windows(self, now: datetime) -> list[CustodyWindow]:
-        """Generate recurring exception windows."""
+    def _build_recurring_windows(
+        self, now: datetime, range_start: date | None = None, horizon_end: date | None = None
+    ) -> list[CustodyWindow]:
+        """Generate recurring exception windows (365 days around now by default)."""
         exceptions = self._config.get(CONF_EXCEPTIONS_RECURRING, [])
         if not isinstance(exceptions, list) or not exceptions:
             return []
 
         windows: list[CustodyWindow] = []
-        horizon_end = now.date() + timedelta(days=365)
-        range_start = now.date() - timedelta(days=365)
+        horizon_end = horizon_end or now.date() + timedelta(days=365)
+        range_start = range_start or now.date() - timedelta(days=365)
 
         for item in exceptions:
             try:
@@ -541,35 +972,16 @@ class CustodyScheduleManager:
         if not vacation_windows:
             return pattern_windows
 
-        # Build a list of priority periods (start, end) for quick overlap checking.
+        # Merge the periods once and subtract them from all windows in a single sweep
+        return subtract_periods(pattern_windows, self._vacation_periods(vacation_windows))
+
+    def _vacation_periods(self, vacation_windows: list[CustodyWindow]) -> list[tuple[datetime, datetime]]:
+        """Return the priority periods (start, end) in which pattern windows are suppressed."""
         vacation_periods = [(vw.start, vw.end) for vw in vacation_windows if vw.source == "vacation_filter"]
         if not vacation_periods:
             # Fallback to display windows if no filter windows (should not happen for vacations)
             vacation_periods = [(vw.start, vw.end) for vw in vacation_windows]
-
-        # Process each priority period one by one, subtracting from the set of pattern windows
-        current_active_windows = list(pattern_windows)
-
-        for vac_start, vac_end in vacation_periods:
-            next_pass_windows = []
-            for item in current_active_windows:
-                # 1. No overlap at all? Keep the window as is.
-                if item.start >= vac_end or item.end <= vac_start:
-                    next_pass_windows.append(item)
-                    continue
-
-                # 2. Partials overlaps - Subtract the overlapping range
-                # Handle the part before the vacation segment
-                if item.start < vac_start:
-                    next_pass_windows.append(CustodyWindow(item.start, vac_start, item.label, item.source))
-
-                # Handle the part after the vacation segment
-                if item.end > vac_end:
-                    next_pass_windows.append(CustodyWindow(vac_end, item.end, item.label, item.source))
-
-            current_active_windows = next_pass_windows
-
-        return current_active_windows
+        return vacation_periods
 
     def _is_in_vacation_period(self, check_date: datetime, vacation_windows: list[CustodyWindow]) -> bool:
         """Check if a date falls within any vacation period.
@@ -605,27 +1017,14 @@ class CustodyScheduleManager:
             return []
 
         custody_type = self._config.get(CONF_CUSTODY_TYPE, "alternate_week")
-        type_def = CUSTODY_TYPES.get(custody_type) or CUSTODY_TYPES["alternate_week"]
         # Use a longer horizon (400 days) to support 365-day calendar sync
         horizon = now + timedelta(days=400)
+        pointer = self._reference_start(now, custody_type)
+        # Public holidays resolved per year from the shared, memoized calendars
+        holidays = self._public_holidays()
 
-        # Cas particulier : week-ends basés sur la parité ISO des semaines
-        if custody_type == "alternate_weekend":
-            windows: list[CustodyWindow] = []
-            pointer = self._reference_start(now, custody_type)
-
-            # Get public holidays for current and next year
-            country = self._config.get(CONF_COUNTRY, "FR")
-            alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-            holidays = get_public_holidays(now.year, country, alsace_moselle) | get_public_holidays(
-                now.year + 1, country, alsace_moselle
-            )
-
-            # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
-            reference_year = self._config.get(
-                CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even")
-            )
-            target_parity = 0 if reference_year == "even" else 1  # 0 = even, 1 = odd
+        if custody_type in ("alternate_weekend", "alternate_week_parity"):
+            target_parity = self._target_week_parity()
 
             # Ajuster le pointer pour commencer avant ou à la date actuelle
             # Si le pointer est trop loin dans le passé, avancer jusqu'à une semaine proche de maintenant
@@ -637,7 +1036,49 @@ class CustodyScheduleManager:
                     # Si on a perdu la parité, ajuster d'une semaine
                     pointer += timedelta(days=7)
 
-            while pointer < horizon:
+        return list(self._iter_pattern_windows(custody_type, pointer, horizon, holidays))
+
+    def _target_week_parity(self) -> int:
+        """Return the ISO week parity of custody weeks (0 = even, 1 = odd) for week-parity types."""
+        # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
+        reference_year = self._config.get(CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even"))
+        return 0 if reference_year == "even" else 1
+
+    def _cycle_pattern(self, custody_type: str) -> tuple[int, list[dict[str, Any]]]:
+        """Return (cycle_days, segments) for cyclic custody types (custom pattern included)."""
+        type_def = CUSTODY_TYPES.get(custody_type) or CUSTODY_TYPES["alternate_week"]
+        cycle_days = type_def["cycle_days"]
+        pattern = type_def["pattern"]
+
+        # Handle custom pattern if selected
+        if custody_type == "custom" and self._config.get(CONF_CUSTOM_PATTERN):
+            custom_states = str(self._config.get(CONF_CUSTOM_PATTERN)).split(",")
+            cycle_days = len(custom_states)
+            pattern = []
+            if custom_states:
+                current_state = custom_states[0]
+                current_count = 0
+                for state in custom_states:
+                    if state == current_state:
+                        current_count += 1
+                    else:
+                        pattern.append({"days": current_count, "state": current_state})
+                        current_state = state
+                        current_count = 1
+                pattern.append({"days": current_count, "state": current_state})
+        return cycle_days, pattern
+
+    def _iter_pattern_windows(
+        self, custody_type: str, pointer: datetime, until: datetime, holidays: Container[date]
+    ) -> Iterator[CustodyWindow]:
+        """Yield pattern windows for the weeks or cycles starting from pointer until the given instant.
+
+        pointer must be a Monday for week-parity types and a cycle start (anchor + k cycles) otherwise.
+        """
+        # Cas particulier : week-ends basés sur la parité ISO des semaines
+        if custody_type == "alternate_weekend":
+            target_parity = self._target_week_parity()
+            while pointer < until:
                 iso_week = pointer.isocalendar().week
                 week_parity = iso_week % 2  # 0 = even, 1 = odd
                 if week_parity == target_parity:
@@ -680,41 +1121,19 @@ class CustodyScheduleManager:
 
                     # Get label from custody type definition
                     type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
-                    windows.append(
-                        CustodyWindow(
-                            start=self._apply_time(window_start, self._arrival_time),
-                            end=self._apply_time(window_end, self._departure_time),
-                            label=f"Garde - {type_label}{label_suffix}",
-                            source="pattern",
-                        )
+                    yield CustodyWindow(
+                        start=self._apply_time(window_start, self._arrival_time),
+                        end=self._apply_time(window_end, self._departure_time),
+                        label=f"Garde - {type_label}{label_suffix}",
+                        source="pattern",
                     )
                 pointer += timedelta(days=7)
-            return windows
+            return
 
         # Cas particulier : semaines alternées basées sur la parité ISO des semaines
         if custody_type == "alternate_week_parity":
-            windows: list[CustodyWindow] = []
-            pointer = self._reference_start(now, custody_type)
-
-            # Get public holidays for current and next year
-            country = self._config.get(CONF_COUNTRY, "FR")
-            alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-            holidays = get_public_holidays(now.year, country, alsace_moselle) | get_public_holidays(
-                now.year + 1, country, alsace_moselle
-            )
-
-            # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
-            reference_year = self._config.get(
-                CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even")
-            )
-            target_parity = 0 if reference_year == "even" else 1  # 0 = even, 1 = odd
-
-            while pointer < now - timedelta(days=365):
-                pointer += timedelta(days=14)
-                if pointer.isocalendar()[1] % 2 != target_parity:
-                    pointer += timedelta(days=7)
-
-            while pointer < horizon:
+            target_parity = self._target_week_parity()
+            while pointer < until:
                 iso_week = pointer.isocalendar().week
                 week_parity = iso_week % 2
                 if week_parity == target_parity:
@@ -738,41 +1157,17 @@ class CustodyScheduleManager:
 
                     # Get label from custody type definition
                     type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
-                    windows.append(
-                        CustodyWindow(
-                            start=self._apply_time(window_start, self._arrival_time),
-                            end=self._apply_time(window_end, self._departure_time),
-                            label=f"Garde - {type_label}{label_suffix}",
-                            source="pattern",
-                        )
+                    yield CustodyWindow(
+                        start=self._apply_time(window_start, self._arrival_time),
+                        end=self._apply_time(window_end, self._departure_time),
+                        label=f"Garde - {type_label}{label_suffix}",
+                        source="pattern",
                     )
                 pointer += timedelta(days=7)
-            return windows
+            return
 
-        cycle_days = type_def["cycle_days"]
-        pattern = type_def["pattern"]
-
-        # Handle custom pattern if selected
-        if custody_type == "custom" and self._config.get(CONF_CUSTOM_PATTERN):
-            custom_states = str(self._config.get(CONF_CUSTOM_PATTERN)).split(",")
-            cycle_days = len(custom_states)
-            pattern = []
-            if custom_states:
-                current_state = custom_states[0]
-                current_count = 0
-                for state in custom_states:
-                    if state == current_state:
-                        current_count += 1
-                    else:
-                        pattern.append({"days": current_count, "state": current_state})
-                        current_state = state
-                        current_count = 1
-                pattern.append({"days": current_count, "state": current_state})
-        windows: list[CustodyWindow] = []
-        reference_start = self._reference_start(now, custody_type)
-        pointer = reference_start
-
-        while pointer < horizon:
+        cycle_days, pattern = self._cycle_pattern(custody_type)
+        while pointer < until:
             offset = timedelta()
             for segment in pattern:
                 segment_start = pointer + offset
@@ -780,12 +1175,6 @@ class CustodyScheduleManager:
                 # Determine intended duration
                 # For alternate_week, we use the end_day logic
                 if custody_type == "alternate_week":
-                    # Get public holidays
-                    country = self._config.get(CONF_COUNTRY, "FR")
-                    alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-                    holidays = get_public_holidays(now.year, country, alsace_moselle) | get_public_holidays(
-                        now.year + 1, country, alsace_moselle
-                    )
                     segment_end = self._calculate_end_date(segment_start, holidays)
                     # For alternate_week, the next segment should start exactly when this one ends
                     actual_duration = segment_end - segment_start
@@ -796,11 +1185,6 @@ class CustodyScheduleManager:
                     segment_end = segment_start + timedelta(days=segment["days"] - 1)
 
                     # Apply holiday extension
-                    country = self._config.get(CONF_COUNTRY, "FR")
-                    alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-                    holidays = get_public_holidays(now.year, country, alsace_moselle) | get_public_holidays(
-                        now.year + 1, country, alsace_moselle
-                    )
                     segment_end = self._apply_holiday_extension(segment_end, holidays)
 
                     # For cycled patterns, we keep the original offset for the NEXT segment
@@ -812,27 +1196,20 @@ class CustodyScheduleManager:
                 if segment["state"] == "on":
                     # Get label from custody type definition
                     type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
-                    windows.append(
-                        CustodyWindow(
-                            start=self._apply_time(segment_start, self._arrival_time),
-                            end=self._apply_time(segment_end, self._departure_time),
-                            label=f"Garde - {type_label}",
-                            source="pattern",
-                        )
+                    yield CustodyWindow(
+                        start=self._apply_time(segment_start, self._arrival_time),
+                        end=self._apply_time(segment_end, self._departure_time),
+                        label=f"Garde - {type_label}",
+                        source="pattern",
                     )
                 offset += actual_duration
             pointer += timedelta(days=cycle_days)
 
-        return windows
-
-    async def _generate_vacation_windows(self, now: datetime) -> list[CustodyWindow]:
+    def _generate_vacation_windows(self, now: datetime, snapshot: HolidaySnapshot) -> list[CustodyWindow]:
         """Optional windows driven by vacation rules."""
         zone = self._config.get(CONF_ZONE)
         if not zone:
             return []
-        country = self._config.get(CONF_COUNTRY, DEFAULT_COUNTRY)
-        # Fetch holidays without year restriction to get current and next school years
-        holidays = await self._holidays.async_list(country, zone)
         windows: list[CustodyWindow] = []
         # vacation_rule is now automatic based on year parity
         # For all holidays (including summer), use automatic parity logic:
@@ -840,8 +1217,9 @@ class CustodyScheduleManager:
         rule = None
         summer_mode = self._config.get(CONF_SUMMER_SPLIT_MODE, "half")
 
-        for holiday in holidays:
-            start, end, midpoint = self._effective_holiday_bounds(holiday)
+        for period in snapshot.periods:
+            holiday = period.holiday
+            start, end, midpoint = period.start, period.end, period.midpoint
             if end < now:
                 continue
 
@@ -856,18 +1234,9 @@ class CustodyScheduleManager:
                 )
             )
 
-            # Automatic vacation rule based on year parity + split mode
-            # Get reference_year to determine which parent gets vacations this year
-            split_mode = self._config.get(CONF_VACATION_SPLIT_MODE, "odd_first")
+            # Automatic vacation rule based on year parity + split mode (resolved in the snapshot)
             is_even_year = start.year % 2 == 0
-
-            # Determine automatic rule:
-            # - split_mode "odd_first": odd years -> first half, even years -> second half
-            # - split_mode "odd_second": odd years -> second half, even years -> first half
-            if split_mode == "odd_second":
-                rule = "second_half" if not is_even_year else "first_half"
-            else:
-                rule = "first_half" if not is_even_year else "second_half"
+            rule = period.rule
 
             if not rule:
                 continue
@@ -1129,24 +1498,96 @@ class CustodyScheduleManager:
         except (ValueError, AttributeError):
             return time(8, 0)
 
-    async def _determine_period(self, now: datetime) -> tuple[str, str | None]:
+    def _determine_period(self, now: datetime, snapshot: HolidaySnapshot) -> tuple[str, str | None]:
         """Return ('school'|'vacation', holiday_name)."""
         zone = self._config.get(CONF_ZONE)
         if not zone:
             return "school", None
 
-        country = self._config.get(CONF_COUNTRY, DEFAULT_COUNTRY)
+        for period in snapshot.periods:
+            if period.start <= now <= period.end:
+                return "vacation", period.holiday.name
+
+        return "school", None
+
+    async def _async_holiday_snapshot(self, now: datetime) -> HolidaySnapshot:
+        """Fetch school holidays once and precompute their effective bounds and custody segments."""
+        return self._holiday_snapshot(await self._async_fetch_holidays(), now)
+
+    async def _async_fetch_holidays(self) -> list[SchoolHoliday]:
+        """Fetch school holidays for the configured zone (empty when no zone is set)."""
+        country, zone = self.holiday_source
+        if not zone:
+            return []
+
         # Fetch holidays without year restriction to get current and next school years
+        LOGGER.debug("Fetching school holidays for country=%s, zone=%s", country, zone)
         holidays = await self._holidays.async_list(country, zone)
-        for holiday in holidays:
-            effective_start, effective_end, _mid = self._effective_holiday_bounds(holiday)
-            if effective_start <= now <= effective_end:
-                return "vacation", holiday.name
+        LOGGER.debug("Retrieved %d holidays from API", len(holidays))
+        return holidays
 
-        return "school", None
+    def _holiday_snapshot(self, holidays: list[SchoolHoliday], now: datetime) -> HolidaySnapshot:
+        """Precompute effective bounds and the next custody segment of each holiday."""
+        if not self._config.get(CONF_ZONE):
+            return HolidaySnapshot()
 
-    async def _get_next_vacation(
-        self, now: datetime
+        # vacation_rule is now automatic based on reference_year + split mode
+        split_mode = self._config.get(CONF_VACATION_SPLIT_MODE, "odd_first")
+        summer_mode = self._config.get(CONF_SUMMER_SPLIT_MODE, "half")
+        return HolidaySnapshot(
+            periods=[self._holiday_period(holiday, now, split_mode, summer_mode) for holiday in holidays]
+        )
+
+    def _holiday_period(
+        self, holiday: SchoolHoliday, now: datetime, split_mode: str, summer_mode: str
+    ) -> HolidayPeriod:
+        """Resolve effective bounds, parity rule and next custody segment for a holiday."""
+        eff_start, eff_end, mid = self._effective_holiday_bounds(holiday)
+
+        # Determine automatic rule:
+        # - split_mode "odd_first": odd years -> first half, even years -> second half
+        # - split_mode "odd_second": odd years -> second half, even years -> first half
+        is_even_year = eff_start.year % 2 == 0
+        if split_mode == "odd_second":
+            rule = "second_half" if not is_even_year else "first_half"
+        else:
+            rule = "first_half" if not is_even_year else "second_half"
+
+        # Handle summer quarter-split if enabled
+        is_summer = "été" in holiday.name.lower() or holiday.start.month in (7, 8)
+        if is_summer and summer_mode == "quarter":
+            total_duration = eff_end - eff_start
+            seg_duration = total_duration / 4
+
+            parts = [
+                (eff_start, eff_start + seg_duration),
+                (eff_start + seg_duration, eff_start + 2 * seg_duration),
+                (eff_start + 2 * seg_duration, eff_start + 3 * seg_duration),
+                (eff_start + 3 * seg_duration, eff_end),
+            ]
+
+            # Find the next segment for this user
+            if rule == "first_half":
+                # User has parts 1 and 3. Keep the one that is in the future.
+                segment = parts[0] if parts[0][1] > now else parts[2]
+            else:
+                # User has parts 2 and 4
+                segment = parts[1] if parts[1][1] > now else parts[3]
+        else:
+            segment = (mid, eff_end) if rule == "second_half" else (eff_start, mid)
+
+        return HolidayPeriod(
+            holiday=holiday,
+            start=eff_start,
+            end=eff_end,
+            midpoint=mid,
+            rule=rule,
+            segment_start=segment[0],
+            segment_end=segment[1],
+        )
+
+    def _get_next_vacation(
+        self, now: datetime, snapshot: HolidaySnapshot
     ) -> tuple[str | None, datetime | None, datetime | None, int | None, list[dict[str, Any]]]:
         """Return information about the next upcoming vacation (custody-focused).
 
@@ -1163,17 +1604,10 @@ class CustodyScheduleManager:
             LOGGER.warning("No zone configured, cannot fetch school holidays")
             return None, None, None, None, []
 
-        country = self._config.get(CONF_COUNTRY, DEFAULT_COUNTRY)
-        # Fetch holidays without year restriction to get current and next school years
-        LOGGER.debug("Fetching school holidays for country=%s, zone=%s", country, zone)
-        holidays = await self._holidays.async_list(country, zone)
-        LOGGER.debug("Retrieved %d holidays from API", len(holidays))
-
-        if not holidays:
+        if not snapshot.periods:
             LOGGER.warning("No holidays found for zone %s, year %s", zone, now.year)
 
-        # Sort holidays by effective start date (more relevant than raw API start)
-        sorted_holidays = sorted(holidays, key=lambda h: self._effective_holiday_bounds(h)[0])
+        sorted_periods = snapshot.sorted_periods
 
         # Build raw holidays list for debugging/display
         # Filter to only show holidays from current calendar year onwards
@@ -1190,127 +1624,73 @@ class CustodyScheduleManager:
             "Sunday": "Dimanche",
         }
 
-        for holiday in sorted_holidays:
-            effective_start, effective_end, _midpoint = self._effective_holiday_bounds(holiday)
-
+        for period in sorted_periods:
             # Only show upcoming/current holidays (based on effective end)
-            if effective_end < now:
+            if period.end < now:
                 continue
+            holiday = period.holiday
+            official_start = dt_util.as_local(holiday.start)
+            official_end = dt_util.as_local(holiday.end)
             school_holidays_raw.append(
                 {
                     "name": holiday.name,
-                    "official_start": dt_util.as_local(holiday.start).strftime("%d %B %Y"),
-                    "official_end": dt_util.as_local(holiday.end).strftime("%d %B %Y"),
+                    "official_start": official_start.strftime("%d %B %Y"),
+                    "official_end": official_end.strftime("%d %B %Y"),
                     "official_start_weekday": weekday_fr.get(
-                        dt_util.as_local(holiday.start).strftime("%A"),
-                        dt_util.as_local(holiday.start).strftime("%A"),
+                        official_start.strftime("%A"),
+                        official_start.strftime("%A"),
                     ),
                     "official_end_weekday": weekday_fr.get(
-                        dt_util.as_local(holiday.end).strftime("%A"),
-                        dt_util.as_local(holiday.end).strftime("%A"),
+                        official_end.strftime("%A"),
+                        official_end.strftime("%A"),
                     ),
-                    "effective_start": effective_start.strftime("%d %B %Y %H:%M"),
-                    "effective_end": effective_end.strftime("%d %B %Y %H:%M"),
+                    "effective_start": period.start.strftime("%d %B %Y %H:%M"),
+                    "effective_end": period.end.strftime("%d %B %Y %H:%M"),
                 }
             )
 
-        # vacation_rule is now automatic based on reference_year + split mode
-        split_mode = self._config.get(CONF_VACATION_SPLIT_MODE, "odd_first")
-        summer_mode = self._config.get(CONF_SUMMER_SPLIT_MODE, "half")
-
-        def _custody_segment_for_holiday(holiday_obj) -> tuple[datetime, datetime]:
-            eff_start, eff_end, mid = self._effective_holiday_bounds(holiday_obj)
-
-            # Handle summer quarter-split if enabled
-            is_summer = "été" in holiday_obj.name.lower() or holiday_obj.start.month in (7, 8)
-            if is_summer and summer_mode == "quarter":
-                total_duration = eff_end - eff_start
-                seg_duration = total_duration / 4
-
-                parts = [
-                    (eff_start, eff_start + seg_duration),
-                    (eff_start + seg_duration, eff_start + 2 * seg_duration),
-                    (eff_start + 2 * seg_duration, eff_start + 3 * seg_duration),
-                    (eff_start + 3 * seg_duration, eff_end),
-                ]
-
-                # Rule logic for parity
-                is_even_year = eff_start.year % 2 == 0
-                if split_mode == "odd_second":
-                    rule_type = "second_half" if not is_even_year else "first_half"
-                else:
-                    rule_type = "first_half" if not is_even_year else "second_half"
-
-                # Find the next segment for this user
-                if rule_type == "first_half":
-                    # User has parts 1 and 3. Return the one that is in the future.
-                    if parts[0][1] > now:
-                        return parts[0]
-                    return parts[2]
-                else:
-                    # User has parts 2 and 4
-                    if parts[1][1] > now:
-                        return parts[1]
-                    return parts[3]
-
-            # Automatic vacation rule based on year parity + split mode
-            is_even_year = eff_start.year % 2 == 0
-            if split_mode == "odd_second":
-                rule_for_year = "second_half" if not is_even_year else "first_half"
-            else:
-                rule_for_year = "first_half" if not is_even_year else "second_half"
-
-            return (mid, eff_end) if rule_for_year == "second_half" else (eff_start, mid)
-
         # First, check if we're currently in a vacation (effective bounds)
-        for holiday in sorted_holidays:
-            eff_start, eff_end, _mid = self._effective_holiday_bounds(holiday)
-            if eff_start <= now <= eff_end:
-                seg_start, seg_end = _custody_segment_for_holiday(holiday)
+        for period in sorted_periods:
+            if period.start <= now <= period.end:
                 return (
-                    holiday.name,
-                    seg_start,
-                    seg_end,
+                    period.holiday.name,
+                    period.segment_start,
+                    period.segment_end,
                     0,
                     school_holidays_raw,
                 )
 
         # Not in vacation, find the next custody segment start
-        next_vacation = None
-        next_seg_start: datetime | None = None
-        next_seg_end: datetime | None = None
-        for holiday in sorted_holidays:
-            seg_start, seg_end = _custody_segment_for_holiday(holiday)
+        next_period: HolidayPeriod | None = None
+        for period in sorted_periods:
             LOGGER.debug(
                 "Checking holiday (custody segment): %s, seg_start=%s, seg_end=%s, now=%s",
-                holiday.name,
-                seg_start,
-                seg_end,
+                period.holiday.name,
+                period.segment_start,
+                period.segment_end,
                 now,
             )
-            if seg_start > now:
-                next_vacation = holiday
-                next_seg_start = seg_start
-                next_seg_end = seg_end
-                LOGGER.debug("Found next vacation custody segment: %s, start=%s", holiday.name, next_seg_start)
+            if period.segment_start > now:
+                next_period = period
+                LOGGER.debug(
+                    "Found next vacation custody segment: %s, start=%s", period.holiday.name, period.segment_start
+                )
                 break
 
-        if not next_vacation:
-            LOGGER.warning("No next vacation found after %s. Total holidays: %d", now, len(sorted_holidays))
-            if sorted_holidays:
-                LOGGER.debug("Last holiday: %s (ends %s)", sorted_holidays[-1].name, sorted_holidays[-1].end)
-            return None, None, None, None, school_holidays_raw
-
-        if next_seg_start is None or next_seg_end is None:
+        if not next_period:
+            LOGGER.warning("No next vacation found after %s. Total holidays: %d", now, len(sorted_periods))
+            if sorted_periods:
+                last_holiday = sorted_periods[-1].holiday
+                LOGGER.debug("Last holiday: %s (ends %s)", last_holiday.name, last_holiday.end)
             return None, None, None, None, school_holidays_raw
 
-        delta = next_seg_start - now
+        delta = next_period.segment_start - now
         days_until = max(0, round(delta.total_seconds() / 86400, 2))
 
         return (
-            next_vacation.name,
-            next_seg_start,
-            next_seg_end,
+            next_period.holiday.name,
+            next_period.segment_start,
+            next_period.segment_end,
             days_until,
             school_holidays_raw,
         )
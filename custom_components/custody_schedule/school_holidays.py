@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
+import zlib
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from urllib.parse import urlencode
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
-from .const import HOLIDAY_API, LOGGER
+from .const import (
+    HOLIDAY_API,
+    HOLIDAY_API_MAX_PARALLEL,
+    HOLIDAY_API_TIMEOUT,
+    HOLIDAY_CACHE_NEGATIVE_TTL,
+    HOLIDAY_CACHE_SAVE_DELAY,
+    HOLIDAY_CACHE_STORAGE_KEY,
+    HOLIDAY_CACHE_STORAGE_VERSION,
+    HOLIDAY_CACHE_TTL,
+    HOLIDAY_DATASET_FILE,
+    HOLIDAY_DATASET_VERSION,
+    LOGGER,
+)
 
 
 @dataclass(slots=True)
@@ -24,6 +43,111 @@ class SchoolHoliday:
     start: datetime
     end: datetime
 
+    def as_dict(self) -> dict[str, str]:
+        """Serialize for the persistent cache."""
+        return {"name": self.name, "zone": self.zone, "start": self.start.isoformat(), "end": self.end.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SchoolHoliday | None:
+        """Restore a holiday serialized with as_dict (None if malformed)."""
+        start = dt_util.parse_datetime(str(data.get("start") or ""))
+        end = dt_util.parse_datetime(str(data.get("end") or ""))
+        if not start or not end:
+            return None
+        return cls(
+            name=str(data.get("name") or "Vacances scolaires"),
+            zone=str(data.get("zone") or ""),
+            start=dt_util.as_local(start),
+            end=dt_util.as_local(end),
+        )
+
+
+@dataclass(slots=True)
+class HolidayCacheEntry:
+    """Cached provider answer for one (country, zone, school year)."""
+
+    holidays: list[SchoolHoliday]
+    expires_at: datetime
+    fetched_at: datetime | None = None
+    # HTTP validators (ETag / Last-Modified) keyed by request URL
+    validators: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the persistent cache."""
+        return {
+            "holidays": [holiday.as_dict() for holiday in self.holidays],
+            "expires_at": self.expires_at.isoformat(),
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+            "validators": self.validators,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HolidayCacheEntry | None:
+        """Restore an entry serialized with as_dict (None if malformed)."""
+        expires_at = dt_util.parse_datetime(str(data.get("expires_at") or ""))
+        if not expires_at:
+            return None
+        fetched_at = dt_util.parse_datetime(str(data.get("fetched_at") or ""))
+        holidays = [SchoolHoliday.from_dict(item) for item in data.get("holidays") or [] if isinstance(item, dict)]
+        validators = data.get("validators")
+        return cls(
+            holidays=[holiday for holiday in holidays if holiday],
+            expires_at=expires_at,
+            fetched_at=fetched_at,
+            validators=validators if isinstance(validators, dict) else {},
+        )
+
+
+def load_bundled_dataset(path: Path | None = None) -> dict[str, list[SchoolHoliday]]:
+    """Load the offline holiday dataset shipped with the integration (blocking I/O).
+
+    Returns holidays keyed by "country|zone"; an unreadable or outdated file yields {}.
+    """
+    path = path or Path(__file__).parent / HOLIDAY_DATASET_FILE
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError) as err:
+        LOGGER.warning("Unable to load bundled holiday dataset %s: %s", path, err)
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != HOLIDAY_DATASET_VERSION:
+        LOGGER.warning("Ignoring bundled holiday dataset %s: unsupported version", path)
+        return {}
+
+    dataset: dict[str, list[SchoolHoliday]] = {}
+    for key, items in (payload.get("entries") or {}).items():
+        zone = key.partition("|")[2]
+        holidays = [SchoolHoliday.from_dict({**item, "zone": zone}) for item in items if isinstance(item, dict)]
+        dataset[key] = sorted((holiday for holiday in holidays if holiday), key=lambda h: (h.start, h.end))
+    LOGGER.debug(
+        "Loaded bundled holiday dataset revision %s (%d zones)", payload.get("revision", "unknown"), len(dataset)
+    )
+    return dataset
+
+
+class HolidayRevalidation:
+    """Conditional-request state for one fetch of a cache entry.
+
+    ``validators`` are sent as If-None-Match / If-Modified-Since, ``updated``
+    collects the validators returned by the server for the next fetch.
+    Requests are keyed by URL: ``not_modified`` and ``modified`` hold the keys
+    answered 304 and 200, ``failed`` is set when a request errored or timed out,
+    and keys in ``skip`` are not requested at all (answered like a 304).
+    """
+
+    def __init__(self, validators: dict[str, dict[str, str]] | None = None, skip: Iterable[str] = ()) -> None:
+        self.validators = validators or {}
+        self.skip = set(skip)
+        self.updated: dict[str, dict[str, str]] = {}
+        self.not_modified: set[str] = set()
+        self.modified: set[str] = set()
+        self.failed = False
+
+    @property
+    def all_not_modified(self) -> bool:
+        """Return True when every request was answered 304 (cached data is still current)."""
+        return bool(self.not_modified) and not self.modified and not self.failed
+
 
 class BaseHolidayProvider(ABC):
     """Base class for school holiday providers."""
@@ -33,9 +157,67 @@ class BaseHolidayProvider(ABC):
         self.session = session
 
     @abstractmethod
-    async def get_holidays(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
+    async def get_holidays(
+        self, country: str, zone: str, year: int | None = None, revalidation: HolidayRevalidation | None = None
+    ) -> list[SchoolHoliday]:
         """Fetch holidays for a specific country, zone and year."""
 
+    async def _async_get_json(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        revalidation: HolidayRevalidation | None = None,
+    ) -> Any | None:
+        """GET a JSON payload, revalidating with ETag / Last-Modified when possible.
+
+        Returns None when the server answers 304 Not Modified (nothing to parse).
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        headers: dict[str, str] = {}
+        if revalidation is not None:
+            if key in revalidation.skip:
+                # Already answered by an earlier pass of the same fetch
+                return None
+            known = revalidation.validators.get(key) or {}
+            if known.get("etag"):
+                headers["If-None-Match"] = known["etag"]
+            if known.get("last_modified"):
+                headers["If-Modified-Since"] = known["last_modified"]
+
+        try:
+            async with self.session.get(
+                url,
+                params=params,
+                headers=headers or None,
+                timeout=aiohttp.ClientTimeout(total=HOLIDAY_API_TIMEOUT),
+            ) as resp:
+                if resp.status == 304:
+                    if revalidation is not None:
+                        revalidation.not_modified.add(key)
+                        revalidation.updated[key] = revalidation.validators.get(key) or {}
+                    return None
+                resp.raise_for_status()
+                payload = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            # Providers log the error and answer []: the fetch must not be cached as complete
+            if revalidation is not None:
+                revalidation.failed = True
+            raise
+        if revalidation is not None:
+            revalidation.modified.add(key)
+            received = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+            received = {name: value for name, value in received.items() if value}
+            if received:
+                revalidation.updated[key] = received
+        return payload
+
+    def cache_period(self, year: int | None = None) -> str:
+        """Return the period label used to key cached answers (calendar year by default)."""
+        return str(year or dt_util.now().year)
+
 
 class FranceEducationProvider(BaseHolidayProvider):
     """Provider for French school holidays using Education Nationale API."""
@@ -47,6 +229,12 @@ class FranceEducationProvider(BaseHolidayProvider):
             return f"{year - 1}-{year}"
         return f"{year}-{year + 1}"
 
+    def cache_period(self, year: int | None = None) -> str:
+        """Cache answers per school year (data rolls over in September)."""
+        if year is not None:
+            return str(year)
+        return self._get_school_year(dt_util.now())
+
     def _normalize_zone(self, zone: str) -> str:
         """Normalize zone name for API compatibility."""
         zone_mapping = {
@@ -58,7 +246,9 @@ class FranceEducationProvider(BaseHolidayProvider):
         }
         return zone_mapping.get(zone, zone)
 
-    async def get_holidays(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
+    async def get_holidays(
+        self, country: str, zone: str, year: int | None = None, revalidation: HolidayRevalidation | None = None
+    ) -> list[SchoolHoliday]:
         """Fetch holidays from the French API."""
         now = dt_util.now()
         school_years = set()
@@ -75,72 +265,94 @@ class FranceEducationProvider(BaseHolidayProvider):
                 school_years.add(f"{next_year_start}-{next_year_start + 1}")
 
         normalized_zone = self._normalize_zone(zone)
-        all_holidays: list[SchoolHoliday] = []
 
-        for school_year in school_years:
-            url = HOLIDAY_API.format(zone=normalized_zone, year=school_year)
-            try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as resp:
-                    resp.raise_for_status()
-                    payload: dict[str, Any] = await resp.json()
-
-                    records = payload.get("records", [])
-
-                    # Manual fallback if zone filtering fails in the API
-                    if len(records) == 0 and normalized_zone in ["A", "B", "C"]:
-                        url_all = (
-                            "https://data.education.gouv.fr/api/records/1.0/search/"
-                            f"?dataset=fr-en-calendrier-scolaire"
-                            f"&refine.annee_scolaire={school_year}"
-                            f"&rows=100"
-                        )
-                        async with self.session.get(url_all) as resp2:
-                            resp2.raise_for_status()
-                            payload_all = await resp2.json()
-                            for r in payload_all.get("records", []):
-                                fields = r.get("fields", {})
-                                zone_field = str(fields.get("zones") or fields.get("zone") or "")
-                                if normalized_zone == zone_field or normalized_zone in zone_field.split(","):
-                                    records.append(r)
-
-                    for record in records:
-                        fields = record.get("fields", {})
-                        start_str = fields.get("start_date") or fields.get("date_debut")
-                        end_str = fields.get("end_date") or fields.get("date_fin")
-                        name = fields.get("description") or fields.get("libelle") or "Vacances scolaires"
-
-                        if not start_str or not end_str:
-                            continue
-
-                        start = dt_util.parse_datetime(start_str)
-                        end = dt_util.parse_datetime(end_str)
-
-                        if not start or not end:
-                            continue
-
-                        if year is not None and not (
-                            start.year == year or end.year == year or (start.year < year < end.year)
-                        ):
-                            continue
-
-                        all_holidays.append(
-                            SchoolHoliday(
-                                name=name,
-                                zone=zone,
-                                start=dt_util.as_local(start),
-                                end=dt_util.as_local(end),
-                            )
-                        )
-            except Exception as err:
-                LOGGER.error("Error fetching holidays from France provider: %s", err)
+        # Fetch school years concurrently (bounded); each request has its own timeout
+        semaphore = asyncio.Semaphore(HOLIDAY_API_MAX_PARALLEL)
+
+        async def _bounded_fetch(school_year: str) -> list[SchoolHoliday]:
+            async with semaphore:
+                return await self._fetch_school_year(school_year, normalized_zone, zone, year, revalidation)
+
+        results = await asyncio.gather(*(_bounded_fetch(school_year) for school_year in sorted(school_years)))
+        all_holidays = [holiday for holidays in results for holiday in holidays]
 
         return sorted(all_holidays, key=lambda h: (h.start, h.end))
 
+    async def _fetch_school_year(
+        self,
+        school_year: str,
+        normalized_zone: str,
+        zone: str,
+        year: int | None,
+        revalidation: HolidayRevalidation | None = None,
+    ) -> list[SchoolHoliday]:
+        """Fetch one school year (errors are logged and yield no holidays)."""
+        holidays: list[SchoolHoliday] = []
+        url = HOLIDAY_API.format(zone=normalized_zone, year=school_year)
+        try:
+            payload: dict[str, Any] | None = await self._async_get_json(url, revalidation=revalidation)
+            if payload is None:
+                # 304 Not Modified: the cached records for this year are still current
+                return []
+
+            records = payload.get("records", [])
+
+            # Manual fallback if zone filtering fails in the API
+            if len(records) == 0 and normalized_zone in ["A", "B", "C"]:
+                url_all = (
+                    "https://data.education.gouv.fr/api/records/1.0/search/"
+                    f"?dataset=fr-en-calendrier-scolaire"
+                    f"&refine.annee_scolaire={school_year}"
+                    f"&rows=100"
+                )
+                payload_all = await self._async_get_json(url_all, revalidation=revalidation)
+                for r in (payload_all or {}).get("records", []):
+                    fields = r.get("fields", {})
+                    zone_field = str(fields.get("zones") or fields.get("zone") or "")
+                    if normalized_zone == zone_field or normalized_zone in zone_field.split(","):
+                        records.append(r)
+
+            for record in records:
+                fields = record.get("fields", {})
+                start_str = fields.get("start_date") or fields.get("date_debut")
+                end_str = fields.get("end_date") or fields.get("date_fin")
+                name = fields.get("description") or fields.get("libelle") or "Vacances scolaires"
+
+                if not start_str or not end_str:
+                    continue
+
+                start = dt_util.parse_datetime(start_str)
+                end = dt_util.parse_datetime(end_str)
+
+                if not start or not end:
+                    continue
+
+                if year is not None and not (start.year == year or end.year == year or (start.year < year < end.year)):
+                    continue
+
+                holidays.append(
+                    SchoolHoliday(
+                        name=name,
+                        zone=zone,
+                        start=dt_util.as_local(start),
+                        end=dt_util.as_local(end),
+                    )
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            LOGGER.error("Error fetching holidays from France provider (%s): %s", school_year, err)
+            return []
+
+        return holidays
+
 
 class OpenHolidaysProvider(BaseHolidayProvider):
     """Provider for BE, CH, LU using OpenHolidays API."""
 
-    async def get_holidays(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
+    async def get_holidays(
+        self, country: str, zone: str, year: int | None = None, revalidation: HolidayRevalidation | None = None
+    ) -> list[SchoolHoliday]:
         """Fetch holidays from OpenHolidays API."""
         now = dt_util.now()
         target_year = year or now.year
@@ -165,23 +377,21 @@ class OpenHolidaysProvider(BaseHolidayProvider):
 
         holidays = []
         try:
-            async with self.session.get(base_url, params=params) as resp:
-                resp.raise_for_status()
-                payload = await resp.json()
-                for item in payload:
-                    name_dict = item.get("name", [])
-                    name = next((n.get("text") for n in name_dict if n.get("language") == lang.lower()), "Vacances")
-                    start = dt_util.parse_datetime(item.get("startDate"))
-                    end = dt_util.parse_datetime(item.get("endDate"))
-                    if start and end:
-                        holidays.append(
-                            SchoolHoliday(
-                                name=name,
-                                zone=zone,
-                                start=dt_util.as_local(start),
-                                end=dt_util.as_local(end) + timedelta(days=1) - timedelta(seconds=1),
-                            )
+            payload = await self._async_get_json(base_url, params=params, revalidation=revalidation)
+            for item in payload or []:
+                name_dict = item.get("name", [])
+                name = next((n.get("text") for n in name_dict if n.get("language") == lang.lower()), "Vacances")
+                start = dt_util.parse_datetime(item.get("startDate"))
+                end = dt_util.parse_datetime(item.get("endDate"))
+                if start and end:
+                    holidays.append(
+                        SchoolHoliday(
+                            name=name,
+                            zone=zone,
+                            start=dt_util.as_local(start),
+                            end=dt_util.as_local(end) + timedelta(days=1) - timedelta(seconds=1),
                         )
+                    )
         except Exception as err:
             LOGGER.error("Error fetching from OpenHolidays: %s", err)
 
@@ -191,7 +401,9 @@ class OpenHolidaysProvider(BaseHolidayProvider):
 class CanadaHolidayProvider(BaseHolidayProvider):
     """Provider for Canada/Quebec. Focuses on Statutory Public Holidays for now."""
 
-    async def get_holidays(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
+    async def get_holidays(
+        self, country: str, zone: str, year: int | None = None, revalidation: HolidayRevalidation | None = None
+    ) -> list[SchoolHoliday]:
         """Fetch holidays for Canada."""
         # For now, simplistic implementation for Quebec
         # We can use https://canada-holidays.ca/api
@@ -201,17 +413,15 @@ class CanadaHolidayProvider(BaseHolidayProvider):
 
         holidays = []
         try:
-            async with self.session.get(url) as resp:
-                resp.raise_for_status()
-                payload = await resp.json()
-                province = payload.get("province", {})
-                for h in province.get("holidays", []):
-                    name = h.get("nameFr") or h.get("nameEn")
-                    start_date = dt_util.parse_datetime(h.get("observedDate") or h.get("date"))
-                    if start_date:
-                        start = dt_util.as_local(datetime.combine(start_date.date(), datetime.min.time()))
-                        end = dt_util.as_local(datetime.combine(start_date.date(), datetime.max.time()))
-                        holidays.append(SchoolHoliday(name, zone, start, end))
+            payload = await self._async_get_json(url, revalidation=revalidation)
+            province = (payload or {}).get("province", {})
+            for h in province.get("holidays", []):
+                name = h.get("nameFr") or h.get("nameEn")
+                start_date = dt_util.parse_datetime(h.get("observedDate") or h.get("date"))
+                if start_date:
+                    start = dt_util.as_local(datetime.combine(start_date.date(), datetime.min.time()))
+                    end = dt_util.as_local(datetime.combine(start_date.date(), datetime.max.time()))
+                    holidays.append(SchoolHoliday(name, zone, start, end))
         except Exception as err:
             LOGGER.error("Error fetching from Canada provider: %s", err)
 
@@ -219,32 +429,156 @@ class CanadaHolidayProvider(BaseHolidayProvider):
 
 
 class SchoolHolidayClient:
-    """Client that delegates to specific country providers."""
+    """Client that delegates to specific country providers.
+
+    Answers are cached per (country, zone, school year) in memory and persisted
+    with Home Assistant's Store so restarts do not block on the remote APIs.
+    Expired entries are still served while a background refresh revalidates them
+    (stale-while-revalidate); failed fetches only get a short negative TTL.
+    Concurrent callers for the same key share a single in-flight request.
+    With nothing usable in cache, the bundled offline dataset answers first while
+    the live fetch runs in the background.
+    """
 
     def __init__(self, hass: HomeAssistant, api_url: str | None = None) -> None:
         self._hass = hass
         self._session = aiohttp_client.async_get_clientsession(hass)
-        self._cache: dict[tuple[str, str, str, int | None], list[SchoolHoliday]] = {}
+        self._cache: dict[str, HolidayCacheEntry] = {}
+        self._store: Store = Store(hass, HOLIDAY_CACHE_STORAGE_VERSION, self._storage_key(api_url))
+        self._store_loaded = False
+        self._load_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Task[list[SchoolHoliday]]] = {}
+        self._bundled: dict[str, list[SchoolHoliday]] | None = None
+        self._bundled_lock = asyncio.Lock()
+        self._bundled_served: set[str] = set()
+        self._listeners: list[Callable[[str, str], None]] = []
+        self._data_version = 0
         self._france_provider = FranceEducationProvider(hass, self._session)
         self._open_provider = OpenHolidaysProvider(hass, self._session)
         self._canada_provider = CanadaHolidayProvider(hass, self._session)
 
-    async def async_list(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
-        """Return holidays using the appropriate provider."""
-        cache_key = (country, zone, str(year), year)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+    @staticmethod
+    def _storage_key(api_url: str | None) -> str:
+        """Return the Store key, isolating clients created for a custom API URL."""
+        if not api_url or api_url == HOLIDAY_API:
+            return HOLIDAY_CACHE_STORAGE_KEY
+        return f"{HOLIDAY_CACHE_STORAGE_KEY}_{zlib.crc32(api_url.encode()):08x}"
 
+    def _get_provider(self, country: str) -> BaseHolidayProvider:
         if country == "FR":
-            provider = self._france_provider
-        elif country in ["BE", "CH", "LU"]:
-            provider = self._open_provider
-        elif country == "CA_QC":
-            provider = self._canada_provider
-        else:
-            provider = self._france_provider
+            return self._france_provider
+        if country in ["BE", "CH", "LU"]:
+            return self._open_provider
+        if country == "CA_QC":
+            return self._canada_provider
+        return self._france_provider
 
-        holidays = await provider.get_holidays(country, zone, year)
+    async def async_list(self, country: str, zone: str, year: int | None = None) -> list[SchoolHoliday]:
+        """Return holidays using the appropriate provider."""
+        await self._async_load_store()
+
+        provider = self._get_provider(country)
+        cache_key = f"{country}|{zone}|{provider.cache_period(year)}"
+        entry = self._cache.get(cache_key)
+        fresh = entry is not None and dt_util.utcnow() < entry.expires_at
+        if entry is not None and entry.holidays:
+            if not fresh:
+                # Serve the stale answer immediately and revalidate in the background
+                self._async_schedule_refresh(cache_key, provider, country, zone, year)
+            return entry.holidays
+
+        # Nothing usable in cache (cold start or failed fetches): answer from the bundled dataset
+        bundled = await self._async_bundled_holidays(country, zone, year)
+        if fresh:
+            return bundled
+        if bundled:
+            self._bundled_served.add(cache_key)
+            self._async_schedule_refresh(cache_key, provider, country, zone, year)
+            return bundled
+
+        # Shield the shared fetch so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._async_fetch_shared(cache_key, provider, country, zone, year))
+
+    async def _async_bundled_holidays(self, country: str, zone: str, year: int | None) -> list[SchoolHoliday]:
+        """Return bundled holidays for a country/zone, loading the dataset lazily."""
+        if self._bundled is None:
+            async with self._bundled_lock:
+                if self._bundled is None:
+                    self._bundled = await self._hass.async_add_executor_job(load_bundled_dataset)
+        holidays = self._bundled.get(f"{country}|{zone}", [])
+        if year is None:
+            return holidays
+        return [holiday for holiday in holidays if holiday.start.year <= year <= holiday.end.year]
+
+    @property
+    def data_version(self) -> int:
+        """Counter bumped whenever cached holiday data changes (used to key schedule caches)."""
+        return self._data_version
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[str, str], None]) -> Callable[[], None]:
+        """Call update_callback(country, zone) when a refresh replaces holidays already served."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove_listener
+
+    def _async_fetch_shared(
+        self, cache_key: str, provider: BaseHolidayProvider, country: str, zone: str, year: int | None
+    ) -> asyncio.Task[list[SchoolHoliday]]:
+        """Return the in-flight fetch for this key, starting one if needed (single-flight)."""
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            LOGGER.debug("Joining in-flight holiday fetch for %s", cache_key)
+            return task
+
+        task = self._hass.async_create_task(self._async_fetch(cache_key, provider, country, zone, year))
+        self._inflight[cache_key] = task
+
+        def _done(finished: asyncio.Task[list[SchoolHoliday]]) -> None:
+            if self._inflight.get(cache_key) is finished:
+                del self._inflight[cache_key]
+            if not finished.cancelled() and finished.exception() is not None:
+                LOGGER.warning("Holiday fetch failed for %s: %s", cache_key, finished.exception())
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _async_fetch(
+        self, cache_key: str, provider: BaseHolidayProvider, country: str, zone: str, year: int | None
+    ) -> list[SchoolHoliday]:
+        """Fetch from the provider and update the cache entry."""
+        previous = self._cache.get(cache_key)
+        served_bundled = cache_key in self._bundled_served
+        self._bundled_served.discard(cache_key)
+        # Only revalidate when there is cached data to fall back on after a 304
+        revalidation = HolidayRevalidation(previous.validators if previous is not None and previous.holidays else None)
+        holidays = await provider.get_holidays(country, zone, year, revalidation)
+
+        if revalidation.all_not_modified and previous is not None:
+            # 304 everywhere: keep the parsed holidays and just extend their lifetime
+            LOGGER.debug("Holidays for %s not modified, extending cache", cache_key)
+            now = dt_util.utcnow()
+            self._cache[cache_key] = HolidayCacheEntry(
+                holidays=previous.holidays,
+                expires_at=now + HOLIDAY_CACHE_TTL,
+                fetched_at=now,
+                validators={**previous.validators, **revalidation.updated},
+            )
+            self._store.async_delay_save(self._data_to_save, HOLIDAY_CACHE_SAVE_DELAY)
+            return previous.holidays
+        if revalidation.not_modified and not revalidation.failed:
+            # Mixed 200/304 answers leave gaps: fetch again, unconditionally, only what answered 304
+            retry = HolidayRevalidation(skip=revalidation.modified)
+            holidays = sorted(
+                [*holidays, *await provider.get_holidays(country, zone, year, retry)], key=lambda h: (h.start, h.end)
+            )
+            retry.updated = {**revalidation.updated, **retry.updated}
+            revalidation = retry
 
         # Deduplicate
         seen = set()
@@ -255,8 +589,74 @@ class SchoolHolidayClient:
                 seen.add(k)
                 unique.append(h)
 
-        self._cache[cache_key] = unique
-        return unique
+        now = dt_util.utcnow()
+        if revalidation.failed and previous is not None and previous.holidays:
+            # Part of the answer is missing (HTTP error or timeout): keep the previous one
+            unique = []
+        if unique:
+            entry = HolidayCacheEntry(
+                holidays=unique,
+                # An incomplete first answer is still served, but retried soon
+                expires_at=now + (HOLIDAY_CACHE_NEGATIVE_TTL if revalidation.failed else HOLIDAY_CACHE_TTL),
+                fetched_at=now,
+                validators=revalidation.updated,
+            )
+        elif previous is not None and previous.holidays:
+            # Providers return [] on errors: keep serving the previous answer and retry soon
+            LOGGER.debug("Holiday refresh for %s returned nothing, keeping cached data", cache_key)
+            entry = HolidayCacheEntry(
+                holidays=previous.holidays,
+                expires_at=now + HOLIDAY_CACHE_NEGATIVE_TTL,
+                fetched_at=previous.fetched_at,
+                validators=previous.validators,
+            )
+        else:
+            entry = HolidayCacheEntry(holidays=[], expires_at=now + HOLIDAY_CACHE_NEGATIVE_TTL)
+
+        self._cache[cache_key] = entry
+        self._store.async_delay_save(self._data_to_save, HOLIDAY_CACHE_SAVE_DELAY)
+        if previous is None or previous.holidays != entry.holidays:
+            self._data_version += 1
+        if unique and (served_bundled or (previous is not None and previous.holidays and previous.holidays != unique)):
+            # Callers were served stale or bundled data: let them recompute with the fresh answer
+            for listener in list(self._listeners):
+                listener(country, zone)
+        return entry.holidays
+
+    def _async_schedule_refresh(
+        self, cache_key: str, provider: BaseHolidayProvider, country: str, zone: str, year: int | None
+    ) -> None:
+        """Start a background revalidation unless a fetch is already running for this key."""
+        if cache_key in self._inflight:
+            return
+        LOGGER.debug("Serving stale holidays for %s while refreshing", cache_key)
+        self._async_fetch_shared(cache_key, provider, country, zone, year)
+
+    async def _async_load_store(self) -> None:
+        """Load persisted entries once (entries fetched meanwhile take precedence)."""
+        if self._store_loaded:
+            return
+        async with self._load_lock:
+            if self._store_loaded:
+                return
+            try:
+                stored = await self._store.async_load()
+            except Exception as err:
+                LOGGER.warning("Unable to load holiday cache: %s", err)
+                stored = None
+            if isinstance(stored, dict):
+                for key, raw_entry in (stored.get("entries") or {}).items():
+                    if key in self._cache or not isinstance(raw_entry, dict):
+                        continue
+                    entry = HolidayCacheEntry.from_dict(raw_entry)
+                    if entry is not None:
+                        self._cache[key] = entry
+                        self._data_version += 1
+            self._store_loaded = True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload persisted by the Store."""
+        return {"entries": {key: entry.as_dict() for key, entry in self._cache.items()}}
 
     async def async_test_connection(self, country: str, zone: str, year: int | None = None) -> dict[str, Any]:
         """Test API connection."""
@@ -273,5 +673,7 @@ class SchoolHolidayClient:
             return {"success": False, "error": str(err)}
 
     def clear(self) -> None:
-        """Clear cache."""
+        """Clear cache (memory and persisted entries)."""
         self._cache.clear()
+        self._data_version += 1
+        self._store.async_delay_save(self._data_to_save, HOLIDAY_CACHE_SAVE_DELAY)
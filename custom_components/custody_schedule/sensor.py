@@ -9,7 +9,7 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, Sen
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
@@ -28,6 +28,7 @@ from .const import (
     ATTR_NEXT_VACATION_START,
     ATTR_SCHOOL_HOLIDAYS_RAW,
     ATTR_VACATION_NAME,
+    CONF_CALENDAR_SYNC,
     CONF_CHILD_NAME,
     CONF_CHILD_NAME_DISPLAY,
     CONF_PHOTO,
@@ -69,6 +70,26 @@ SENSORS: tuple[SensorDefinition, ...] = (
     ),
 )
 
+# Diagnostic sensors for calendar sync tuning, created when sync is enabled but disabled by default
+CALENDAR_SYNC_SENSORS: tuple[SensorDefinition, ...] = (
+    SensorDefinition(
+        "calendar_sync_duration",
+        "mdi:timer-sync-outline",
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        UnitOfTime.SECONDS,
+    ),
+    SensorDefinition(
+        "calendar_read_latency",
+        "mdi:timer-outline",
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        UnitOfTime.SECONDS,
+    ),
+    SensorDefinition("calendar_sync_operations", "mdi:calendar-sync", state_class=SensorStateClass.TOTAL_INCREASING),
+    SensorDefinition("calendar_sync_failures", "mdi:calendar-alert", state_class=SensorStateClass.TOTAL_INCREASING),
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Custody Schedule sensors."""
@@ -86,6 +107,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         CustodyScheduleSensor(coordinator, entry, definition, child_name_display, child_name_normalized)
         for definition in SENSORS
     ]
+    if {**entry.data, **(entry.options or {})}.get(CONF_CALENDAR_SYNC):
+        entities.extend(
+            CalendarSyncMetricsSensor(coordinator, entry, definition, child_name_display, child_name_normalized)
+            for definition in CALENDAR_SYNC_SENSORS
+        )
     async_add_entities(entities)
 
 
@@ -169,3 +195,44 @@ class CustodyScheduleSensor(CoordinatorEntity[CustodyComputation], SensorEntity)
         }
         attrs.update(data.attributes)
         return {key: value for key, value in attrs.items() if value is not None}
+
+
+class CalendarSyncMetricsSensor(CustodyScheduleSensor):
+    """Expose one calendar sync metric of the entry (see diagnostics for the full set)."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    @property
+    def native_value(self) -> Any:
+        """Return the metric."""
+        metrics = self.coordinator.calendar_metrics
+        key = self._definition.key
+        if key == "calendar_sync_duration":
+            return round(metrics.last_sync_duration, 3) if metrics.last_sync_duration is not None else None
+        if key == "calendar_read_latency":
+            return round(metrics.last_read_latency, 3) if metrics.last_read_latency is not None else None
+        if key == "calendar_sync_operations":
+            return sum(metrics.operations.values())
+        if key == "calendar_sync_failures":
+            return metrics.failures
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the counters related to this metric."""
+        metrics = self.coordinator.calendar_metrics.as_dict()
+        key = self._definition.key
+        if key == "calendar_sync_duration":
+            return {"last_sync": metrics["last_sync"], "mode": metrics["last_sync_mode"], "syncs": metrics["syncs"]}
+        if key == "calendar_read_latency":
+            return {"reads": metrics["reads"], "events_scanned": metrics["events_scanned"]}
+        if key == "calendar_sync_operations":
+            return {
+                **metrics["operations"],
+                "skipped_by_interval": metrics["skipped_by_interval"],
+                "purges": metrics["purges"],
+            }
+        if key == "calendar_sync_failures":
+            return {"retries": metrics["retries"]}
+        return {}
@@ -0,0 +1,192 @@
+"""Regenerate the offline school-holiday dataset bundled with the integration.
+
+Usage (from the repository root):
+    python scripts/build_holiday_dataset.py [first_school_year]
+
+Covers every provider of SchoolHolidayClient, with the same requests and the same
+normalization as the live providers so the bundled answer matches a live fetch:
+
+- France (zones A, B, C, Corse and DOM-TOM) from data.education.gouv.fr, for the given
+  school year (current one by default) and the next one;
+- Belgium, Switzerland and Luxembourg (subdivisions of const.SUBDIVISIONS) from
+  openholidaysapi.org, for the calendar years spanned by those school years;
+- Québec (statutory holidays) from canada-holidays.ca, for the same calendar years.
+
+Writes custom_components/custody_schedule/holidays_dataset.json.gz. The "revision"
+field records when the data was generated; "version" is the file format and must
+match HOLIDAY_DATASET_VERSION in const.py.
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+FRANCE_API_URL = "https://data.education.gouv.fr/api/records/1.0/search/"
+OPENHOLIDAYS_API_URL = "https://openholidaysapi.org/SchoolHolidays"
+CANADA_API_URL = "https://canada-holidays.ca/api/v1/provinces/{province}"
+DATASET_VERSION = 1  # must match HOLIDAY_DATASET_VERSION in const.py
+OUTPUT = Path(__file__).resolve().parent.parent / "custom_components" / "custody_schedule" / "holidays_dataset.json.gz"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Zone keys of const.FRENCH_ZONES and their API names (FranceEducationProvider._normalize_zone)
+FRENCH_ZONES = {"A": "Zone A", "B": "Zone B", "C": "Zone C", "Corse": "Corse", "DOM-TOM": "Guadeloupe"}
+# Zone keys of const.SUBDIVISIONS served by OpenHolidaysProvider, with the local time zone
+OPENHOLIDAYS_ZONES = {
+    "BE": ("Europe/Brussels", ["FR", "NL", "DE"]),
+    "CH": ("Europe/Zurich", ["CH-GE", "CH-VD", "CH-VS", "CH-NE", "CH-FR", "CH-JU", "CH-BE", "CH-ZH"]),
+    "LU": ("Europe/Luxembourg", ["LU"]),
+}
+# Zones sent without subdivisionCode (same rule as OpenHolidaysProvider)
+OPENHOLIDAYS_NATIONAL_ZONES = {"FR", "BE", "CH", "LU", "A", "B", "C", "Corse", "DOM-TOM"}
+# Zone keys of const.SUBDIVISIONS served by CanadaHolidayProvider
+CANADA_ZONES = {"CA_QC": ("America/Toronto", "QC", ["QC"])}
+
+
+def current_school_year(today: date) -> int:
+    """Return the first calendar year of the school year containing today."""
+    return today.year if today.month >= 9 else today.year - 1
+
+
+def local_midnight(value: str, tz: ZoneInfo) -> datetime:
+    """Normalize an API date or timestamp to local midnight."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(tz)
+    return datetime.combine(parsed.date(), time.min, tz)
+
+
+async def get_json(session: aiohttp.ClientSession, url: str, params: dict[str, str] | None = None) -> Any:
+    """GET a JSON document, failing loudly: a partial dataset must not be written."""
+    async with session.get(url, params=params, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def fetch_france(session: aiohttp.ClientSession, zone: str, school_year: str) -> list[dict[str, str]]:
+    """Fetch one zone/school year; the API returns one record per académie, so deduplicate."""
+    tz = ZoneInfo("Europe/Paris")
+    params = {
+        "dataset": "fr-en-calendrier-scolaire",
+        "refine.annee_scolaire": school_year,
+        "refine.zones": zone,
+        "rows": "200",
+    }
+    payload = await get_json(session, FRANCE_API_URL, params)
+
+    seen: dict[tuple[str, str], dict[str, str]] = {}
+    for record in payload.get("records", []):
+        fields = record.get("fields", {})
+        start, end = fields.get("start_date"), fields.get("end_date")
+        if not start or not end:
+            continue
+        item = {
+            "name": fields.get("description") or "Vacances scolaires",
+            "start": local_midnight(start, tz).isoformat(),
+            "end": local_midnight(end, tz).isoformat(),
+            "school_year": school_year,
+        }
+        seen.setdefault((item["name"], item["start"]), item)
+    return list(seen.values())
+
+
+async def fetch_openholidays(
+    session: aiohttp.ClientSession, country: str, zone: str, year: int, tz: ZoneInfo
+) -> list[dict[str, str]]:
+    """Fetch one country/subdivision/calendar year (end = last day at 23:59:59, as the provider)."""
+    lang = "FR"
+    params = {
+        "countryIsoCode": country,
+        "languageIsoCode": lang,
+        "validFrom": f"{year}-01-01",
+        "validTo": f"{year + 1}-01-01",
+    }
+    if zone not in OPENHOLIDAYS_NATIONAL_ZONES:
+        params["subdivisionCode"] = zone
+    payload = await get_json(session, OPENHOLIDAYS_API_URL, params)
+
+    rows = []
+    for item in payload or []:
+        name = next((n.get("text") for n in item.get("name", []) if n.get("language") == lang.lower()), "Vacances")
+        if not item.get("startDate") or not item.get("endDate"):
+            continue
+        end = local_midnight(item["endDate"], tz) + timedelta(days=1) - timedelta(seconds=1)
+        rows.append({"name": name, "start": local_midnight(item["startDate"], tz).isoformat(), "end": end.isoformat()})
+    return rows
+
+
+async def fetch_canada(session: aiohttp.ClientSession, province: str, year: int, tz: ZoneInfo) -> list[dict[str, str]]:
+    """Fetch the statutory holidays of one province/calendar year (one whole day each, as the provider)."""
+    payload = await get_json(session, CANADA_API_URL.format(province=province), {"year": str(year)})
+
+    rows = []
+    for item in (payload or {}).get("province", {}).get("holidays", []):
+        value = item.get("observedDate") or item.get("date")
+        if not value:
+            continue
+        start = local_midnight(value, tz)
+        end = datetime.combine(start.date(), time.max, tz)
+        rows.append(
+            {"name": item.get("nameFr") or item.get("nameEn"), "start": start.isoformat(), "end": end.isoformat()}
+        )
+    return rows
+
+
+def unique_sorted(rows: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Drop periods returned twice (overlapping requests) and sort them by start."""
+    seen: dict[tuple[str, str, str], dict[str, str]] = {}
+    for row in rows:
+        seen.setdefault((row["name"], row["start"], row["end"]), row)
+    return sorted(seen.values(), key=lambda row: (row["start"], row["end"]))
+
+
+async def main() -> None:
+    first = int(sys.argv[1]) if len(sys.argv) > 1 else current_school_year(date.today())
+    school_years = [f"{first}-{first + 1}", f"{first + 1}-{first + 2}"]
+    # Calendar years spanned by those school years
+    years = [first, first + 1, first + 2]
+
+    entries: dict[str, list[dict[str, str]]] = {}
+    async with aiohttp.ClientSession() as session:
+        for key, zone in FRENCH_ZONES.items():
+            rows = [row for school_year in school_years for row in await fetch_france(session, zone, school_year)]
+            entries[f"FR|{key}"] = unique_sorted(rows)
+
+        for country, (tz_name, zones) in OPENHOLIDAYS_ZONES.items():
+            tz = ZoneInfo(tz_name)
+            for zone in zones:
+                rows = [row for year in years for row in await fetch_openholidays(session, country, zone, year, tz)]
+                entries[f"{country}|{zone}"] = unique_sorted(rows)
+
+        for country, (tz_name, province, zones) in CANADA_ZONES.items():
+            tz = ZoneInfo(tz_name)
+            rows = [row for year in years for row in await fetch_canada(session, province, year, tz)]
+            for zone in zones:
+                entries[f"{country}|{zone}"] = unique_sorted(rows)
+
+    for key, rows in entries.items():
+        print(f"{key}: {len(rows)} periods")
+
+    today = date.today()
+    payload = {
+        "version": DATASET_VERSION,
+        "revision": today.strftime("%Y.%m.%d"),
+        "generated": today.isoformat(),
+        "school_years": school_years,
+        "years": years,
+        "entries": entries,
+    }
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+    with gzip.GzipFile(OUTPUT, "wb", mtime=0) as handle:
+        handle.write(data)
+    print(f"Wrote {OUTPUT} ({OUTPUT.stat().st_size} bytes, revision {payload['revision']})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
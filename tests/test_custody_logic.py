@@ -1,15 +1,157 @@
+import asyncio
+import itertools
 import unittest
-from datetime import date, datetime, timezone
-from unittest.mock import MagicMock
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.custody_schedule.schedule import CustodyScheduleManager
+from aiohttp import ClientConnectionError, ClientResponseError
+from homeassistant.util import dt as dt_util
+
+from custom_components.custody_schedule import (
+    _async_iter_calendar_events,
+    _async_plan_calendar_sync,
+    _async_prepare_calendar_sync,
+    _async_run_calendar_sync_cycle,
+    _calendar_sync_fingerprint,
+    _calendar_sync_plan_payload,
+    _sync_calendar_events,
+)
+from custom_components.custody_schedule.calendar import CustodyCalendarEntity
+from custom_components.custody_schedule.calendar_sync import (
+    CalendarEntityResolver,
+    CalendarSyncLedger,
+    CalendarWriteScheduler,
+    DesiredEvent,
+    LedgerEntry,
+    SyncMetrics,
+    WriteBudget,
+    WriteOperation,
+    async_release_calendar_entity_resolver,
+    calendar_sync_hub,
+    calendar_sync_metrics,
+    content_digest,
+    is_transient_error,
+    plan_delta,
+    split_pattern_series,
+)
+from custom_components.custody_schedule.const import DOMAIN, HOLIDAY_CACHE_NEGATIVE_TTL
+from custom_components.custody_schedule.schedule import (
+    CustodyScheduleManager,
+    CustodyWindow,
+    WindowStore,
+    get_holiday_calendar,
+    get_public_holidays,
+    subtract_periods,
+)
+from custom_components.custody_schedule.school_holidays import (
+    FranceEducationProvider,
+    SchoolHoliday,
+    SchoolHolidayClient,
+    load_bundled_dataset,
+)
 
 
 class MockHolidays:
+    def __init__(self):
+        self.calls = 0
+        self.data_version = 0
+
     async def async_list(self, country, zone):
+        self.calls += 1
         return []
 
 
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store (saves immediately)."""
+
+    def __init__(self, data=None):
+        self.data = data
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay=0):
+        self.data = data_func()
+
+
+class FakeResponse:
+    def __init__(self, status=200, payload=None, headers=None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ClientResponseError(MagicMock(), (), status=self.status)
+
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """aiohttp session answering GET requests with handler(url, headers) and recording them."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append((url, headers or {}))
+        return self.handler(url, headers or {})
+
+
+def holiday_client(store=None, session=None):
+    """Return a SchoolHolidayClient with an in-memory Store and no bundled dataset."""
+    hass = MagicMock()
+    hass.async_create_task = lambda coro: asyncio.get_running_loop().create_task(coro)
+    with patch(
+        "custom_components.custody_schedule.school_holidays.aiohttp_client.async_get_clientsession",
+        return_value=session,
+    ), patch("custom_components.custody_schedule.school_holidays.Store", return_value=store or FakeStore()):
+        client = SchoolHolidayClient(hass)
+    client._bundled = {}
+    return client
+
+
+def french_records(*periods):
+    """Return a data.education.gouv.fr payload for (description, start, end) periods."""
+    return {
+        "records": [
+            {"fields": {"description": name, "start_date": start, "end_date": end}} for name, start, end in periods
+        ]
+    }
+
+
+class FakeProvider:
+    """Holiday provider answering `answer`, optionally held until `release` is set."""
+
+    def __init__(self, answer, release=None):
+        self.answer = answer
+        self.release = release
+        self.calls = 0
+
+    def cache_period(self, year=None):
+        return str(year)
+
+    async def get_holidays(self, country, zone, year=None, revalidation=None):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return list(self.answer)
+
+
+def school_holiday(name, start, days, zone="A"):
+    """Return a SchoolHoliday of `days` days starting on the `start` date."""
+    begin = datetime.combine(start, datetime.min.time(), timezone.utc)
+    return SchoolHoliday(name=name, zone=zone, start=begin, end=begin + timedelta(days=days))
+
+
 class TestCustodyLogic(unittest.TestCase):
     def setUp(self):
         self.hass = MagicMock()
@@ -114,6 +256,807 @@ class TestCustodyLogic(unittest.TestCase):
         # duration = days-1 = 1 day -> ends 2024-01-02.
         self.assertEqual(windows[0].end.date(), date(2024, 1, 2))
 
+    def test_window_index_lookups(self):
+        base = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        windows = [
+            CustodyWindow(base, base + timedelta(days=3), "long"),
+            CustodyWindow(base + timedelta(days=1), base + timedelta(days=1, hours=2), "short"),
+            CustodyWindow(base + timedelta(days=7), base + timedelta(days=9), "next"),
+        ]
+        index = WindowStore(windows)
+
+        # Overlapping windows: the earliest-starting covering window wins
+        self.assertEqual(index.window_at(base + timedelta(days=1, hours=1)), windows[0])
+        self.assertIsNone(index.window_at(base + timedelta(days=5)))
+        self.assertEqual(index.first_starting_after(base), windows[1])
+        self.assertEqual(index.first_starting_after(base + timedelta(days=2)), windows[2])
+        self.assertIsNone(index.first_starting_after(base + timedelta(days=8)))
+        # The short window ends before the long one: first ending after is still the long one
+        self.assertEqual(index.first_ending_after(base + timedelta(days=1, hours=3)), windows[0])
+        self.assertEqual(index.first_ending_after(base + timedelta(days=4)), windows[2])
+
+    def test_window_store_round_trip_and_lookups(self):
+        base = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        windows = [
+            CustodyWindow(base, base + timedelta(days=2), "Garde", "pattern"),
+            CustodyWindow(base + timedelta(days=1), base + timedelta(days=5, microseconds=7), "Noël", "vacation"),
+            CustodyWindow(base + timedelta(days=7), base + timedelta(days=9), "Garde", "pattern"),
+        ]
+        store = WindowStore(windows)
+
+        self.assertEqual(list(store), windows)
+        self.assertEqual(store[-1], windows[-1])
+        self.assertEqual(store[1:], windows[1:])
+        self.assertEqual(store[1].end.tzinfo, timezone.utc)
+        self.assertEqual(store.window_at(base + timedelta(days=3)), windows[1])
+        moment = base + timedelta(days=1, hours=1)
+        self.assertEqual(store.window_at(moment, ending_after=base + timedelta(days=3)), windows[1])
+        self.assertIsNone(store.window_at(base + timedelta(days=6)))
+        self.assertEqual(store.first_starting_after(base), windows[1])
+        self.assertEqual(store.first_starting_after(base, ending_after=base + timedelta(days=6)), windows[2])
+        self.assertEqual(store.first_ending_after(base + timedelta(days=2)), windows[1])
+        self.assertEqual(store.next_boundary_after(base + timedelta(days=2)), base + timedelta(days=5, microseconds=7))
+
+        positions = list(store.positions_overlapping(base + timedelta(days=4), base + timedelta(days=8)))
+        self.assertEqual(positions, [1, 2])
+        self.assertEqual(store.position_ending_after(base + timedelta(days=6)), 2)
+
+        # Fixed offsets on both sides of a DST change survive the round trip
+        winter, summer = timezone(timedelta(hours=1)), timezone(timedelta(hours=2))
+        crossing = CustodyWindow(datetime(2025, 3, 28, 18, tzinfo=winter), datetime(2025, 3, 31, 8, tzinfo=summer), "G")
+        self.assertEqual(WindowStore([crossing])[0].end.utcoffset(), timedelta(hours=2))
+
+    def test_window_store_next_boundary_matches_scan(self):
+        base = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        windows = sorted(
+            (
+                CustodyWindow(base + timedelta(hours=start), base + timedelta(hours=start + length), "G")
+                for start, length in ((i * 7 % 50, i * 13 % 40 + 1) for i in range(60))
+            ),
+            key=lambda window: window.start,
+        )
+        store = WindowStore(windows)
+        offset = timedelta(minutes=1)
+        for hour in range(-2, 100):
+            moment = base + timedelta(hours=hour, minutes=30)
+            candidates = [w.start for w in windows if w.start > moment]
+            candidates += [w.end - offset for w in windows if w.end - offset > moment]
+            expected = min(candidates) if candidates else None
+            self.assertEqual(store.next_boundary_after(moment, end_offset=offset), expected)
+
+    def test_subtract_periods_sweep(self):
+        base = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        kept = CustodyWindow(base, base + timedelta(days=1), "kept")
+        split = CustodyWindow(base + timedelta(days=2), base + timedelta(days=10), "split", "pattern")
+        covered = CustodyWindow(base + timedelta(days=11), base + timedelta(days=12), "covered")
+        periods = [
+            # Unsorted and touching periods are merged before the sweep
+            (base + timedelta(days=6), base + timedelta(days=8)),
+            (base + timedelta(days=4), base + timedelta(days=6)),
+            (base + timedelta(days=11), base + timedelta(days=13)),
+        ]
+
+        result = subtract_periods([kept, split, covered], periods)
+
+        self.assertIs(result[0], kept)
+        self.assertEqual(
+            [(w.start, w.end, w.label, w.source) for w in result[1:]],
+            [
+                (base + timedelta(days=2), base + timedelta(days=4), "split", "pattern"),
+                (base + timedelta(days=8), base + timedelta(days=10), "split", "pattern"),
+            ],
+        )
+
+    def test_holiday_calendar_is_memoized(self):
+        calendar = get_holiday_calendar("FR", False, 2025)
+
+        self.assertIs(calendar, get_holiday_calendar("FR", False, 2025))
+        self.assertIn(date(2025, 7, 14), calendar)
+        self.assertNotIn(date(2025, 12, 26), calendar)
+        self.assertIn(date(2025, 12, 26), get_holiday_calendar("FR", True, 2025))
+
+    def test_holiday_extension_across_new_year(self):
+        # Before: pattern windows were extended with the holidays of the computation year and the next one
+        now_year = 2025
+        span = set(get_public_holidays(now_year)) | set(get_public_holidays(now_year + 1))
+
+        def weekend_end(end_day, friday, holidays=None):
+            manager = CustodyScheduleManager(self.hass, {"end_day": end_day}, self.holidays)
+            start = datetime.combine(friday, datetime.min.time(), tzinfo=timezone.utc) + timedelta(hours=16)
+            return manager._calculate_end_date(start, holidays or manager._public_holidays()).date()
+
+        # (end_day, Friday of the weekend, end after the change, end before the change)
+        cases = [
+            # Inside the former span: Thursday 1 January 2026, both rules extend to Friday 2 January
+            ("thursday", date(2025, 12, 26), date(2026, 1, 2), date(2026, 1, 2)),
+            # Year - 1 (history) and beyond the span: Monday 1 January is now extended too
+            ("monday", date(2023, 12, 29), date(2024, 1, 2), date(2024, 1, 1)),
+            ("monday", date(2028, 12, 29), date(2029, 1, 2), date(2029, 1, 1)),
+        ]
+        for end_day, friday, after, before in cases:
+            self.assertEqual(weekend_end(end_day, friday), after, friday)
+            self.assertEqual(weekend_end(end_day, friday, span), before, friday)
+
+    def test_holidays_fetched_once_per_computation(self):
+        config = {"arrival_time": "08:00", "departure_time": "19:00", "zone": "A"}
+        manager = CustodyScheduleManager(self.hass, config, self.holidays)
+
+        asyncio.run(manager.async_calculate(datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)))
+
+        # Windows, current period and next vacation all read the same snapshot
+        self.assertEqual(self.holidays.calls, 1)
+
+    def test_windows_materialized_once_per_day(self):
+        config = {"arrival_time": "08:00", "departure_time": "19:00", "zone": "A"}
+        manager = CustodyScheduleManager(self.hass, config, self.holidays)
+        morning = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+
+        asyncio.run(manager.async_calculate(morning))
+        asyncio.run(manager.async_calculate(morning + timedelta(hours=6)))
+        self.assertEqual(self.holidays.calls, 1)
+
+        asyncio.run(manager.async_calculate(morning + timedelta(days=1)))
+        self.assertEqual(self.holidays.calls, 2)
+
+        # Any change of config, exceptions or holiday data rebuilds the windows
+        manager.set_manual_windows([{"start": "2025-10-06T10:00:00+00:00", "end": "2025-10-06T12:00:00+00:00"}])
+        asyncio.run(manager.async_calculate(morning + timedelta(days=1, hours=1)))
+        self.assertEqual(self.holidays.calls, 3)
+
+        manager.update_config({"arrival_time": "09:00"})
+        asyncio.run(manager.async_calculate(morning + timedelta(days=1, hours=2)))
+        self.assertEqual(self.holidays.calls, 4)
+
+        self.holidays.data_version += 1
+        asyncio.run(manager.async_calculate(morning + timedelta(days=1, hours=3)))
+        self.assertEqual(self.holidays.calls, 5)
+
+        asyncio.run(manager.async_calculate(morning + timedelta(days=1, hours=4)))
+        self.assertEqual(self.holidays.calls, 5)
+
+    def test_calendar_events_match_on_demand_generation(self):
+        config = {
+            "custody_type": "alternate_week",
+            "arrival_time": "08:00",
+            "departure_time": "19:00",
+            "auto_parent_days": True,
+            "parental_role": "mother",
+            "exceptions_recurring": [{"weekday": 2, "start_time": "12:00", "end_time": "14:00"}],
+        }
+        manager = CustodyScheduleManager(self.hass, config, self.holidays)
+        # Manual windows before and across the instant the windows are built
+        manager.set_manual_windows(
+            [
+                {"start": "2025-09-20T10:00:00+00:00", "end": "2025-09-20T12:00:00+00:00"},
+                {"start": "2025-10-02T10:00:00+00:00", "end": "2025-10-04T12:00:00+00:00"},
+            ]
+        )
+        now = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        coordinator = MagicMock(data=asyncio.run(manager.async_calculate(now)), manager=manager)
+        entry = MagicMock(entry_id="e1", data={"child_name": "Kid"})
+        entity = CustodyCalendarEntity(coordinator, entry, "Kid", "kid")
+
+        views = [
+            # Month view starting in the past, week view around now, inside the coverage, beyond it
+            (datetime(2025, 9, 1, tzinfo=timezone.utc), datetime(2025, 10, 6, tzinfo=timezone.utc)),
+            (datetime(2025, 9, 29, tzinfo=timezone.utc), datetime(2025, 10, 6, tzinfo=timezone.utc)),
+            (datetime(2025, 11, 1, tzinfo=timezone.utc), datetime(2025, 12, 1, tzinfo=timezone.utc)),
+            (datetime(2026, 9, 1, tzinfo=timezone.utc), datetime(2026, 11, 1, tzinfo=timezone.utc)),
+        ]
+        for start, end in views:
+            events = asyncio.run(entity.async_get_events(self.hass, start, end))
+            expected = [entity._window_to_event(window) for window in manager.iter_windows(start, end)]
+            self.assertTrue(expected, start)
+            self.assertEqual(events, expected, start)
+            # Views starting in the past still read the covered part from the event index
+            self.assertIsNotNone(entity._event_index, start)
+
+    def test_next_transition(self):
+        config = {"custody_type": "alternate_weekend", "arrival_time": "08:00", "departure_time": "19:00"}
+        manager = CustodyScheduleManager(self.hass, config, self.holidays)
+        now = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        state = asyncio.run(manager.async_calculate(now))
+
+        transition = manager.next_transition(now)
+        self.assertGreater(transition, now)
+        self.assertLessEqual(transition, now + timedelta(days=1))
+        # Presence cannot change before the transition
+        before = asyncio.run(manager.async_calculate(transition - timedelta(seconds=1)))
+        self.assertEqual(before.is_present, state.is_present)
+
+        current = dt_util.now()
+        manager.override_presence("on", timedelta(minutes=30))
+        self.assertLessEqual(manager.next_transition(current), current + timedelta(minutes=31))
+
+    def test_iter_windows_matches_materialized_and_reaches_far_ranges(self):
+        config = {"custody_type": "two_two_three", "arrival_time": "08:00", "departure_time": "19:00"}
+        manager = CustodyScheduleManager(self.hass, config, self.holidays)
+        now = datetime(2025, 10, 3, 8, 0, tzinfo=timezone.utc)
+        state = asyncio.run(manager.async_calculate(now))
+
+        start, end = now + timedelta(days=30), now + timedelta(days=90)
+        expected = [w for w in state.windows if w.end >= start and w.start <= end]
+        self.assertEqual(list(manager.iter_windows(start, end)), expected)
+
+        # Far outside the materialized range (400 days ahead)
+        far_start = now + timedelta(days=3000)
+        far = list(manager.iter_windows(far_start, far_start + timedelta(days=14)))
+        self.assertTrue(far)
+        self.assertTrue(all(w.end >= far_start for w in far))
+
+    def test_bundled_holiday_dataset(self):
+        dataset = load_bundled_dataset()
+
+        for zone in ("A", "B", "C"):
+            holidays = dataset[f"FR|{zone}"]
+            self.assertTrue(holidays)
+            self.assertEqual(holidays, sorted(holidays, key=lambda h: (h.start, h.end)))
+            self.assertTrue(all(h.zone == zone and h.start < h.end for h in holidays))
+
+    def test_holiday_cache_persistence_and_stale_refresh(self):
+        winter = school_holiday("Hiver", date(2025, 2, 8), 16)
+        spring = school_holiday("Printemps", date(2025, 4, 5), 16)
+        store = FakeStore()
+        key = "FR|A|2025"
+
+        async def scenario():
+            client = holiday_client(store)
+            client._france_provider = provider = FakeProvider([winter])
+            self.assertEqual(await client.async_list("FR", "A", 2025), [winter])
+            self.assertEqual(provider.calls, 1)
+            self.assertEqual(client.data_version, 1)
+
+            # Store round trip: a new client answers from the persisted entry, without fetching
+            restored = holiday_client(store)
+            restored._france_provider = provider = FakeProvider([spring], asyncio.Event())
+            self.assertEqual(await restored.async_list("FR", "A", 2025), [winter])
+            self.assertEqual(provider.calls, 0)
+            self.assertEqual(restored._cache[key].validators, {})
+            version = restored.data_version
+
+            # Expired entry: served stale at once while the refresh waits on the provider
+            restored._cache[key].expires_at = dt_util.utcnow() - timedelta(seconds=1)
+            self.assertEqual(await restored.async_list("FR", "A", 2025), [winter])
+            refresh = restored._inflight[key]
+            await asyncio.sleep(0)
+            self.assertEqual(provider.calls, 1)
+            self.assertFalse(refresh.done())
+            self.assertEqual(await restored.async_list("FR", "A", 2025), [winter])
+            provider.release.set()
+            self.assertEqual(await refresh, [spring])
+            self.assertEqual(provider.calls, 1)
+            self.assertEqual(restored.data_version, version + 1)
+            self.assertEqual(store.data["entries"][key]["holidays"], [spring.as_dict()])
+
+            # Same answer again: the entry is extended but data_version does not move
+            restored._cache[key].expires_at = dt_util.utcnow() - timedelta(seconds=1)
+            await restored.async_list("FR", "A", 2025)
+            await restored._inflight[key]
+            self.assertEqual(restored.data_version, version + 1)
+            self.assertGreater(restored._cache[key].expires_at, dt_util.utcnow() + timedelta(days=6))
+
+            # Empty answer (provider error): the previous holidays are kept, retried after the negative TTL
+            provider.answer = []
+            restored._cache[key].expires_at = dt_util.utcnow() - timedelta(seconds=1)
+            await restored.async_list("FR", "A", 2025)
+            self.assertEqual(await restored._inflight[key], [spring])
+            entry = restored._cache[key]
+            self.assertEqual(entry.holidays, [spring])
+            self.assertLessEqual(entry.expires_at, dt_util.utcnow() + HOLIDAY_CACHE_NEGATIVE_TTL)
+            self.assertGreater(entry.expires_at, dt_util.utcnow() + HOLIDAY_CACHE_NEGATIVE_TTL - timedelta(minutes=1))
+            self.assertEqual(restored.data_version, version + 1)
+
+        asyncio.run(scenario())
+
+    def test_holiday_fetch_is_single_flight(self):
+        winter = school_holiday("Hiver", date(2025, 2, 8), 16)
+
+        async def scenario():
+            client = holiday_client()
+            client._france_provider = provider = FakeProvider([winter], asyncio.Event())
+            callers = [asyncio.create_task(client.async_list("FR", "A", 2025)) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            self.assertEqual(provider.calls, 1)
+            shared = client._inflight["FR|A|2025"]
+
+            # A cancelled caller must not cancel the fetch the others are waiting on
+            callers[0].cancel()
+            await asyncio.sleep(0)
+            self.assertTrue(callers[0].cancelled())
+            self.assertFalse(shared.cancelled())
+
+            provider.release.set()
+            results = await asyncio.gather(*callers[1:])
+            self.assertEqual(results, [[winter]] * 4)
+            self.assertEqual(await shared, [winter])
+            self.assertEqual(provider.calls, 1)
+            self.assertNotIn("FR|A|2025", client._inflight)
+
+            # Once cached, later calls do not fetch at all
+            self.assertEqual(await client.async_list("FR", "A", 2025), [winter])
+            self.assertEqual(provider.calls, 1)
+
+        asyncio.run(scenario())
+
+    def test_france_provider_fetches_school_years_concurrently(self):
+        spring = ("Printemps", "2025-04-12T00:00:00+00:00", "2025-04-28T00:00:00+00:00")
+        autumn = ("Toussaint", "2025-10-18T00:00:00+00:00", "2025-11-03T00:00:00+00:00")
+        requests = {"active": 0, "peak": 0}
+
+        class TrackedResponse(FakeResponse):
+            async def __aenter__(self):
+                requests["active"] += 1
+                requests["peak"] = max(requests["peak"], requests["active"])
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc_info):
+                requests["active"] -= 1
+                return False
+
+        # Served answer of each school year: a period, or an HTTP error status
+        served = {"2024-2025": 503, "2025-2026": autumn}
+
+        def handler(url, headers):
+            answer = served["2024-2025" if "2024-2025" in url else "2025-2026"]
+            if isinstance(answer, int):
+                return TrackedResponse(answer)
+            return TrackedResponse(200, french_records(answer))
+
+        async def fetch():
+            requests["peak"] = 0
+            return await FranceEducationProvider(MagicMock(), FakeSession(handler)).get_holidays("FR", "A", 2025)
+
+        # One failing school year does not drop the others
+        holidays = asyncio.run(fetch())
+        self.assertEqual([h.name for h in holidays], ["Toussaint"])
+        self.assertEqual(requests["peak"], 2)
+
+        with patch("custom_components.custody_schedule.school_holidays.HOLIDAY_API_MAX_PARALLEL", 1):
+            self.assertEqual(asyncio.run(fetch()), holidays)
+        self.assertEqual(requests["peak"], 1)
+
+        served["2024-2025"] = spring
+        self.assertEqual([h.name for h in asyncio.run(fetch())], ["Printemps", "Toussaint"])
+
+    def test_holiday_revalidation_with_etags(self):
+        spring = ("Printemps", "2025-04-12T00:00:00+00:00", "2025-04-28T00:00:00+00:00")
+        autumn = ("Toussaint", "2025-10-18T00:00:00+00:00", "2025-11-03T00:00:00+00:00")
+        later_autumn = ("Toussaint", "2025-10-18T00:00:00+00:00", "2025-11-04T00:00:00+00:00")
+        # Served version of each school year: (ETag, period), or an HTTP error status
+        served = {"2024-2025": ('"a1"', spring), "2025-2026": ('"b1"', autumn)}
+
+        def handler(url, headers):
+            version = served["2024-2025" if "2024-2025" in url else "2025-2026"]
+            if isinstance(version, int):
+                return FakeResponse(version)
+            etag, period = version
+            if headers.get("If-None-Match") == etag:
+                return FakeResponse(304)
+            return FakeResponse(200, french_records(period), {"ETag": etag})
+
+        session = FakeSession(handler)
+        client = holiday_client(session=session)
+        key = "FR|A|2025"
+
+        async def refresh():
+            # Expire the entry: the stale answer is served while the refresh runs
+            client._cache[key].expires_at = dt_util.utcnow() - timedelta(seconds=1)
+            session.requests.clear()
+            await client.async_list("FR", "A", 2025)
+            await client._inflight[key]
+            return client._cache[key]
+
+        async def scenario():
+            first = await client.async_list("FR", "A", 2025)
+            self.assertEqual([h.name for h in first], ["Printemps", "Toussaint"])
+            self.assertTrue(all("If-None-Match" not in headers for _, headers in session.requests))
+
+            # 304 everywhere: the parsed holidays are kept for the full TTL
+            entry = await refresh()
+            self.assertEqual(entry.holidays, first)
+            self.assertEqual({headers.get("If-None-Match") for _, headers in session.requests}, {'"a1"', '"b1"'})
+            self.assertGreater(entry.expires_at, dt_util.utcnow() + timedelta(days=6))
+
+            # 304 for one year, server error for the other: retried after the negative TTL
+            served["2025-2026"] = 503
+            entry = await refresh()
+            self.assertEqual(entry.holidays, first)
+            self.assertLess(entry.expires_at, dt_util.utcnow() + timedelta(hours=1))
+
+            # 304 for one year, new data for the other: only the 304 year is requested again
+            served["2025-2026"] = ('"b2"', later_autumn)
+            entry = await refresh()
+            self.assertEqual(len(session.requests), 3)
+            url, headers = session.requests[-1]
+            self.assertIn("2024-2025", url)
+            self.assertNotIn("If-None-Match", headers)
+            self.assertEqual([(h.name, h.end.day) for h in entry.holidays], [("Printemps", 28), ("Toussaint", 4)])
+            self.assertGreater(entry.expires_at, dt_util.utcnow() + timedelta(days=6))
+            self.assertEqual({v.get("etag") for v in entry.validators.values()}, {'"a1"', '"b2"'})
+
+        asyncio.run(scenario())
+
+    def test_calendar_sync_plan_delta(self):
+        base = datetime(2025, 3, 3, 8, 0, tzinfo=timezone.utc)
+        digest = content_digest("marker Planning de garde (pattern)", "")
+
+        def desired(key, day, source="pattern"):
+            window = CustodyWindow(base + timedelta(days=day), base + timedelta(days=day + 2), key, source)
+            description = f"marker Planning de garde ({source})"
+            return DesiredEvent(key, window, key, description, "", content_digest(description, ""))
+
+        entries = {
+            "kept": LedgerEntry(base, base + timedelta(days=2), digest, "u1"),
+            "changed": LedgerEntry(base + timedelta(days=7), base + timedelta(days=9), digest),
+            "removed": LedgerEntry(base + timedelta(days=14), base + timedelta(days=16), digest, "u3"),
+            "past": LedgerEntry(base - timedelta(days=30), base - timedelta(days=28), digest, "u4"),
+            "beyond": LedgerEntry(base + timedelta(days=400), base + timedelta(days=402), digest, "u5"),
+        }
+        wanted = {
+            "kept": desired("kept", 0),
+            "changed": desired("changed", 7, "vacation"),
+            "new": desired("new", 21),
+        }
+
+        delta = plan_delta(entries, wanted, base - timedelta(days=1), base + timedelta(days=120))
+        self.assertEqual([item.key for item in delta.create], ["new"])
+        self.assertEqual([item.key for item in delta.update], ["changed"])
+        self.assertEqual(delta.delete, ["removed"])
+        self.assertEqual(delta.expired, ["past"])
+        self.assertEqual(delta.unresolved(entries), ["changed"])
+        self.assertEqual(LedgerEntry.from_dict(entries["kept"].as_dict()), entries["kept"])
+        self.assertIsNone(LedgerEntry.from_dict({"start": "bad"}))
+
+    def test_split_pattern_series(self):
+        friday = dt_util.as_local(datetime(2025, 1, 3, 18, 0, tzinfo=timezone.utc))
+
+        def weekend(index, extra_days=0):
+            start = friday + timedelta(days=14 * index)
+            return CustodyWindow(start, start + timedelta(days=2 + extra_days, hours=1), "Garde", "pattern")
+
+        # Weekend 4 is extended by a public holiday and weekend 7 is removed by a vacation
+        windows = [weekend(i, 1 if i == 4 else 0) for i in range(12) if i != 7]
+        series, singles = split_pattern_series(windows)
+
+        # Runs shorter than three occurrences (weekends 5-6) stay one-off events
+        runs = [(run.first, run.last, run.count) for run in series]
+        self.assertEqual(runs, [(windows[0], windows[3], 4), (windows[7], windows[10], 4)])
+        self.assertEqual({run.rrule for run in series}, {"FREQ=WEEKLY;INTERVAL=2;COUNT=4"})
+        self.assertEqual(singles, windows[4:7])
+        self.assertEqual(sum(run.count for run in series) + len(singles), len(windows))
+
+    def test_paged_calendar_reader(self):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        remote = []
+        for i, length in zip(range(52), itertools.cycle((9, 2))):
+            start = base + timedelta(days=7 * i)
+            remote.append({"uid": f"u{i}", "summary": f"E{i}", "start": start, "end": start + timedelta(days=length)})
+        reads = []
+
+        async def fetch(_hass, _target, start, end):
+            reads.append((start, end))
+            return [event for event in remote if event["end"] >= start and event["start"] <= end]
+
+        async def collect():
+            return [
+                event["uid"]
+                async for event in _async_iter_calendar_events(
+                    None, "calendar.x", base, base + timedelta(days=365), timedelta(days=30)
+                )
+            ]
+
+        with patch("custom_components.custody_schedule._async_fetch_calendar_events", fetch):
+            uids = asyncio.run(collect())
+
+        # Events spanning a 30-day boundary are read twice but yielded once
+        self.assertEqual(uids, [f"u{i}" for i in range(52)])
+        self.assertEqual(len(reads), 13)
+        self.assertTrue(all(end - start <= timedelta(days=30) for start, end in reads))
+
+    def test_calendar_entity_resolver_cache(self):
+        hass = MagicMock()
+        entities = {"calendar.family": object()}
+        component = MagicMock()
+        component.get_entity = MagicMock(side_effect=entities.get)
+        hass.data = {"calendar": component}
+        resolver = CalendarEntityResolver(hass)
+        registry_updated = hass.bus.async_listen.call_args[0][1]
+
+        first = resolver.async_resolve("calendar.family")
+        self.assertIs(resolver.async_resolve("calendar.family"), first)
+        self.assertEqual(component.get_entity.call_count, 1)
+
+        # A registry update for that entity (e.g. its integration re-created it) drops the cached object
+        entities["calendar.family"] = object()
+        registry_updated(MagicMock(data={"action": "update", "entity_id": "calendar.family"}))
+        self.assertIs(resolver.async_resolve("calendar.family"), entities["calendar.family"])
+        self.assertEqual(component.get_entity.call_count, 2)
+
+        # Releasing the shared resolver (last entry unloaded) removes the registry listener
+        hass.data[DOMAIN] = {"entity_resolver": resolver}
+        async_release_calendar_entity_resolver(hass)
+        hass.bus.async_listen.return_value.assert_called_once_with()
+        self.assertNotIn("entity_resolver", hass.data[DOMAIN])
+
+    def test_calendar_write_scheduler(self):
+        running = {"now": 0, "peak": 0}
+        attempts = {}
+
+        def operation(key, outcome="ok"):
+            async def call():
+                attempts[key] = attempts.get(key, 0) + 1
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+                await asyncio.sleep(0.001)
+                running["now"] -= 1
+                if outcome == "throttled" and attempts[key] < 3:
+                    raise RuntimeError("Too many requests") from ClientResponseError(MagicMock(), (), status=429)
+                if outcome == "broken":
+                    raise ValueError("Invalid event payload")
+                return outcome != "rejected"
+
+            return WriteOperation(key, "delete", call)
+
+        operations = [operation(i) for i in range(60)]
+        operations += [operation("throttled", "throttled"), operation("broken", "broken")]
+        operations.append(operation("rejected", "rejected"))
+        scheduler = CalendarWriteScheduler(WriteBudget(1e9, 10**9), concurrency=2, backoff=0.001)
+        report = asyncio.run(scheduler.async_run(operations))
+
+        self.assertEqual(set(report.failed), {"broken", "rejected"})
+        self.assertEqual(len(report.succeeded), 61)
+        self.assertIn("throttled", report.succeeded)
+        self.assertEqual((attempts["throttled"], attempts["broken"], report.retries), (3, 1, 2))
+        # Successes raise the concurrency limit above its initial value
+        self.assertGreater(running["peak"], 2)
+
+    def test_is_transient_error(self):
+        def response_error(status):
+            return ClientResponseError(MagicMock(), (), status=status)
+
+        self.assertTrue(is_transient_error(asyncio.TimeoutError()))
+        self.assertTrue(is_transient_error(ClientConnectionError()))
+        self.assertTrue(is_transient_error(response_error(503)))
+        self.assertTrue(is_transient_error(response_error(429)))
+        self.assertFalse(is_transient_error(response_error(404)))
+        # Messages are not parsed: an event titled "500" is not a server error
+        self.assertFalse(is_transient_error(ValueError("Invalid event 500")))
+        # Service errors wrap the backend error
+        try:
+            raise RuntimeError("Calendar update failed") from response_error(502)
+        except RuntimeError as err:
+            self.assertTrue(is_transient_error(err))
+
+    def test_calendar_sync_fingerprint(self):
+        now = dt_util.now()
+        config = {"child_name": "Kid", "calendar_sync_days": 30}
+        windows = [
+            CustodyWindow(now + timedelta(days=7 * i), now + timedelta(days=7 * i + 2), "Garde", "pattern")
+            for i in range(4)
+        ]
+
+        def fingerprint(extra=(), target="calendar.shared", **overrides):
+            state = MagicMock(windows=windows + list(extra))
+            return _calendar_sync_fingerprint(state, {**config, **overrides}, target, "e1", now)
+
+        base = fingerprint()
+        self.assertEqual(base, fingerprint())
+        # Vacation filters and windows outside the sync range are never synced
+        ignored = [
+            CustodyWindow(now, now + timedelta(days=3), "Filtre", "vacation_filter"),
+            CustodyWindow(now + timedelta(days=60), now + timedelta(days=62), "Garde", "pattern"),
+            CustodyWindow(now - timedelta(days=10), now - timedelta(days=8), "Garde", "pattern"),
+        ]
+        self.assertEqual(base, fingerprint(ignored))
+        self.assertNotEqual(base, fingerprint([CustodyWindow(now, now + timedelta(hours=5), "Garde", "manual")]))
+        self.assertNotEqual(base, fingerprint(location="École"))
+        self.assertNotEqual(base, fingerprint(target="calendar.other"))
+        self.assertNotEqual(fingerprint(ignored), fingerprint(ignored, calendar_sync_days=90))
+
+    def test_calendar_sync_reconciliation_is_linear(self):
+        now = dt_util.now()
+        reads = {"count": 0}
+
+        class RemoteEvent(dict):
+            """Remote event counting field reads (a per-window scan reads every event again)."""
+
+            def get(self, key, default=None):
+                reads["count"] += 1
+                return super().get(key, default)
+
+            def __getitem__(self, key):
+                reads["count"] += 1
+                return super().__getitem__(key)
+
+        def run(count):
+            windows = [
+                CustodyWindow(now + timedelta(hours=6 * i), now + timedelta(hours=6 * i + 3), f"W{i}", "vacation")
+                for i in range(count)
+            ]
+            # Every window already exists remotely with a stale description, so each one is updated
+            remote = [
+                RemoteEvent(
+                    uid=f"u{i}",
+                    summary=f"Kid - {w.label}",
+                    start=w.start.isoformat(),
+                    end=w.end.isoformat(),
+                    description="custody_schedule:e1 Planning de garde (pattern)",
+                )
+                for i, w in enumerate(windows)
+            ]
+            hass = MagicMock()
+            hass.services.has_service = MagicMock(return_value=True)
+            hass.services.async_call = AsyncMock(return_value={"events": remote})
+            ledger = CalendarSyncLedger(hass, "e1")
+            ledger._store = MagicMock(async_load=AsyncMock(return_value=None))
+            state = MagicMock(windows=windows)
+            config = {"child_name": "Kid", "calendar_sync_days": 365}
+            reads["count"] = 0
+            with patch(
+                "custom_components.custody_schedule._get_calendar_events_direct", AsyncMock(return_value=None)
+            ), patch("custom_components.custody_schedule.write_budget", return_value=WriteBudget(1e9, 10**9)):
+                asyncio.run(_sync_calendar_events(hass, "calendar.shared", state, config, "e1", ledger))
+            self.assertEqual(hass.services.async_call.await_count, count + 1)
+            self.assertEqual(hass.services.has_service.call_count, 4)
+            return reads["count"]
+
+        small, large = run(500), run(4000)
+        self.assertGreater(small, 0)
+        # 8x the events: each remote event is read a fixed number of times (no per-window scan)
+        self.assertEqual(large, 8 * small)
+
+    def test_calendar_sync_hub_shares_one_read(self):
+        now = dt_util.now()
+        windows = [
+            CustodyWindow(now + timedelta(days=i), now + timedelta(days=i, hours=3), f"W{i}", "vacation")
+            for i in range(3)
+        ]
+        # A stale event of the second child, sitting in the calendar both children sync to
+        remote = [
+            {
+                "uid": "stale",
+                "summary": "Bob - Old",
+                "start": (now + timedelta(days=5)).isoformat(),
+                "end": (now + timedelta(days=5, hours=2)).isoformat(),
+                "description": "custody_schedule:e2 Planning de garde (pattern)",
+            }
+        ]
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.has_service = MagicMock(return_value=True)
+        hass.services.async_call = AsyncMock(return_value={"events": remote})
+
+        async def run():
+            hass.loop = asyncio.get_running_loop()
+            hass.async_create_task = asyncio.ensure_future
+            jobs = []
+            for entry_id, child in (("e1", "Ann"), ("e2", "Bob")):
+                ledger = CalendarSyncLedger(hass, entry_id)
+                ledger._store = MagicMock(async_load=AsyncMock(return_value=None))
+                config = {"child_name": child, "calendar_sync_days": 30}
+                jobs.append(
+                    await _async_prepare_calendar_sync(
+                        hass, "calendar.shared", MagicMock(windows=windows), config, entry_id, ledger
+                    )
+                )
+            hub = calendar_sync_hub(hass, "calendar.shared", _async_run_calendar_sync_cycle)
+            return await asyncio.gather(*(hub.async_sync(job) for job in jobs))
+
+        with patch(
+            "custom_components.custody_schedule._get_calendar_events_direct", AsyncMock(return_value=None)
+        ), patch("custom_components.custody_schedule.write_budget", return_value=WriteBudget(1e9, 10**9)), patch(
+            "custom_components.custody_schedule.calendar_sync.CALENDAR_SYNC_HUB_WINDOW", 0
+        ):
+            first, second = asyncio.run(run())
+
+        services = [call.args[1] for call in hass.services.async_call.await_args_list]
+        self.assertEqual(services.count("get_events"), 1)
+        self.assertEqual(services.count("create_event"), 6)
+        deletes = [call.args[2] for call in hass.services.async_call.await_args_list if call.args[1] == "delete_event"]
+        self.assertEqual([data["uid"] for data in deletes], ["stale"])
+        self.assertEqual((len(first.succeeded), len(second.succeeded)), (3, 4))
+        self.assertEqual({key[0] for key in second.succeeded}, {"e2"})
+
+    def test_calendar_sync_plan_is_dry_run(self):
+        now = dt_util.now()
+        windows = [
+            CustodyWindow(now + timedelta(days=i), now + timedelta(days=i, hours=3), f"W{i}", "vacation")
+            for i in range(3)
+        ]
+        remote = [
+            {
+                "uid": "kept",
+                "summary": "Ann - W0",
+                "start": windows[0].start.isoformat(),
+                "end": windows[0].end.isoformat(),
+                "description": "custody_schedule:e1 Planning de garde (old)",
+            },
+            {
+                "uid": "stale",
+                "summary": "Ann - Old",
+                "start": (now + timedelta(days=5)).isoformat(),
+                "end": (now + timedelta(days=5, hours=2)).isoformat(),
+                "description": "custody_schedule:e1 Planning de garde (pattern)",
+            },
+        ]
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.has_service = MagicMock(return_value=True)
+        hass.services.async_call = AsyncMock(return_value={"events": remote})
+        ledger = CalendarSyncLedger(hass, "e1")
+        ledger._store = MagicMock(async_load=AsyncMock(return_value=None))
+        config = {"child_name": "Ann", "calendar_sync_days": 30}
+
+        async def run():
+            job = await _async_prepare_calendar_sync(
+                hass, "calendar.shared", MagicMock(windows=windows), config, "e1", ledger
+            )
+            return await _async_plan_calendar_sync(hass, "calendar.shared", [job], True)
+
+        with patch("custom_components.custody_schedule._get_calendar_events_direct", AsyncMock(return_value=None)):
+            (plan,) = asyncio.run(run())
+        payload = _calendar_sync_plan_payload("calendar.shared", plan, 2)
+
+        self.assertEqual(payload["mode"], "full")
+        self.assertEqual(payload["counts"], {"create": 2, "update": 1, "delete": 1})
+        self.assertEqual([op["action"] for op in payload["operations"]], ["create", "create"])
+        self.assertTrue(payload["truncated"])
+        self.assertEqual(_calendar_sync_plan_payload("calendar.shared", plan, 10)["operations"][-1]["uid"], "stale")
+        # Planning only reads: no write was sent and the ledger was not touched
+        self.assertEqual([call.args[1] for call in hass.services.async_call.await_args_list], ["get_events"])
+        self.assertEqual(ledger.entries, {})
+        ledger._store.async_delay_save.assert_not_called()
+
+    def test_calendar_sync_metrics(self):
+        now = dt_util.now()
+        windows = [
+            CustodyWindow(now + timedelta(days=i), now + timedelta(days=i, hours=3), f"W{i}", "vacation")
+            for i in range(3)
+        ]
+        remote = [
+            {
+                "uid": "stale",
+                "summary": "Ann - Old",
+                "start": (now + timedelta(days=5)).isoformat(),
+                "end": (now + timedelta(days=5, hours=2)).isoformat(),
+                "description": "custody_schedule:e1 Planning de garde (pattern)",
+            }
+        ]
+        hass = MagicMock()
+        hass.data = {}
+        hass.services.has_service = MagicMock(return_value=True)
+        hass.services.async_call = AsyncMock(return_value={"events": remote})
+        ledger = CalendarSyncLedger(hass, "e1")
+        ledger._store = MagicMock(async_load=AsyncMock(return_value=None))
+        metrics = SyncMetrics()
+
+        async def run():
+            job = await _async_prepare_calendar_sync(
+                hass, "calendar.shared", MagicMock(windows=windows), {"child_name": "Ann"}, "e1", ledger, metrics
+            )
+            await _async_run_calendar_sync_cycle(hass, "calendar.shared", [job])
+            # Up to date: the second sync sends nothing and does not read the calendar
+            job = await _async_prepare_calendar_sync(
+                hass, "calendar.shared", MagicMock(windows=windows), {"child_name": "Ann"}, "e1", ledger, metrics
+            )
+            await _async_run_calendar_sync_cycle(hass, "calendar.shared", [job])
+
+        with patch(
+            "custom_components.custody_schedule._get_calendar_events_direct", AsyncMock(return_value=None)
+        ), patch("custom_components.custody_schedule.write_budget", return_value=WriteBudget(1e9, 10**9)):
+            asyncio.run(run())
+
+        entry_metrics = metrics.as_dict()
+        self.assertEqual((entry_metrics["syncs"], entry_metrics["reads"]), (2, 1))
+        self.assertEqual(entry_metrics["last_sync_mode"], "delta")
+        self.assertEqual(entry_metrics["operations"], {"create": 3, "update": 0, "delete": 1})
+        self.assertEqual((entry_metrics["events_scanned"], entry_metrics["failures"]), (1, 0))
+        self.assertIsNotNone(entry_metrics["last_read_latency"])
+        target_metrics = calendar_sync_metrics(hass, "calendar.shared").as_dict()
+        self.assertEqual(target_metrics["operations"], entry_metrics["operations"])
+        self.assertEqual(target_metrics["syncs"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()